@@ -0,0 +1,13 @@
+from blackjack.card import Card
+import random
+
+
+def test_card(benchmark):
+    c = benchmark(Card, Card.ACE, Card.SPADES)
+    assert c is Card(Card.ACE, Card.SPADES)
+
+
+def test_card_random(benchmark):
+    rng = random.Random(0)
+    c = benchmark(Card, rng=rng)
+    assert isinstance(c, Card)
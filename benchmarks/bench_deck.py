@@ -0,0 +1,33 @@
+from blackjack.deck import Deck
+import random
+
+
+def test_deck(benchmark):
+    rng = random.Random(0)
+    d = benchmark(Deck, num_full_decks=8, rng=rng)
+    assert len(d) == 8 * 52
+
+
+def test_deck_ordered(benchmark):
+    d = benchmark(Deck, num_full_decks=8, ordered=True)
+    assert len(d) == 8 * 52
+
+
+def drain(d):
+    while d.draw() is not None:
+        pass
+    return d
+
+
+def test_draw(benchmark):
+    rng = random.Random(0)
+    d = benchmark.pedantic(
+        drain, setup=lambda: ((Deck(num_full_decks=8, rng=rng),), {}),
+        rounds=500)
+    assert len(d) == 0
+
+
+def test_reshuffle(benchmark):
+    d = Deck(num_full_decks=8, rng=0)
+    benchmark(d.reshuffle)
+    assert len(d) == 8 * 52
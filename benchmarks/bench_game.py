@@ -0,0 +1,12 @@
+from blackjack.game import Game
+from blackjack.game_config import GameConfig
+from blackjack.players.threshold_player import ThresholdPlayer
+import pytest
+
+
+@pytest.mark.parametrize('num_players', [1, 3, 7])
+def test_play_round(benchmark, num_players):
+    players = [ThresholdPlayer() for _ in range(num_players)]
+    g = Game(GameConfig(seed=0), players)
+    benchmark(g.play_round)
+    assert g.round_num > 0
@@ -0,0 +1,20 @@
+from blackjack.card import Card
+from blackjack.hand import Hand
+
+# A soft hand that turns hard, so that add goes through both kinds of state
+cards = (Card(Card.ACE, Card.SPADES), Card(Card.NUM_5, Card.HEARTS),
+         Card(Card.NUM_9, Card.CLUBS), Card(Card.NUM_3, Card.DIAMONDS))
+
+
+def test_add(benchmark):
+    h = Hand()
+
+    def add():
+        for c in cards:
+            h.add(c)
+        h.clear()
+
+    benchmark(add)
+    for c in cards:
+        h.add(c)
+    assert h.total == (Hand.HARD, 18)
@@ -0,0 +1,18 @@
+from blackjack.card import Card
+from blackjack.game import Game
+from blackjack.game_config import GameConfig
+from blackjack.players.threshold_player import ThresholdPlayer
+import pytest
+
+
+@pytest.mark.parametrize('ranks', [(Card.NUM_10, Card.NUM_6),
+                                   (Card.ACE, Card.NUM_5)],
+                         ids=['hard', 'soft'])
+def test_decide_hit(benchmark, ranks):
+    p = ThresholdPlayer()
+    p.sit_down(GameConfig())
+    p.place_bet()
+    for r in ranks:
+        p.curr_hand().add(Card(r, Card.SPADES))
+    p.observe_card(Card(Card.KING, Card.HEARTS), Game.dealer_seat)
+    assert benchmark(p.decide_hit) == True
@@ -0,0 +1,34 @@
+import glob
+import os
+import pytest
+
+# pytest-benchmark is optional, and the plain test run skips the benchmarks
+# without it
+pytest.importorskip('pytest_benchmark')
+from pytest_benchmark.utils import get_machine_id  # noqa: E402
+
+# Baselines are stored next to the benchmarks, wherever pytest is run from
+BASELINES = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                         'baselines')
+
+# Name of the run that later runs on the same machine are compared with
+BASELINE = '0001'
+
+
+def pytest_configure(config):
+    # pytest-benchmark reads these options in its own pytest_configure,
+    # which runs last
+    option = config.option
+    if getattr(option, 'benchmark_storage', None) != 'file://./.benchmarks':
+        # Storage given on the command line, leave everything as is
+        return
+    option.benchmark_storage = 'file://' + BASELINES
+
+    # Timings only compare on the same kind of machine. The first run on a
+    # new one is saved as its baseline instead of being compared.
+    if option.benchmark_compare == BASELINE and not glob.glob(os.path.join(
+            BASELINES, get_machine_id(), BASELINE + '_*.json')):
+        option.benchmark_compare = False
+        option.benchmark_compare_fail = []
+        if not option.benchmark_save:
+            option.benchmark_save = 'baseline'
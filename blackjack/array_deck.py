@@ -0,0 +1,250 @@
+from blackjack.card import Card
+from blackjack.rng import make_rng
+import numpy as np
+
+
+class ArrayDeck():
+
+    ############################ Define constants ############################
+
+    # Every distinct card, indexed by its small-int code (Card.code).
+    # Ordinary cards come first in the same order as an ordered Deck,
+    # followed by the jokers.
+    code2card = Card.cards
+
+    # Codes making up one full deck, with and without jokers
+    _single_deck = np.arange(len(Card.ranks) * len(Card.suits), dtype=np.int8)
+    _single_deck_joker = np.arange(len(code2card), dtype=np.int8)
+
+    # Number of cards below the cut, or -1 without a cut
+    cut = -1
+
+    ##########################################################################
+
+    def __init__(self, num_full_decks=1, include_joker=False, ordered=False,
+                 rng=None):
+        """
+        Initializes an array-backed deck.
+
+        The deck behaves like Deck, but stores cards as small-int codes (see
+        Card.code) in a NumPy array. Drawing advances a cursor
+        instead of popping from a list, and shuffling uses a
+        numpy.random.Generator seeded from rng.
+
+        Params:
+
+            num_full_decks (int): Number of full decks to include in this
+                playing deck.
+                Req: num_full_decks > 0
+
+            include_joker (bool): Whether to include joker cards in each full
+                deck.
+                Req: None
+
+            ordered (bool): Whether the resulting deck should be ordered.
+                Req: None
+
+            rng (None, int or random.Random): Generator or seed to seed the
+                shuffle generator from, as for Deck. None seeds from fresh OS
+                entropy.
+                Req: rng is None, a random.Random, or an int >= 0
+        """
+
+        """ Init param check """
+        # num_full_decks should be positive int
+        assert type(num_full_decks) is int
+        assert num_full_decks > 0
+        # include_joker should be boolean
+        assert type(include_joker) is bool
+        # ordered should be boolean
+        assert type(ordered) is bool
+        # rng is checked by make_rng
+        self.rng = np.random.default_rng(make_rng(rng).getrandbits(64))
+
+        single = ArrayDeck._single_deck_joker if include_joker \
+            else ArrayDeck._single_deck
+        # Every card of the full shoe, to refill the deck from on reshuffle
+        self._shoe = np.tile(single, num_full_decks)
+        self._codes = self._shoe.copy()
+
+        # Cards at positions [0, self._top) are still in the deck; the card at
+        # self._top - 1 is the top card, drawn next.
+        self._top = len(self._shoe)
+
+        if not ordered:
+            self.shuffle()
+
+    def shuffle(self):
+        """
+        Shuffles the cards remaining in the deck in place.
+        """
+        self.rng.shuffle(self._codes[:self._top])
+
+    def reshuffle(self, held=()):
+        """
+        Puts every card of the full shoe back into the deck, except the held
+        cards, and shuffles it.
+
+        The deck is refilled in place, reusing the same array, so that a shoe
+        can be played again and again without allocating a new deck. Any
+        card inserted into the deck is dropped. The cut stays in place.
+
+        Params:
+            held (iterable of Card): Cards kept out of the deck, as for
+                Deck.reshuffle.
+                Req: no card is held more often than the full shoe holds it
+        """
+        n = len(self._shoe)
+        if len(self._codes) < n:
+            self._codes = np.empty(n, dtype=np.int8)
+        codes = self._codes
+        codes[:n] = self._shoe
+        for c in held:
+            # Move the last card into the place of the held one
+            k = int(np.flatnonzero(codes[:n] == c.code)[0])
+            n -= 1
+            codes[k] = codes[n]
+        self._top = n
+        self.shuffle()
+
+    def set_cut(self, idx):
+        """
+        Places the cut at this index, counted from the bottom of the deck as
+        for insert. Once every card above it has been drawn, the next draw
+        brings up the cut, and reshuffle_due is True.
+
+        Params:
+            idx (int): Number of cards below the cut.
+                Req: 0 <= idx <= len(self)
+        """
+        if type(idx) is not int or not 0 <= idx <= len(self):
+            raise AssertionError('Invalid cut index.')
+        self.cut = idx
+
+    @property
+    def reshuffle_due(self):
+        """
+        True once a card below the cut has been drawn, until the deck is
+        reshuffled, as for Deck.
+        """
+        top = self._top
+        return top < self.cut or top == self.cut == 0
+
+    def draw_code(self):
+        """
+        Removes the top card and returns its code, without looking up the
+        card object.
+
+        Returns:
+            if len(self) > 0
+                -> code (int), where ArrayDeck.code2card[code] is the card
+            else
+                -> -1
+        """
+        if self._top > 0:
+            self._top -= 1
+            return int(self._codes[self._top])
+        else:
+            return -1
+
+    def draw(self):
+        """
+        Removes the top card and returns it. If the deck is empty, returns
+        None.
+
+        Returns:
+            if len(self) > 0
+                -> c (Card)
+            else
+                -> None
+        """
+        if self._top > 0:
+            self._top -= 1
+            return ArrayDeck.code2card[int(self._codes[self._top])]
+        else:
+            return None
+
+    def insert(self, idx, c):
+        """
+        Inserts a card into this index, following the indexing of
+        list.insert on the remaining cards.
+
+        To insert to the top of the deck, use idx=len(Deck) so the item will
+        be returned at the next draw. To insert to the bottom of the deck, use
+        idx=0.
+
+        Params:
+            idx (int): An index within the deck.
+                Req: None
+            c (Card): The card to insert.
+                Req: None
+
+        Returns:
+            None
+        """
+        if not isinstance(idx, int):
+            raise AssertionError('Deck insertion index must be int.')
+        if not isinstance(c, Card):
+            raise AssertionError('Only cards can be inserted into a deck.')
+
+        # Normalize idx the same way list.insert does
+        if idx < 0:
+            idx = max(0, idx + self._top)
+        idx = min(idx, self._top)
+
+        self._codes = np.insert(self._codes[:self._top], idx, c.code)
+        self._top += 1
+
+    @property
+    def deck(self):
+        """
+        List of the cards remaining in the deck, from bottom to top, in the
+        same layout as Deck.deck.
+        """
+        return [ArrayDeck.code2card[code]
+                for code in self._codes[:self._top].tolist()]
+
+    def __len__(self):
+        """
+        Returns number of cards in deck.
+        """
+        return self._top
+
+    def __eq__(self, other):
+        if not isinstance(other, ArrayDeck):
+            return False
+        return np.array_equal(self._codes[:self._top],
+                              other._codes[:other._top])
+
+    def __str__(self):
+        """
+        Short string representation of the deck.
+        """
+        return f'Deck of {len(self)} cards'
+
+    def __repr__(self):
+        """
+        Long string representation of the deck, in the same format as
+        Deck.__repr__.
+        """
+        if self._top > 3:
+            return f'Deck [ {str(self.peek(0))} ... ' \
+                f'{str(self.peek(self._top - 1))} ]'
+        else:
+            target = 'Deck [ '
+            for i in range(self._top):
+                target += str(self.peek(i))
+                target += ' '
+            target += ']'
+            return target
+
+    def peek(self, depth=0):
+        """
+        Returns the card at the given depth from the top without removing it.
+        Depth 0 is the card returned at the next draw.
+
+        Params:
+            depth (int): Number of cards above the card to peek at.
+                Req: 0 <= depth < len(self)
+        """
+        return ArrayDeck.code2card[int(self._codes[self._top - 1 - depth])]
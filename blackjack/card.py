@@ -99,13 +99,23 @@ class Card:
     _suit2repr = {CLUBS: 'Clubs', DIAMONDS: 'Diamonds', HEARTS: 'Hearts',
                   SPADES: 'Spades', RANDOM: ''}
 
+    # Attributes of each card. Cards carry no __dict__ and are immutable.
+    __slots__ = ('rank', 'suit', 'code')
+
     ##########################################################################
 
-    def __init__(self, rank=RANDOM, suit=RANDOM):
+    def __new__(cls, rank=RANDOM, suit=RANDOM, rng=None):
         """
-        Initializes card.
+        Returns the card with the given rank and suit.
+
+        Cards are interned: there is exactly one instance of each of the 52
+        ordinary cards and the 2 jokers, created when this module is loaded,
+        and every call returns one of them. Two cards are therefore equal iff
+        they are the same object.
 
-        Params: rank, suit.
+        Params: rank, suit, and rng (random.Random or None), the generator
+            to draw a random rank or suit from. None uses the global random
+            module.
         Req: either (rank in Card.ranks and suit in Card.suits)
                 -> given rank, given suit
              or     (rank in Card.jokers and suit == Card.RANDOM)
@@ -127,25 +137,24 @@ class Card:
             >>> Card(Card.NUM_6)  # Spawns a 6 with a random suit
             >>> Card(Card.HEARTS) # Spawns a Hearts card with a random rank
             >>> Card()            # Spawns a random card excluding jokers
+            >>> Card(rng=random.Random(7))  # Same random card every time
         """
 
         """ Init param check """
         invalid_param = AssertionError('Invalid initialization parameters.')
 
-        if rank in Card.ranks:
-            if suit in Card.suits:
-                # Given rank, given suit
-                pass
-            elif suit == Card.RANDOM:
-                # Given rank, random suit
-                suit = Card._random_suit()
-            else:
-                raise invalid_param
+        # Fully specified cards skip the checks below
+        try:
+            card = Card._registry.get((rank, suit))
+        except TypeError:
+            raise invalid_param
+        if card is not None:
+            return card
 
-        elif rank in Card.jokers:
+        if rank in Card.ranks:
             if suit == Card.RANDOM:
-                # Given joker card
-                pass
+                # Given rank, random suit
+                suit = Card._random_suit(rng)
             else:
                 raise invalid_param
 
@@ -153,23 +162,56 @@ class Card:
             if suit == Card.RANDOM:
                 # Random rank, given suit
                 suit = rank
-                rank = Card._random_rank()
+                rank = Card._random_rank(rng)
             else:
                 raise invalid_param
 
         elif rank == Card.RANDOM:
             if suit == Card.RANDOM:
                 # Random rank, random suit
-                rank = Card._random_rank()
-                suit = Card._random_suit()
+                rank = Card._random_rank(rng)
+                suit = Card._random_suit(rng)
             else:
                 raise invalid_param
 
         else:
             raise invalid_param
 
-        self.rank = rank
-        self.suit = suit
+        return Card._registry[(rank, suit)]
+
+    @classmethod
+    def _intern_all(cls):
+        """
+        Creates the single instance of each card, in the order of an ordered
+        Deck followed by the jokers. Each card's code is its index in
+        Card.cards.
+        """
+        keys = [(rank, suit) for rank in Card.ranks for suit in Card.suits] + \
+            [(joker_value, Card.RANDOM) for joker_value in Card.jokers]
+        cards = []
+        for code, (rank, suit) in enumerate(keys):
+            c = object.__new__(cls)
+            object.__setattr__(c, 'rank', rank)
+            object.__setattr__(c, 'suit', suit)
+            object.__setattr__(c, 'code', code)
+            cards.append(c)
+
+        # All cards, indexed by code
+        cls.cards = tuple(cards)
+        cls._registry = dict(zip(keys, cards))
+
+    def __setattr__(self, name, value):
+        raise AttributeError('Cards are immutable.')
+
+    def __delattr__(self, name):
+        raise AttributeError('Cards are immutable.')
+
+    def __reduce__(self):
+        """
+        Pickles a card by rank and suit, so that unpickling returns the
+        interned instance.
+        """
+        return (Card, (self.rank, self.suit))
 
     def is_ace(self):
         """ Returns True iff the rank is Ace.  """
@@ -220,28 +262,21 @@ class Card:
             (' of ' if not self.is_joker() else '') + \
             Card._suit2repr[self.suit]
 
-    def __eq__(self, other):
-        """
-        Two cards are equal when their suits and ranks are both equal.
-        """
-        if not isinstance(other, Card):
-            return False
-        return self.rank == other.rank and self.suit == other.suit
-
-    def __hash__(self):
-        return hash((self.rank, self.suit))
-
     @classmethod
-    def _random_rank(cls):
+    def _random_rank(cls, rng=None):
         """
         Returns a random rank from Card.ranks, excluding joker ranks in
-        Card.jokers.
+        Card.jokers, drawn from rng or the global random module.
         """
-        return random.sample(Card.ranks, 1)[0]
+        return (random if rng is None else rng).choice(Card.ranks)
 
     @classmethod
-    def _random_suit(cls):
+    def _random_suit(cls, rng=None):
         """
-        Returns a random suit from Card.suits
+        Returns a random suit from Card.suits, drawn from rng or the global
+        random module.
         """
-        return random.sample(Card.suits, 1)[0]
+        return (random if rng is None else rng).choice(Card.suits)
+
+
+Card._intern_all()
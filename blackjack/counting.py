@@ -0,0 +1,114 @@
+from blackjack.card import Card
+from blackjack.game import Game
+
+
+class CardCounter:
+
+    ############################ Define constants ############################
+
+    # Counting systems
+    HI_LO = 'Hi-Lo'
+    KO = 'KO'
+    OMEGA_II = 'Omega II'
+    ZEN = 'Zen'
+    systems = (HI_LO, KO, OMEGA_II, ZEN)
+
+    # Tag of each card value in each system, as (Ace, 2, 3, ..., 9, 10)
+    value_tags = {
+        HI_LO: (-1, 1, 1, 1, 1, 1, 0, 0, 0, -1),
+        KO: (-1, 1, 1, 1, 1, 1, 1, 0, 0, -1),
+        OMEGA_II: (0, 1, 1, 2, 2, 2, 1, 0, -1, -2),
+        ZEN: (-1, 1, 1, 2, 2, 2, 1, 0, 0, -2),
+    }
+
+    # Cards in one full deck, without jokers
+    deck_size = len(Card.ranks) * len(Card.suits)
+
+    ##########################################################################
+
+    def __init__(self, system=HI_LO, num_decks=1):
+        """
+        Keeps a running count of the cards seen since the last shuffle.
+
+        Each card adds the tag of its value in the counting system, looked
+        up by Card.code in a precomputed table. Jokers count 0.
+
+        Params:
+            system (str): The counting system, one of CardCounter.systems.
+                Req: None
+            num_decks (int): Number of full decks in the shoe being counted.
+                Req: num_decks > 0
+        """
+
+        """ Init param check """
+        assert system in CardCounter.systems
+
+        self.system = system
+        tags = CardCounter.value_tags[system]
+        self.tags = tuple(
+            0 if c.is_joker() else
+            tags[0] if c.is_ace() else tags[Game.rank2value[c.rank] - 1]
+            for c in Card.cards)
+        # Unbalanced systems do not sum to 0 over a deck
+        self.deck_sum = sum(self.tags[:CardCounter.deck_size])
+        self.reset(num_decks)
+
+    def reset(self, num_decks=None):
+        """
+        Starts counting a freshly shuffled shoe.
+
+        Params:
+            num_decks (int or None): Number of full decks in the new shoe.
+                None keeps the current number.
+                Req: num_decks is None or num_decks > 0
+        """
+        if num_decks is not None:
+            assert type(num_decks) is int and num_decks > 0
+            self.num_decks = num_decks
+        # Unbalanced systems start from the usual initial running count,
+        # e.g. 4 - 4 * num_decks for KO. Balanced ones start from 0.
+        self.initial_count = self.deck_sum * (1 - self.num_decks)
+        self.running_count = self.initial_count
+        self.cards_seen = 0
+
+    def observe(self, card):
+        """
+        Counts one card.
+
+        Params:
+            card (Card): The card seen.
+                Req: None
+        """
+        self.running_count += self.tags[card.code]
+        self.cards_seen += 1
+
+    @property
+    def cards_remaining(self):
+        """
+        Number of cards of the shoe not yet seen.
+        """
+        return self.num_decks * CardCounter.deck_size - self.cards_seen
+
+    @property
+    def decks_remaining(self):
+        """
+        Number of decks not yet seen, never less than a single card.
+        """
+        return max(self.cards_remaining, 1) / CardCounter.deck_size
+
+    @property
+    def true_count(self):
+        """
+        The running count per deck remaining. For unbalanced systems, the
+        initial count and the drift expected from the cards seen so far are
+        taken out first, so that the true count of every system averages 0.
+        """
+        count = self.running_count
+        if self.deck_sum:
+            count -= self.initial_count + \
+                self.deck_sum * self.cards_seen / CardCounter.deck_size
+        return count / self.decks_remaining
+
+    def __repr__(self):
+        return f'CardCounter({self.system}, rc={self.running_count}, ' \
+            f'tc={self.true_count:.2f})'
@@ -0,0 +1,74 @@
+from blackjack.game import Game
+from blackjack.hand import Hand
+
+
+class Dealer:
+    def __init__(self, game_config):
+        """
+        Initializes dealer.
+
+        The dealer draws to Game.dealer_stand_total, and also hits a soft
+        total of exactly that much if game_config.hit_soft_17 is set (H17),
+        or stands on it otherwise (S17). Whether to hit is looked up by the
+        state of the dealer's hand in a table built once per config, so
+        playing out the hand takes no decisions.
+
+        Params:
+            game_config (GameConfig): Config of the game.
+                Req: None
+        """
+        self.config = game_config
+        self.hit_soft_17 = game_config.hit_soft_17
+        # As for Player.dealer
+        self.dealer = True
+        self.hand = Hand()
+        self.hits = Dealer.hit_table(game_config)
+
+    @classmethod
+    def hit_table(cls, game_config, hit_soft_17=None):
+        """
+        Tabulates the dealer's play.
+
+        Params:
+            game_config (GameConfig): Config of the game. Its
+                blackjack_value is the bust limit.
+                Req: None
+            hit_soft_17 (bool or None): Whether the dealer hits a soft 17.
+                None uses game_config.hit_soft_17.
+                Req: None
+
+        Returns (tuple of bool):
+            hits -> hits[state] is True iff the dealer hits a hand in the
+                given Hand state
+        """
+        if hit_soft_17 is None:
+            hit_soft_17 = game_config.hit_soft_17
+        hits = []
+        for mode, total in Hand.state2total:
+            hits.append(total <= game_config.blackjack_value and (
+                total < Game.dealer_stand_total or (
+                    hit_soft_17 and mode == Hand.SOFT and
+                    total == Game.dealer_stand_total)))
+        return tuple(hits)
+
+    def play(self, deal):
+        """
+        Plays out the dealer's hand.
+
+        Params:
+            deal (callable): deal(hand, seat) deals the next card to hand,
+                held by seat, as Game._deal does.
+                Req: None
+
+        Returns:
+            hand (Hand) the dealer's final hand.
+        """
+        hand = self.hand
+        hits = self.hits
+        while hits[hand.state]:
+            deal(hand, Game.dealer_seat)
+        return hand
+
+    def __repr__(self):
+        rule = 'H17' if self.hit_soft_17 else 'S17'
+        return f'Dealer({rule}, {self.hand!r})'
@@ -0,0 +1,254 @@
+from blackjack.card import Card
+from blackjack.dealer import Dealer
+from blackjack.game import Game
+from blackjack.hand import Hand
+from functools import lru_cache
+
+
+class DealerOdds:
+
+    ############################ Define constants ############################
+
+    # Outcomes other than standing on a total
+    BUST = 'Bust'
+    BLACKJACK = 'Blackjack'
+
+    # A shoe composition is a tuple of 10 counts, where composition[v - 1]
+    # is the number of cards of value v left in the shoe (Aces count as 1)
+    NUM_VALUES = 10
+
+    ##########################################################################
+
+    def __init__(self, game_config, hit_soft_17=None):
+        """
+        Computes the exact distribution of the dealer's final hand.
+
+        Every way the dealer can draw from the remaining shoe is enumerated,
+        removing each drawn card from the shoe, so the result depends on the
+        exact composition of the shoe. The chance of drawing a given multiset
+        of cards in a given order only depends on the multiset, so the draws
+        are enumerated once per upcard, as the multisets the dealer can end
+        on and the number of orders the dealer draws each in. A distribution
+        for a shoe then takes one product per multiset.
+
+        Params:
+            game_config (GameConfig): Config of the game. Its num_decks gives
+                the default shoe, and its blackjack_value the bust limit and
+                natural total.
+                Req: None
+            hit_soft_17 (bool or None): Whether the dealer hits a soft 17
+                (H17) rather than standing on it (S17). None uses
+                game_config.hit_soft_17.
+                Req: None
+        """
+
+        """ Init param check """
+        assert hit_soft_17 is None or type(hit_soft_17) is bool
+
+        if hit_soft_17 is None:
+            hit_soft_17 = game_config.hit_soft_17
+
+        self.config = game_config
+        self.hit_soft_17 = hit_soft_17
+        self._hits = Dealer.hit_table(game_config, hit_soft_17)
+
+        # Final totals the dealer can stand on, followed by BUST. Outcome
+        # vectors list probabilities in this order.
+        self.totals = tuple(range(Game.dealer_stand_total,
+                                  game_config.blackjack_value + 1))
+        self.outcomes = self.totals + (DealerOdds.BUST,)
+        self._bust = tuple(0 for _ in self.totals) + (1,)
+        self._stand = {total: tuple(1 if t == total else 0
+                                    for t in self.outcomes)
+                       for total in self.totals}
+
+        self._draws = lru_cache(maxsize=None)(self._draws_uncached)
+        self._distribution = lru_cache(maxsize=4096)(
+            self._distribution_uncached)
+
+    def clear_cache(self):
+        """
+        Empties the caches of sub-results.
+        """
+        self._draws.cache_clear()
+        self._distribution.cache_clear()
+
+    @classmethod
+    def shoe(cls, num_decks):
+        """
+        Gives the composition of a full shoe.
+
+        Params:
+            num_decks (int): Number of full decks in the shoe.
+                Req: num_decks > 0
+
+        Returns (tuple of int):
+            composition -> composition[v - 1] is the number of cards of value v
+        """
+        composition = [0] * DealerOdds.NUM_VALUES
+        for rank in Card.ranks:
+            value = 1 if rank == Card.ACE else Game.rank2value[rank]
+            composition[value - 1] += len(Card.suits) * num_decks
+        return tuple(composition)
+
+    @classmethod
+    def remove(cls, composition, value):
+        """
+        Gives the composition left after removing one card of the given value.
+
+        Params:
+            composition (tuple of int): A shoe composition.
+                Req: composition[value - 1] > 0
+            value (int): Value of the card to remove, with Aces as 1.
+                Req: 1 <= value <= 10
+        """
+        if composition[value - 1] <= 0:
+            raise AssertionError('No card of this value is left in the shoe.')
+        return composition[:value - 1] + (composition[value - 1] - 1,) + \
+            composition[value:]
+
+    @classmethod
+    def add(cls, composition, value):
+        """
+        Gives the composition with one more card of the given value.
+
+        Params:
+            composition (tuple of int): A shoe composition.
+                Req: None
+            value (int): Value of the card to add, with Aces as 1.
+                Req: 1 <= value <= 10
+        """
+        return composition[:value - 1] + (composition[value - 1] + 1,) + \
+            composition[value:]
+
+    def distribution(self, upcard, composition=None, peek=False):
+        """
+        Gives the probability of each final dealer outcome.
+
+        Params:
+            upcard (Card): The dealer's upcard.
+                Req: upcard is not a joker
+            composition (tuple of int or None): The shoe the hole card and
+                later cards are drawn from, with the upcard already removed.
+                None uses a full shoe of the config's num_decks, less the
+                upcard.
+                Req: None
+            peek (bool): If True, give the distribution given that the dealer
+                does not have a natural, as when players only act after the
+                dealer has checked for blackjack.
+                Req: None
+
+        Returns (dict):
+            -> Maps each total in self.totals, DealerOdds.BUST and
+                DealerOdds.BLACKJACK to its probability.
+        """
+        value = Hand.card2value[upcard]
+        if composition is None:
+            composition = DealerOdds.remove(
+                DealerOdds.shoe(self.config.num_decks), value)
+        probs, natural = self._distribution(value, composition, peek)
+        result = dict(zip(self.outcomes, probs))
+        result[DealerOdds.BLACKJACK] = natural
+        return result
+
+    def _distribution_uncached(self, value, composition, peek):
+        """
+        Returns (probs, natural) where probs lists the probabilities of
+        self.outcomes, and natural is the probability of a dealer natural.
+        """
+        draws, depth = self._draws(value)
+
+        # falling[v * (depth + 1) + k] is the number of ways to draw k cards
+        # of value v + 1 in order, and inverse[k] is one over the number of
+        # ways to draw any k cards in order
+        falling = []
+        for count in composition:
+            ways = 1.0
+            falling.append(ways)
+            for k in range(depth):
+                ways *= count - k
+                falling.append(ways)
+        num_cards = sum(composition)
+        ways = 1.0
+        inverse = [ways]
+        for k in range(depth):
+            ways *= num_cards - k
+            inverse.append(1 / ways if ways else 0.0)
+
+        probs = [0.0] * (len(self.outcomes) + 1)
+        for outcome, size, multisets in draws:
+            total = 0.0
+            for orders, indices in multisets:
+                for i in indices:
+                    orders *= falling[i]
+                total += orders
+            probs[outcome] += total * inverse[size]
+        natural = probs.pop()
+        if sum(probs) + natural < 1 - 1e-9:
+            raise AssertionError('The shoe ran out during dealer play.')
+
+        if peek:
+            if natural < 1:
+                probs = [q / (1 - natural) for q in probs]
+            natural = 0
+        return tuple(probs), natural
+
+    def _draws_uncached(self, value):
+        """
+        Enumerates the cards the dealer can draw to an upcard of the given
+        value, hole card first.
+
+        Returns (tuple): (draws, depth) where
+            draws -> (outcome, size, multisets) for each outcome and number
+                of cards drawn, where outcome indexes self.outcomes, or is
+                len(self.outcomes) for a natural. multisets lists
+                (orders, indices) for each multiset of size cards the dealer
+                ends on with that outcome, where orders is the number of
+                orders the dealer draws it in, and indices give its count of
+                each value v in the format of the falling factorials of
+                _distribution_uncached.
+            depth -> the most cards the dealer can draw
+        """
+        blackjack_value = self.config.blackjack_value
+        natural = len(self.outcomes)
+        bust = natural - 1
+        up_state = Hand.transitions[Hand.EMPTY_STATE][value]
+
+        # Number of orders reaching each (dealer hand state, multiset drawn)
+        # still drawing, and each (outcome, multiset drawn) done drawing
+        drawing = {}
+        done = {}
+        empty = (0,) * DealerOdds.NUM_VALUES
+        for hole in range(1, DealerOdds.NUM_VALUES + 1):
+            state = Hand.transitions[up_state][hole]
+            drawn = DealerOdds.add(empty, hole)
+            if Hand.state2total[state][1] == blackjack_value:
+                done[natural, drawn] = 1
+            else:
+                drawing[state, drawn] = 1
+        while drawing:
+            next_drawing = {}
+            for (state, drawn), orders in drawing.items():
+                total = Hand.state2total[state][1]
+                if total > blackjack_value or not self._hits[state]:
+                    outcome = bust if total > blackjack_value \
+                        else total - self.totals[0]
+                    key = (outcome, drawn)
+                    done[key] = done.get(key, 0) + orders
+                    continue
+                transitions = Hand.transitions[state]
+                for card in range(1, DealerOdds.NUM_VALUES + 1):
+                    key = (transitions[card], DealerOdds.add(drawn, card))
+                    next_drawing[key] = next_drawing.get(key, 0) + orders
+            drawing = next_drawing
+
+        depth = max(sum(drawn) for _, drawn in done)
+        groups = {}
+        for (outcome, drawn), orders in done.items():
+            indices = tuple(v * (depth + 1) + k
+                            for v, k in enumerate(drawn) if k)
+            groups.setdefault((outcome, sum(drawn)), []).append(
+                (float(orders), indices))
+        draws = tuple((outcome, size, tuple(multisets))
+                      for (outcome, size), multisets in groups.items())
+        return draws, depth
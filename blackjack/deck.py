@@ -1,9 +1,15 @@
 from blackjack.card import Card
+from blackjack.rng import make_rng
 import random
 
 
 class Deck():
-    def __init__(self, num_full_decks=1, include_joker=False, ordered=False):
+
+    # Number of cards below the cut, or -1 without a cut
+    cut = -1
+
+    def __init__(self, num_full_decks=1, include_joker=False, ordered=False,
+                 rng=None):
         """
         Initializes deck.
 
@@ -19,6 +25,10 @@ class Deck():
 
             ordered (bool): Whether the resulting deck should be ordered.
                 Req: None
+
+            rng (None, int or random.Random): Generator to shuffle with, or a
+                seed for one. None uses the global random module.
+                Req: rng is None, a random.Random, or an int >= 0
         """
 
         """ Init param check """
@@ -30,20 +40,65 @@ class Deck():
         # ordered should be boolean
         assert type(ordered) is bool
 
-        def get_single_deck(include_joker):
-            result = [Card(rank, suit)
-                      for rank in Card.ranks for suit in Card.suits]
-            if include_joker:
-                result += [Card(joker_value)
-                           for joker_value in Card.jokers]
-            return result
+        self.rng = random if rng is None else make_rng(rng)
 
-        self.deck = []
-        for _ in range(num_full_decks):
-            self.deck += get_single_deck(include_joker)
+        # Cards are interned, so a shoe is copies of the same 52 (or 54)
+        # objects
+        num_cards = len(Card.cards) if include_joker \
+            else len(Card.ranks) * len(Card.suits)
+        self.deck = list(Card.cards[:num_cards]) * num_full_decks
+        # The full shoe, to refill the deck from on reshuffle
+        self._shoe = (num_cards, num_full_decks)
 
         if not ordered:
-            random.shuffle(self.deck)
+            self.rng.shuffle(self.deck)
+
+    def reshuffle(self, held=()):
+        """
+        Puts every card of the full shoe back into the deck, except the held
+        cards, and shuffles it.
+
+        The deck is refilled in place, reusing the same list, so that a shoe
+        can be played again and again without allocating a new deck. Any
+        card inserted into the deck is dropped. The cut stays in place.
+
+        Params:
+            held (iterable of Card): Cards kept out of the deck, such as the
+                cards still in play. One copy is left out per card listed.
+                Req: no card is held more often than the full shoe holds it
+        """
+        num_cards, num_full_decks = self._shoe
+        deck = self.deck
+        deck[:] = Card.cards[:num_cards]
+        deck *= num_full_decks
+        for c in held:
+            deck.remove(c)
+        self.rng.shuffle(deck)
+
+    def set_cut(self, idx):
+        """
+        Places the cut at this index, counted from the bottom of the deck as
+        for insert. Once every card above it has been drawn, the next draw
+        brings up the cut, and reshuffle_due is True.
+
+        Params:
+            idx (int): Number of cards below the cut.
+                Req: 0 <= idx <= len(self)
+        """
+        if type(idx) is not int or not 0 <= idx <= len(self):
+            raise AssertionError('Invalid cut index.')
+        self.cut = idx
+
+    @property
+    def reshuffle_due(self):
+        """
+        True once a card below the cut has been drawn, or the deck has run
+        out with the cut at the bottom, until the deck is reshuffled. It is
+        found from the number of cards left, so that draws do no extra work
+        for the cut.
+        """
+        left = len(self.deck)
+        return left < self.cut or left == self.cut == 0
 
     def draw(self):
         """
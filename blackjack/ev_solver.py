@@ -0,0 +1,295 @@
+from blackjack.dealer_odds import DealerOdds
+from blackjack.hand import Hand
+
+
+class EVSolver:
+
+    ############################ Define constants ############################
+
+    # Player actions
+    STAND = 'Stand'
+    HIT = 'Hit'
+    DOUBLE = 'Double'
+    SPLIT = 'Split'
+    SURRENDER = 'Surrender'
+    actions = (STAND, HIT, DOUBLE, SPLIT, SURRENDER)
+
+    ##########################################################################
+
+    def __init__(self, game_config, hit_soft_17=None, exact=False):
+        """
+        Computes the expected value of each action for a player hand against
+        a dealer upcard, drawing from a given shoe composition.
+
+        Values are the expected net winnings per unit of the original bet,
+        given that the dealer has already checked for and does not have a
+        natural. Cards the player draws are always removed from the shoe they
+        draw from. Split hands are played without resplitting, and the two
+        split hands are treated as independent.
+
+        Params:
+            game_config (GameConfig): Config of the game.
+                Req: None
+            hit_soft_17 (bool or None): Whether the dealer hits a soft 17.
+                None uses game_config.hit_soft_17.
+                Req: None
+            exact (bool): If True, the dealer's outcomes are recomputed for
+                the exact shoe left after every player draw. If False, they
+                are computed once per query, from the shoe left after the
+                initial cards, which is much faster and rarely changes the
+                best action. With 8 decks, a query takes at most about 20 ms
+                either way for most hands, but an exact query on a cold
+                solver does not meet 50 ms for hands that can draw many
+                small cards: it takes about 0.3 to 0.7 s for A-A, 2-2 or
+                A-2, as the dealer's outcomes are needed for thousands of
+                shoes. Exact values are kept across queries, so repeating a
+                query is immediate, and a full basic strategy table averages
+                about 50 ms per query.
+                Req: None
+        """
+
+        """ Init param check """
+        assert type(exact) is bool
+
+        self.config = game_config
+        self.exact = exact
+        self.odds = DealerOdds(game_config, hit_soft_17=hit_soft_17)
+
+        # Sub-results kept across queries, by upcard value: the value of
+        # standing on each total against each shoe, and in exact mode the
+        # value of playing on from each (hand state, shoe)
+        self._stand_tables = {}
+        self._best = {}
+
+    def solve(self, hand, upcard, composition=None, after_split=False):
+        """
+        Gives the expected value of each action.
+
+        Params:
+            hand (Hand): The player's hand.
+                Req: hand is not bust
+            upcard (Card): The dealer's upcard.
+                Req: upcard is not a joker
+            composition (tuple of int or None): The shoe left to draw from,
+                in the format of DealerOdds.shoe, with the player's cards and
+                the upcard already removed. None uses a full shoe of the
+                config's num_decks less those cards.
+                Req: None
+            after_split (bool): Whether the hand is the result of a split,
+                which controls doubling, surrendering and blackjack pay.
+                Req: None
+
+        Returns (dict):
+            -> Maps each action in EVSolver.actions to its expected value, or
+                to None if the action is not allowed for this hand.
+        """
+        config = self.config
+        up = Hand.card2value[upcard]
+        if composition is None:
+            composition = DealerOdds.remove(
+                DealerOdds.shoe(config.num_decks), up)
+            for c in hand:
+                composition = DealerOdds.remove(
+                    composition, Hand.card2value[c])
+
+        query = _Query(self, up, composition, after_split)
+        num_cards = len(hand)
+        total = hand.total[1]
+        if total > config.blackjack_value:
+            raise AssertionError('Cannot solve a bust hand.')
+
+        result = dict.fromkeys(EVSolver.actions)
+        if num_cards == config.init_hand_size and \
+                total == config.blackjack_value and \
+                query.natural_pays_blackjack:
+            # A natural is paid right away
+            result[EVSolver.STAND] = config.blackjack_pay
+            return result
+
+        result[EVSolver.STAND] = query.stand(hand.state, composition)
+        result[EVSolver.HIT] = query.hit(hand.state, composition)
+        if num_cards == 2:
+            if not after_split or config.double_after_split:
+                result[EVSolver.DOUBLE] = query.double(
+                    hand.state, composition)
+            if not after_split and \
+                    (config.late_surrender or config.early_surrender):
+                result[EVSolver.SURRENDER] = -0.5
+            if not after_split and hand.uniform_value is not None and \
+                    config.max_hands > 1:
+                result[EVSolver.SPLIT] = query.split(
+                    Hand.card2value[hand[0]], composition)
+        return result
+
+    def best_action(self, hand, upcard, composition=None, after_split=False):
+        """
+        Gives the allowed action with the highest expected value. Params are
+        the same as for EVSolver.solve.
+
+        Returns (str):
+            action -> in EVSolver.actions
+        """
+        evs = self.solve(hand, upcard, composition, after_split)
+        return max((a for a in EVSolver.actions if evs[a] is not None),
+                   key=lambda a: evs[a])
+
+    def clear_cache(self):
+        """
+        Empties the caches of dealer outcomes and of the values kept across
+        queries.
+        """
+        self.odds.clear_cache()
+        self._stand_tables.clear()
+        self._best.clear()
+
+
+class _Query:
+    def __init__(self, solver, up, composition, after_split):
+        """
+        Memoized sub-results for one EVSolver.solve call. Stand tables are
+        shared by every query against the same upcard, and so are the values
+        of playing on in exact mode, where they only depend on the upcard and
+        the shoe.
+
+        Params:
+            solver (EVSolver): The solver.
+            up (int): Value of the dealer upcard, with Aces as 1.
+            composition (tuple of int): Shoe left after the initial cards.
+            after_split (bool): Whether the hand comes from a split.
+        """
+        config = solver.config
+        self.solver = solver
+        self.config = config
+        self.up = up
+        self.bust_total = config.blackjack_value
+        self.natural_pays_blackjack = \
+            not (after_split and config.natural_blackjack_only)
+        self._stand_tables = solver._stand_tables.setdefault(up, {})
+        if solver.exact:
+            self._fixed = None
+            self._best = solver._best.setdefault(up, {})
+        else:
+            self._fixed = self._cached_stand_table(composition)
+            self._best = {}
+
+    def _stand_table(self, composition):
+        """
+        Returns a list giving the value of standing on each total up to the
+        bust total, against the dealer drawing from the composition.
+        """
+        odds = self.solver.odds
+        probs, _ = odds._distribution(self.up, composition, True)
+        win = self.config.normal_pay
+        bust_prob = probs[-1]
+        table = []
+        for total in range(self.bust_total + 1):
+            ev = bust_prob * win
+            for dealer_total, p in zip(odds.totals, probs):
+                if total > dealer_total:
+                    ev += p * win
+                elif total < dealer_total:
+                    ev -= p
+            table.append(ev)
+        return table
+
+    def stand(self, state, composition):
+        """
+        Value of standing on a hand in the given state.
+        """
+        total = Hand.state2total[state][1]
+        if total > self.bust_total:
+            return -1
+        table = self._fixed
+        if table is None:
+            table = self._cached_stand_table(composition)
+        return table[total]
+
+    def _cached_stand_table(self, composition):
+        """
+        _stand_table, kept for later queries.
+        """
+        table = self._stand_tables.get(composition)
+        if table is None:
+            table = self._stand_table(composition)
+            self._stand_tables[composition] = table
+        return table
+
+    def hit(self, state, composition):
+        """
+        Value of hitting once, then playing on optimally by hitting or
+        standing.
+        """
+        state2total = Hand.state2total
+        bust_total = self.bust_total
+        transitions = Hand.transitions[state]
+        memo = self._best
+        ev = 0
+        for value in range(1, DealerOdds.NUM_VALUES + 1):
+            count = composition[value - 1]
+            if count:
+                next_state = transitions[value]
+                if state2total[next_state][1] > bust_total:
+                    # Busting loses the bet, whatever is left in the shoe
+                    ev -= count
+                else:
+                    rest = composition[:value - 1] + (count - 1,) + \
+                        composition[value:]
+                    sub = memo.get((next_state, rest))
+                    if sub is None:
+                        sub = self.best(next_state, rest)
+                    ev += count * sub
+        return ev / sum(composition)
+
+    def best(self, state, composition):
+        """
+        Value of the better of hitting and standing.
+        """
+        key = (state, composition)
+        ev = self._best.get(key)
+        if ev is None:
+            total = Hand.state2total[state][1]
+            ev = self.stand(state, composition)
+            if total < self.bust_total:
+                ev = max(ev, self.hit(state, composition))
+            self._best[key] = ev
+        return ev
+
+    def double(self, state, composition):
+        """
+        Value of doubling the bet and taking exactly one more card.
+        """
+        num_cards = sum(composition)
+        transitions = Hand.transitions[state]
+        ev = 0
+        for value in range(1, DealerOdds.NUM_VALUES + 1):
+            count = composition[value - 1]
+            if count:
+                ev += count / num_cards * self.stand(
+                    transitions[value], DealerOdds.remove(composition, value))
+        return 2 * ev
+
+    def split(self, pair_value, composition):
+        """
+        Value of splitting a pair of the given value into two hands, each
+        drawing its second card and then playing on.
+        """
+        config = self.config
+        start = Hand.transitions[Hand.EMPTY_STATE][pair_value]
+        num_cards = sum(composition)
+        ev = 0
+        for value in range(1, DealerOdds.NUM_VALUES + 1):
+            count = composition[value - 1]
+            if not count:
+                continue
+            state = Hand.transitions[start][value]
+            rest = DealerOdds.remove(composition, value)
+            total = Hand.state2total[state][1]
+            if total == config.blackjack_value and \
+                    not config.natural_blackjack_only:
+                hand_ev = config.blackjack_pay
+            else:
+                hand_ev = self.best(state, rest)
+                if config.double_after_split:
+                    hand_ev = max(hand_ev, self.double(state, rest))
+            ev += count / num_cards * hand_ev
+        return 2 * ev
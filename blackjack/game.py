@@ -1,14 +1,14 @@
 from blackjack.deck import Deck
 from blackjack.card import Card
+from blackjack.game_log import GameLog
+from blackjack.player import TrustedPlayer
+from blackjack.profiler import GameProfiler
+from blackjack.rng import make_rng
 
 
 class Game:
     ############################ Define constants ############################
 
-    # Special card to be inserted at the position of reshuffle_threshold
-    # Must not be present otherwise in the play deck
-    cut_card = Card(Card.LITTLE_JOKER)
-
     # Assign value to each card rank other than Ace
     rank2value = {
         Card.NUM_2: 2,
@@ -25,35 +25,615 @@ class Game:
         Card.KING: 10,
     }
 
+    # Seat number of the dealer. Players are seated from 1 onwards.
+    dealer_seat = 0
+
+    # Most players a table seats
+    max_seats = 7
+
+    # The dealer draws until reaching at least this total
+    dealer_stand_total = 17
+
     ##########################################################################
 
-    def __init__(self, game_config):
+    def __init__(self, game_config, players=(), deck_class=Deck, rng=None,
+                 log=None, profiler=None):
         """
         Initializes game.
 
         Params:
             game_config (GameConfig): Config for the game.
                 Req: None
+            players (iterable of Player): The players sitting at the table,
+                in seat order. The player at index i sits in seat i + 1.
+                Req: at most Game.max_seats players
+            deck_class (type): The class of the play deck, e.g. Deck or
+                ArrayDeck.
+                Req: deck_class supports the draw, set_cut, reshuffle,
+                    reshuffle_due and len interface of Deck, and takes an
+                    rng keyword
+            rng (None, int or random.Random): Generator for all randomness
+                of the game, or a seed for one. None uses game_config.seed.
+                Req: rng is None, a random.Random, or an int >= 0
+            log (GameLog or None): Log to write every event of the game to.
+                The game does not close it.
+                Req: None
+            profiler (GameProfiler or None): Profiler to record the time
+                spent in each phase of a round and in each player method
+                called back. None turns profiling off.
+                Req: None
         """
 
+        # Deferred because dealer.py and hand.py import this module
+        from blackjack.dealer import Dealer
+
         self.config = game_config
-        self.deck = Game._prepare_deck(
-            self.config.num_decks, self.config.reshuffle_threshold
-        )
+        self.deck_class = deck_class
+        self.rng = make_rng(game_config.seed if rng is None else rng)
+        self.log = log
+        # Number of rounds played so far, which numbers the current round
+        self.round_num = 0
+        self.profiler = profiler
+        self.players = list(players)
+        if len(self.players) > Game.max_seats:
+            raise AssertionError(
+                f'A table seats at most {Game.max_seats} players.')
+        for p in self.players:
+            p.sit_down(self.config)
+        # The players as called back during play: through their unchecked
+        # methods, and timed when profiling
+        self._seats = [Game._trusted(p) for p in self.players]
+        if profiler is not None:
+            self._seats = [profiler.wrap_player(seat, type(p).__name__)
+                           for p, seat in zip(self.players, self._seats)]
+
+        # (card, seat) of every card shown this round, and how many of them
+        # each player has observed. Players are shown the cards in batches,
+        # just before they act, rather than each card as it is dealt.
+        self._shown = []
+        self._observed = [0] * len(self.players)
+        self._observers = [Game._card_observer(p, seat)
+                           for p, seat in zip(self.players, self._seats)]
+
+        # The play deck, built by the first shuffle and reused by every
+        # reshuffle after that, and the cards drawn from it this round
+        self.deck = None
+        self._dealt = []
+        self._new_deck()
+
+        # Per-seat amount wagered and net result of the last round, in the
+        # same order as self.players
+        self.wagers = [0] * len(self.players)
+        self.results = [0] * len(self.players)
+
+        # Round state, allocated once and reused by every round. Seat i holds
+        # the bet and the hand of each of its hands in _bets[i] and
+        # _hands[i], in play order.
+        self.dealer = Dealer(game_config)
+        self.dealer_hand = self.dealer.hand
+        self._active = []
+        self._bets = [[] for _ in self.players]
+        self._hands = [[] for _ in self.players]
+        self._payouts = [[] for _ in self.players]
+        self._insured = [0] * len(self.players)
+        self._surrendered = [False] * len(self.players)
 
     @classmethod
-    def _prepare_deck(cls, num_decks, reshuffle_threshold):
+    def _prepare_deck(cls, num_decks, reshuffle_threshold, deck_class=Deck,
+                      rng=None, deck=None, held=()):
         """
-        Prepares a fresh deck of cards in self.deck
+        Prepares a freshly shuffled deck of cards, with the cut in place.
 
         Params:
             num_decks (int): Number of full decks to include in the play deck.
                 Req: num_decks > 0
 
-            reshuffle_threshold (int or float): The threshold at which to
-                insert the special cut card signaling the time to reshuffle.
+            reshuffle_threshold (int or float): The share of the deck below
+                the cut, which signals the time to reshuffle.
                 Req: 0 <= reshuffle_threshold <= 1
+
+            deck_class (type): The class of the play deck.
+                Req: deck_class supports the draw, set_cut, reshuffle,
+                    reshuffle_due and len interface of Deck, and takes an
+                    rng keyword
+
+            rng (None, int or random.Random): Generator to shuffle with.
+                Req: None
+
+            deck (deck_class or None): A deck to reshuffle in place and
+                return, instead of building a new one. It keeps its own
+                generator, and num_decks and rng are ignored.
+                Req: None
+
+            held (iterable of Card): Cards left out of a reshuffled deck,
+                as for Deck.reshuffle.
+                Req: held is empty if deck is None
         """
-        d = Deck(num_full_decks=num_decks)
-        d.insert(int(reshuffle_threshold * len(d)), Game.cut_card)
+        if deck is None:
+            d = deck_class(num_full_decks=num_decks, rng=rng)
+        else:
+            d = deck
+            d.reshuffle(held)
+        d.set_cut(int(reshuffle_threshold * len(d)))
         return d
+
+    @property
+    def reshuffle_due(self):
+        """
+        True once the cut has come up; the deck is reshuffled before the
+        next round.
+        """
+        return self.deck.reshuffle_due
+
+    @classmethod
+    def _card_observer(cls, player, seat):
+        """
+        Gives the method to show a batch of cards to a player.
+
+        Params:
+            player (Player): The player.
+                Req: None
+            seat (Player): The player as called back during play, e.g. timed
+                by a profiler.
+                Req: None
+
+        Returns (callable):
+            -> seat.observe_cards, or if the player only implements
+                observe_card themselves, a function passing each card of a
+                batch on to seat.observe_card.
+        """
+        if Game._defined_below(type(player), 'observe_cards', 'observe_card'):
+            return seat.observe_cards
+
+        observe_card = seat.observe_card
+
+        def observe_cards(cards):
+            for c, s in cards:
+                observe_card(c, s)
+        return observe_cards
+
+    @classmethod
+    def _trusted(cls, player):
+        """
+        Gives the player as the game calls them back, through the unchecked
+        versions of their methods.
+
+        An unchecked version is skipped if the player's class overrides the
+        checked method below the class that declares it, as the override
+        would otherwise never be called.
+
+        Params:
+            player (Player): The player.
+                Req: None
+
+        Returns:
+            -> (TrustedPlayer) if the player has unchecked methods to call
+            -> (Player) the player itself otherwise
+        """
+        player_class = type(player)
+        methods = {
+            method: unchecked for method, unchecked in
+            getattr(player_class, 'unchecked_methods', {}).items()
+            if Game._defined_below(player_class, unchecked, method)}
+        return TrustedPlayer(player, methods) if methods else player
+
+    @classmethod
+    def _defined_below(cls, player_class, name, other):
+        """
+        Returns True iff player_class has an attribute name, defined in the
+        same class as its attribute other or in a subclass of that one.
+        """
+        mro = player_class.__mro__
+        below = [k for k, c in enumerate(mro) if name in vars(c)]
+        above = [k for k, c in enumerate(mro) if other in vars(c)]
+        return bool(below) and (not above or below[0] <= above[0])
+
+    def _draw(self):
+        """
+        Draws the next playable card from the deck.
+
+        Once the cut comes up, the deck schedules a reshuffle for the end of
+        the round. If the deck runs out in the middle of a round, it is
+        reshuffled right away from the discards, leaving out the cards still
+        in play this round.
+
+        Returns:
+            c (Card)
+        """
+        c = self.deck.draw()
+        if c is None:
+            self._new_deck(self._dealt)
+            c = self.deck.draw()
+        self._dealt.append(c)
+        return c
+
+    def _new_deck(self, held=()):
+        """
+        Reshuffles the full shoe into the play deck, or builds the play deck
+        the first time, and tells every player.
+
+        Params:
+            held (list of Card): Cards in play, left out of the new shoe.
+                Req: empty unless reshuffling in the middle of a round
+        """
+        profiler = self.profiler
+        if profiler is not None:
+            start = profiler.clock()
+        config = self.config
+        self.deck = Game._prepare_deck(
+            config.num_decks, config.reshuffle_threshold, self.deck_class,
+            self.rng, self.deck, held
+        )
+        # Cards of the old shoe are observed before the shuffle. The ones
+        # shown this round are still in play, out of the new shoe, so they
+        # are shown again after it.
+        in_play = list(self._shown) if held else ()
+        self._show_all()
+        for p in self._seats:
+            p.observe_shuffle()
+        self._shown.extend(in_play)
+        if self.log is not None:
+            self.log.write(self.round_num, GameLog.SHUFFLE,
+                           amount=len(self.deck))
+        if profiler is not None:
+            profiler.add(GameProfiler.SHUFFLE, profiler.clock() - start)
+
+    def _deal(self, hand, seat, h=0):
+        """
+        Deals the next card face up to a hand.
+
+        Params:
+            hand (Hand): The hand to add the card to.
+                Req: None
+            seat (int): The seat holding the hand.
+                Req: seat >= 0
+            h (int): Index of the hand within the seat.
+                Req: h >= 0
+        """
+        profiler = self.profiler
+        if profiler is not None:
+            start = profiler.clock()
+        c = self._draw()
+        hand.add(c)
+        self._shown.append((c, seat))
+        if self.log is not None:
+            self.log.write(self.round_num, GameLog.DEAL, seat, h, c.code)
+        if profiler is not None:
+            profiler.add(GameProfiler.DEAL, profiler.clock() - start)
+
+    def _decide(self, i, h, decision, amount=0):
+        """
+        Logs a decision by the player at index i for their hand h.
+        """
+        if self.log is not None:
+            self.log.write(self.round_num, GameLog.DECISION, i + 1, h,
+                           decision, amount)
+
+    def _broadcast(self, card, seat):
+        """
+        Shows a card dealt to some seat to every player at the table. The
+        players observe it with the next batch shown to them.
+
+        Params:
+            card (Card): The card dealt.
+                Req: None
+            seat (int): The seat receiving the card.
+                Req: seat >= 0
+        """
+        self._shown.append((card, seat))
+
+    def _show(self, i):
+        """
+        Lets the player at index i observe every card shown since they last
+        did, in one batch. Called before each decision of the player.
+        """
+        shown = self._shown
+        k = self._observed[i]
+        if k < len(shown):
+            self._observers[i](shown[k:] if k else shown)
+            self._observed[i] = len(shown)
+
+    def _show_all(self):
+        """
+        Lets every player observe the cards shown since they last did, and
+        starts a new batch.
+        """
+        shown = self._shown
+        if not shown:
+            return
+        n = len(shown)
+        observed = self._observed
+        for i, observe in enumerate(self._observers):
+            k = observed[i]
+            if k < n:
+                observe(shown[k:] if k else shown)
+            observed[i] = 0
+        shown.clear()
+
+    def _is_natural(self, hand):
+        """
+        Returns True iff the hand is a natural blackjack.
+        """
+        return len(hand) == self.config.init_hand_size \
+            and hand.total[1] == self.config.blackjack_value
+
+    def play_round(self):
+        """
+        Plays one round with every player at the table.
+
+        Players bet and are dealt their initial hands. If the dealer shows an
+        Ace, players may insure against a dealer natural, which the dealer
+        then checks for. Players may surrender before (early) or after (late)
+        the check if the config allows it. Otherwise each hand is played in
+        turn: pairs may be split up to config.max_hands hands, two-card hands
+        may be doubled, and hands hit until they stand, reach the blackjack
+        value or bust. The dealer then plays out their hand as the Dealer
+        does for the config (S17 or H17), and every hand is paid out.
+
+        The dealer hand and the per-seat bet and payout lists are reused from
+        round to round rather than reallocated.
+
+        Returns (list of int or float):
+            results -> the net result of the round for each player, in the
+                order of self.players. Players who did not bet get 0. The
+                list is reused by the next round.
+        """
+        profiler = self.profiler
+        if profiler is not None:
+            start = profiler.clock()
+        config = self.config
+        log = self.log
+        round_num = self.round_num
+        if self.deck.reshuffle_due:
+            self._new_deck()
+        self._dealt.clear()
+
+        players = self._seats
+        wagers = self.wagers
+        results = self.results
+        active = self._active
+        active.clear()
+        for i, p in enumerate(players):
+            bet = p.place_bet()
+            wagers[i] = bet
+            results[i] = 0
+            self._insured[i] = 0
+            self._surrendered[i] = False
+            bets = self._bets[i]
+            bets.clear()
+            if bet > 0:
+                bets.append(bet)
+                active.append(i)
+                if log is not None:
+                    log.write(round_num, GameLog.BET, i + 1, amount=bet)
+
+        # Deal initial hands, dealer last. Only the first dealer card is shown.
+        dealer_hand = self.dealer_hand.clear()
+        for n in range(config.init_hand_size):
+            for i in active:
+                self._deal(players[i].curr_hand(), i + 1)
+            c = self._draw()
+            dealer_hand.add(c)
+            if n == 0:
+                self._broadcast(c, Game.dealer_seat)
+            if log is not None:
+                log.write(round_num, GameLog.HOLE if n else GameLog.UPCARD,
+                          Game.dealer_seat, 0, c.code)
+        for i in active:
+            hands = self._hands[i]
+            hands.clear()
+            hands.append(players[i].curr_hand())
+
+        if config.early_surrender:
+            self._offer_surrender()
+
+        if config.insurance and len(dealer_hand) and \
+                dealer_hand[0].rank == Card.ACE:
+            for i in active:
+                p = players[i]
+                if self._surrendered[i]:
+                    continue
+                self._show(i)
+                if p.decide_insurance():
+                    stake = wagers[i] / 2
+                    self._insured[i] = stake
+                    wagers[i] += stake
+                    self._decide(i, 0, GameLog.INSURE, stake)
+
+        # Dealer checks for a natural. Players only act if there is none.
+        dealer_natural = self._is_natural(dealer_hand)
+        live = False
+        if not dealer_natural:
+            if config.late_surrender:
+                self._offer_surrender()
+            for i in active:
+                if not self._surrendered[i] and self._play_seat(i):
+                    live = True
+
+        # Dealer reveals and plays if some hand still depends on the outcome
+        for k in range(1, len(dealer_hand)):
+            self._broadcast(dealer_hand[k], Game.dealer_seat)
+        if live:
+            if profiler is not None:
+                dealer_start = profiler.clock()
+            self.dealer.play(self._deal)
+            if profiler is not None:
+                profiler.add(GameProfiler.DEALER,
+                             profiler.clock() - dealer_start)
+
+        self._show_all()
+        for i in active:
+            self._settle(i, dealer_natural)
+        self.round_num += 1
+        if profiler is not None:
+            profiler.add(GameProfiler.ROUND, profiler.clock() - start)
+        return results
+
+    def run(self, num_rounds=None):
+        """
+        Plays rounds until num_rounds have been played, or until no player
+        places a bet.
+
+        Params:
+            num_rounds (int or None): Number of rounds to play. None plays
+                config.max_turns rounds.
+                Req: num_rounds is None or num_rounds >= 0
+
+        Returns (int):
+            -> The number of rounds in which some player placed a bet.
+        """
+
+        """ Param check """
+        assert num_rounds is None or \
+            (type(num_rounds) is int and num_rounds >= 0)
+
+        if num_rounds is None:
+            num_rounds = self.config.max_turns
+        played = 0
+        for _ in range(num_rounds):
+            self.play_round()
+            if not self._active:
+                break
+            played += 1
+        return played
+
+    def _offer_surrender(self):
+        """
+        Asks every player still holding their initial hand whether to
+        surrender it. Naturals are never offered.
+        """
+        players = self._seats
+        for i in self._active:
+            if self._surrendered[i]:
+                continue
+            p = players[i]
+            if self._is_natural(p.curr_hand()):
+                continue
+            self._show(i)
+            if p.decide_surrender():
+                self._surrendered[i] = True
+                self._decide(i, 0, GameLog.SURRENDER)
+
+    def _play_seat(self, i):
+        """
+        Plays every hand of the player at index i, splitting, doubling and
+        hitting as the player decides.
+
+        Returns (bool):
+            -> True if some hand of the player is neither bust nor a natural,
+                so that the dealer must play out their hand.
+        """
+        config = self.config
+        p = self._seats[i]
+        seat = i + 1
+        bets = self._bets[i]
+        bust_total = config.blackjack_value
+        hand = p.curr_hand()
+        if self._is_natural(hand):
+            return False
+
+        hands = self._hands[i]
+        hands.clear()
+        live = False
+        h = 0
+        while hand is not None:
+            # A hand created by splitting is dealt its second card first
+            if len(hand) == 1:
+                self._deal(hand, seat, h)
+            self._show(i)
+
+            while len(hand) == 2 and hand.uniform_value is not None \
+                    and len(bets) < config.max_hands and p.decide_split():
+                # The player keeps the first card in the current hand and
+                # moves the second to a new hand right after it
+                bets.insert(h + 1, bets[h])
+                self.wagers[i] += bets[h]
+                self._decide(i, h, GameLog.SPLIT, bets[h])
+                hand = p.curr_hand()
+                self._deal(hand, seat, h)
+                self._show(i)
+
+            split = len(bets) > 1
+            if len(hand) == 2 and hand.total[1] < bust_total and \
+                    (not split or config.double_after_split) and \
+                    p.decide_double():
+                self.wagers[i] += bets[h]
+                self._decide(i, h, GameLog.DOUBLE, bets[h])
+                bets[h] *= 2
+                self._deal(hand, seat, h)
+            else:
+                while hand.total[1] < bust_total:
+                    self._show(i)
+                    if not p.decide_hit():
+                        self._decide(i, h, GameLog.STAND)
+                        break
+                    self._decide(i, h, GameLog.HIT)
+                    self._deal(hand, seat, h)
+
+            if hand.total[1] <= bust_total and not (
+                    split and not config.natural_blackjack_only
+                    and self._is_natural(hand)):
+                live = True
+            hands.append(hand)
+            p.next_hand()
+            hand = p.curr_hand()
+            h += 1
+        return live
+
+    def _settle(self, i, dealer_natural):
+        """
+        Pays out every hand and any insurance of the player at index i, and
+        records their net result in self.results.
+        """
+        profiler = self.profiler
+        if profiler is not None:
+            start = profiler.clock()
+        config = self.config
+        p = self._seats[i]
+        bets = self._bets[i]
+        payouts = self._payouts[i]
+        payouts.clear()
+        paid = 0
+
+        stake = self._insured[i]
+        if stake:
+            insurance = stake * 3 if dealer_natural else 0
+            p.insurance_payout(insurance)
+            paid += insurance
+            if self.log is not None:
+                self.log.write(self.round_num, GameLog.INSURANCE, i + 1,
+                               amount=insurance)
+
+        if self._surrendered[i]:
+            payouts.append(bets[0] / 2)
+        else:
+            bust_total = config.blackjack_value
+            dealer_total = self.dealer_hand.total[1]
+            split = len(bets) > 1
+            blackjack_pays = not (split and config.natural_blackjack_only)
+            for bet, hand in zip(bets, self._hands[i]):
+                total = hand.total[1]
+                natural = blackjack_pays and self._is_natural(hand)
+                if total > bust_total:
+                    payout = 0
+                elif dealer_natural:
+                    payout = bet if natural else 0
+                elif natural:
+                    payout = bet * (1 + config.blackjack_pay)
+                elif dealer_total > bust_total or total > dealer_total:
+                    payout = bet * (1 + config.normal_pay)
+                elif total == dealer_total:
+                    payout = bet
+                else:
+                    payout = 0
+                payouts.append(max(0, payout))
+
+        if self.log is not None:
+            for h, payout in enumerate(payouts):
+                self.log.write(self.round_num, GameLog.PAYOUT, i + 1, h,
+                               amount=payout)
+        paid += sum(payouts)
+        p.final_payout(payouts)
+        self.results[i] = paid - self.wagers[i]
+        if profiler is not None:
+            profiler.add(GameProfiler.PAYOUT, profiler.clock() - start)
@@ -18,6 +18,8 @@ class GameConfig:
         blackjack_value=21,
         max_turns=300,
         init_hand_size=2,
+        seed=None,
+        hit_soft_17=False,
     ):
         """
         Config for a Blackjack game.
@@ -31,13 +33,12 @@ class GameConfig:
             num_decks (int): Number of full decks to include in this game.
                 Req: num_decks > 0
 
-            reshuffle_threshold (int or float): A special cut card will be
-                inserted at this proportion in the playing deck. If the cut
-                card comes up, that means the proportion of cards left in the
-                deck had hit the reshuffle threshold, and the dealer will
-                reshuffle the deck after the current round. A value of 0 will
-                put the cut card in the bottom of the deck, and a value of 1
-                will put it on top.
+            reshuffle_threshold (int or float): The cut is placed at this
+                proportion in the playing deck. If the cut comes up, that
+                means the proportion of cards left in the deck had hit the
+                reshuffle threshold, and the dealer will reshuffle the deck
+                after the current round. A value of 0 will put the cut at the
+                bottom of the deck, and a value of 1 will put it on top.
                 Req: 0 <= reshuffle_threshold <= 1
 
             double_after_split (bool): Whether a player is allowed to double
@@ -104,6 +105,15 @@ class GameConfig:
             init_hand_size (int): The Number of cards each player starts with
                 in a hand
                 Req: init_hand_size >= 0
+
+            seed (int or None): Seed for all randomness of a game played with
+                this config, so that the game can be replayed exactly. None
+                seeds each game from fresh OS entropy.
+                Req: seed is None or seed >= 0
+
+            hit_soft_17 (bool): Whether the dealer hits a soft 17 (H17)
+                rather than standing on it (S17)
+                Req: None
         """
 
         """ Init param check """
@@ -164,6 +174,12 @@ class GameConfig:
         assert type(init_hand_size) is int
         assert init_hand_size >= 0
 
+        # seed should be None or non-negative int
+        assert seed is None or (type(seed) is int and seed >= 0)
+
+        # hit_soft_17 should be bool
+        assert type(hit_soft_17) is bool
+
         """ Store values """
 
         self.num_decks = num_decks
@@ -182,3 +198,5 @@ class GameConfig:
         self.blackjack_value = blackjack_value
         self.max_turns = max_turns
         self.init_hand_size = init_hand_size
+        self.seed = seed
+        self.hit_soft_17 = hit_soft_17
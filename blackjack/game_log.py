@@ -0,0 +1,142 @@
+import gzip
+import struct
+
+
+class GameLog:
+
+    ############################ Define constants ############################
+
+    # Every file starts with this header: magic bytes, format version and
+    # record size, padded to the size of one record
+    MAGIC = b'BJLG'
+    VERSION = 1
+    header = struct.Struct('<4sHH8x')
+
+    # Every event is one fixed-width record: round number, event, seat, hand
+    # index, value (a card code or decision) and amount
+    record = struct.Struct('<IBBBBd')
+
+    # Events
+    SHUFFLE = 0     # A fresh shoe; amount is its number of cards
+    BET = 1         # A player bets amount
+    DEAL = 2        # value is the code of a card dealt to seat and hand
+    UPCARD = 3      # value is the code of the dealer upcard
+    HOLE = 4        # value is the code of the dealer hole card
+    DECISION = 5    # value is the decision; amount is any extra bet
+    INSURANCE = 6   # A player is paid amount for their insurance
+    PAYOUT = 7      # A player is paid amount for a hand
+    events = (SHUFFLE, BET, DEAL, UPCARD, HOLE, DECISION, INSURANCE, PAYOUT)
+
+    # Decisions
+    STAND = 0
+    HIT = 1
+    DOUBLE = 2
+    SPLIT = 3
+    SURRENDER = 4
+    INSURE = 5
+    decisions = (STAND, HIT, DOUBLE, SPLIT, SURRENDER, INSURE)
+
+    ##########################################################################
+
+    def __init__(self, path, batch_size=4096, compress=False):
+        """
+        Streams the events of a game to a binary file.
+
+        Records are packed into a fixed buffer of batch_size records, which
+        is written out whenever it fills up, so memory use stays the same
+        however long the game runs.
+
+        Params:
+            path (str): Path of the log file. It is overwritten.
+                Req: None
+            batch_size (int): Number of records buffered between writes.
+                Req: batch_size > 0
+            compress (bool): Whether to gzip the file. Compressed logs are
+                smaller but cannot be memory-mapped.
+                Req: None
+        """
+
+        """ Init param check """
+        assert type(batch_size) is int and batch_size > 0
+        assert type(compress) is bool
+
+        self.path = path
+        self.compress = compress
+        # The buffer below does the batching, so plain files are unbuffered
+        self._file = gzip.open(path, 'wb', compresslevel=1) if compress \
+            else open(path, 'wb', buffering=0)
+        self._file.write(GameLog.header.pack(
+            GameLog.MAGIC, GameLog.VERSION, GameLog.record.size))
+
+        self._buffer = bytearray(batch_size * GameLog.record.size)
+        self._pack_into = GameLog.record.pack_into
+        self._size = GameLog.record.size
+        self._offset = 0
+        self._end = len(self._buffer)
+        self._written = 0
+
+    def write(self, round_num, event, seat=0, hand=0, value=0, amount=0):
+        """
+        Appends one event to the log.
+
+        Params:
+            round_num (int): The round the event belongs to.
+                Req: 0 <= round_num < 2 ** 32
+            event (int): One of GameLog.events.
+                Req: None
+            seat (int): The seat concerned, with the dealer in seat 0.
+                Req: 0 <= seat < 256
+            hand (int): Index of the hand concerned within the seat.
+                Req: 0 <= hand < 256
+            value (int): Card code or decision, depending on the event.
+                Req: 0 <= value < 256
+            amount (int or float): Amount of money, depending on the event.
+                Req: None
+        """
+        offset = self._offset
+        self._pack_into(self._buffer, offset, round_num, event, seat, hand,
+                        value, amount)
+        offset += self._size
+        if offset == self._end:
+            self._file.write(self._buffer)
+            self._written += self._end
+            offset = 0
+        self._offset = offset
+
+    def flush(self):
+        """
+        Writes out all buffered records.
+        """
+        if self._offset:
+            self._file.write(memoryview(self._buffer)[:self._offset])
+            self._written += self._offset
+            self._offset = 0
+        self._file.flush()
+
+    def close(self):
+        """
+        Writes out all buffered records and closes the file.
+        """
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+    @property
+    def num_records(self):
+        """
+        Number of records written so far, including buffered ones.
+        """
+        return (self._written + self._offset) // GameLog.record.size
+
+    @property
+    def closed(self):
+        return self._file.closed
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __repr__(self):
+        return f'GameLog({self.path}, {self.num_records} records)'
@@ -0,0 +1,268 @@
+from blackjack.card import Card
+from blackjack.game_log import GameLog
+import numpy as np
+import os
+
+
+class GameLogReader:
+
+    ############################ Define constants ############################
+
+    # Layout of one record, matching GameLog.record
+    dtype = np.dtype([
+        ('round', '<u4'),
+        ('event', 'u1'),
+        ('seat', 'u1'),
+        ('hand', 'u1'),
+        ('value', 'u1'),
+        ('amount', '<f8'),
+    ])
+
+    # Suffix of the file the round index is persisted to, next to the log
+    index_suffix = '.idx.npz'
+
+    ##########################################################################
+
+    def __init__(self, path, index_path=None):
+        """
+        Gives random access to the records of a log written by GameLog.
+
+        The log is memory-mapped rather than read, so opening it costs the
+        same however large it is, and only the pages that are looked at are
+        ever loaded. The offset of each round, the position of each upcard
+        and the positions of the records of each event are found the first
+        time the log is opened, and saved next to it for later readers.
+
+        Params:
+            path (str): Path of an uncompressed log file.
+                Req: the file was written by GameLog with compress=False
+            index_path (str or None): Where to persist the round index. None
+                uses path + GameLogReader.index_suffix.
+                Req: None
+        """
+        assert GameLogReader.dtype.itemsize == GameLog.record.size
+
+        with open(path, 'rb') as f:
+            head = f.read(GameLog.header.size)
+        if len(head) < GameLog.header.size:
+            raise AssertionError('Not a game log.')
+        magic, version, record_size = GameLog.header.unpack(head)
+        if magic != GameLog.MAGIC:
+            raise AssertionError('Not a game log, or a compressed one.')
+        if version != GameLog.VERSION or \
+                record_size != GameLogReader.dtype.itemsize:
+            raise AssertionError('Unsupported game log version.')
+
+        self.path = path
+        self.index_path = path + GameLogReader.index_suffix \
+            if index_path is None else index_path
+
+        # Ignore a trailing partial record, as left by a writer still running
+        stat = os.stat(path)
+        self._mtime = stat.st_mtime_ns
+        size = stat.st_size - GameLog.header.size
+        num_records = size // record_size
+        if num_records:
+            self.records = np.memmap(path, dtype=GameLogReader.dtype,
+                                     mode='r', offset=GameLog.header.size,
+                                     shape=(num_records,))
+        else:
+            self.records = np.zeros(0, dtype=GameLogReader.dtype)
+
+        self.offsets, self.upcard_positions, self.event_positions, \
+            self.event_offsets = self._load_index()
+
+    def _load_index(self):
+        """
+        Loads the persisted round index if it matches the log, or else
+        builds and persists it.
+
+        Returns (tuple of numpy.ndarray):
+            (offsets, upcard_positions, event_positions, event_offsets)
+                -> records of round n are at offsets[n]:offsets[n + 1], and
+                its upcard record is at upcard_positions[n], or -1 if there
+                is none. The positions of the records of event e, in order,
+                are event_positions[event_offsets[e]:event_offsets[e + 1]].
+        """
+        names = ('offsets', 'upcard_positions', 'event_positions',
+                 'event_offsets')
+        num_records = len(self.records)
+        try:
+            with np.load(self.index_path) as index:
+                if int(index['num_records']) == num_records and \
+                        int(index['mtime']) == self._mtime:
+                    return tuple(index[name] for name in names)
+        except (OSError, KeyError, ValueError):
+            pass
+
+        rounds = self.records['round']
+        num_rounds = int(rounds[-1]) + 1 if num_records else 0
+        # Rounds are written in order, so each offset is a binary search
+        offsets = np.searchsorted(
+            rounds, np.arange(num_rounds + 1)).astype(np.int64)
+        upcard_positions = np.full(num_rounds, -1, dtype=np.int64)
+        positions = np.flatnonzero(self.records['event'] == GameLog.UPCARD)
+        upcard_positions[rounds[positions]] = positions
+
+        # A stable sort groups the records by event and keeps them in order
+        events = self.records['event']
+        event_positions = np.argsort(events, kind='stable').astype(np.int64)
+        event_offsets = np.zeros(len(GameLog.events) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(events, minlength=len(GameLog.events))
+                  [:len(GameLog.events)], out=event_offsets[1:])
+
+        try:
+            # Write through a file object so np.savez keeps the name as is
+            with open(self.index_path, 'wb') as f:
+                np.savez(f, num_records=num_records, mtime=self._mtime,
+                         offsets=offsets,
+                         upcard_positions=upcard_positions,
+                         event_positions=event_positions,
+                         event_offsets=event_offsets)
+        except OSError:
+            # The index is only a cache
+            pass
+        return offsets, upcard_positions, event_positions, event_offsets
+
+    @property
+    def num_rounds(self):
+        """
+        Number of rounds in the log.
+        """
+        return len(self.offsets) - 1
+
+    def __len__(self):
+        """
+        Number of records in the log.
+        """
+        return len(self.records)
+
+    def field(self, name):
+        """
+        Gives one field of every record, as a view into the mapped file.
+
+        Params:
+            name (str): One of the names in GameLogReader.dtype.
+                Req: None
+
+        Returns (numpy.ndarray):
+            -> field[i] is the field of record i
+        """
+        if name not in GameLogReader.dtype.names:
+            raise AssertionError(f'No field named {name}.')
+        return self.records[name]
+
+    def round(self, n):
+        """
+        Gives the records of one round, as a view into the mapped file.
+
+        Params:
+            n (int): The round number.
+                Req: 0 <= n < self.num_rounds
+        """
+        if not 0 <= n < self.num_rounds:
+            raise AssertionError('No such round.')
+        return self.records[self.offsets[n]:self.offsets[n + 1]]
+
+    def positions(self, event):
+        """
+        Gives the positions of the records of one kind of event, as a view
+        into the event index.
+
+        Params:
+            event (int): One of GameLog.events.
+                Req: None
+
+        Returns (numpy.ndarray):
+            -> The record positions, in increasing order.
+        """
+        if event not in GameLog.events:
+            raise AssertionError('Invalid event.')
+        return self.event_positions[
+            self.event_offsets[event]:self.event_offsets[event + 1]]
+
+    def events(self, event, seat=None):
+        """
+        Gives the records of one kind of event, in order.
+
+        The records are gathered through the event index, so only they are
+        read from the file. They are not contiguous in it, so the result is
+        a copy rather than a view.
+
+        Params:
+            event (int): One of GameLog.events.
+                Req: None
+            seat (int or None): Only give the records of this seat. None
+                gives those of all seats.
+                Req: None
+
+        Returns (numpy.ndarray):
+            -> A copy of the matching records.
+        """
+        records = self.records[self.positions(event)]
+        if seat is not None:
+            records = records[records['seat'] == seat]
+        return records
+
+    def bets(self, seat=None):
+        """
+        Gives a copy of the BET records, optionally of one seat only.
+        """
+        return self.events(GameLog.BET, seat)
+
+    def payouts(self, seat=None):
+        """
+        Gives a copy of the PAYOUT records, optionally of one seat only.
+        """
+        return self.events(GameLog.PAYOUT, seat)
+
+    def upcards(self):
+        """
+        Gives the code of the dealer upcard of each round, or -1 for rounds
+        without one. Only reads the upcard records.
+
+        Returns (numpy.ndarray):
+            -> upcards[n] is the Card.code of the upcard of round n
+        """
+        codes = np.full(self.num_rounds, -1, dtype=np.int16)
+        found = self.upcard_positions >= 0
+        codes[found] = self.records['value'][self.upcard_positions[found]]
+        return codes
+
+    def rounds_with_upcard(self, rank):
+        """
+        Gives the rounds in which the dealer showed some rank.
+
+        Params:
+            rank (Card.Constants): A rank in Card.ranks, e.g. Card.ACE.
+                Req: None
+
+        Returns (numpy.ndarray):
+            -> The round numbers, in increasing order.
+        """
+        if rank not in Card.ranks:
+            raise AssertionError('Invalid rank.')
+        codes = [c.code for c in Card.cards if c.rank == rank]
+        return np.flatnonzero(np.isin(self.upcards(), codes))
+
+    def close(self):
+        """
+        Drops this reader's mapping of the log file. Views taken from it
+        keep the file mapped until they are dropped too.
+        """
+        self.records = np.zeros(0, dtype=GameLogReader.dtype)
+        self.offsets = np.zeros(1, dtype=np.int64)
+        self.upcard_positions = np.zeros(0, dtype=np.int64)
+        self.event_positions = np.zeros(0, dtype=np.int64)
+        self.event_offsets = np.zeros(len(GameLog.events) + 1,
+                                      dtype=np.int64)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __repr__(self):
+        return f'GameLogReader({self.path}, {len(self)} records, ' \
+            f'{self.num_rounds} rounds)'
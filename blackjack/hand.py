@@ -4,12 +4,37 @@ from blackjack.game import Game
 
 class Hand():
 
+    # A hand is a preallocated bytearray of card codes and the number of
+    # cards in it, plus the derived fields below, and has no __dict__
+    __slots__ = ('_codes', '_size', 'state', 'total', 'uniform_value')
+
     ############################ Define constants ############################
 
+    # Number of cards a hand has room for before its array grows. Hands
+    # rarely get past 11 cards.
+    CAPACITY = 12
+
     # Indicators for soft and hard hand totals
     SOFT = 'Soft'
     HARD = 'Hard'
 
+    """ Hand state table """
+
+    # A hand's state is the int  2 * min_total + has_ace,  where min_total
+    # counts every Ace as 1 and has_ace is 1 iff the hand holds an Ace. This
+    # is all that is needed to find the total of the hand. States are
+    # tabulated for min_total up to STATE_MAX_TOTAL, the largest total a hand
+    # can reach by hitting a hand that is not yet bust.
+    STATE_MAX_TOTAL = 31
+    EMPTY_STATE = 0
+
+    # Blackjack value of each card, counting Aces as 1
+    card2value = {c: 1 if c.is_ace() else Game.rank2value[c.rank]
+                  for c in Card.cards if not c.is_joker()}
+
+    # Codes of the Aces, one per suit
+    ace_codes = tuple(c.code for c in Card.cards if c.is_ace())
+
     ##########################################################################
 
     def __init__(self, h=[]):
@@ -33,13 +58,84 @@ class Hand():
             raise AssertionError('Initialization of a hand requires a list of '
                                  'cards that can be empty.')
 
-        self.hand = h.copy()
-        num_aces, hard_total = Hand._breakdown(self.hand)
+        self._codes = bytearray(max(Hand.CAPACITY, len(h)))
+        for k, c in enumerate(h):
+            self._codes[k] = c.code
+        self._size = len(h)
+        self.state = Hand.state_of(*Hand._breakdown(h))
+        self.total = Hand._state_total(self.state)
+        self.uniform_value = Hand._get_uniform_value(h)
 
-        self.num_aces = num_aces
-        self.hard_total = hard_total
-        self.total = Hand._calc_total(num_aces, hard_total)
-        self.uniform_value = Hand._get_uniform_value(self.hand)
+    @property
+    def hand(self):
+        """
+        The cards of the hand, in the order they were added, as a new list.
+        Changing the list does not change the hand.
+        """
+        cards = Card.cards
+        return [cards[code] for code in self._codes[:self._size]]
+
+    @property
+    def codes(self):
+        """
+        The codes of the cards of the hand, in the order they were added, as
+        bytes. Card.cards[code] is the card of each code.
+        """
+        return bytes(self._codes[:self._size])
+
+    @classmethod
+    def state_of(cls, num_aces, hard_total):
+        """
+        Gives the state of a hand.
+
+        Params:
+            num_aces (int): The number of Ace cards in the hand.
+                Req: num_aces >= 0
+            hard_total (int): The sum of values of all non-Ace cards in the
+                hand.
+                Req: hard_total >= 0
+
+        Returns (int):
+            state -> 2 * (hard_total + num_aces) + (1 if num_aces else 0)
+        """
+        return 2 * (hard_total + num_aces) + (1 if num_aces else 0)
+
+    @classmethod
+    def _next_state(cls, state, value):
+        """
+        Gives the state after adding a card of the given value (Aces count
+        as 1) to a hand in the given state.
+        """
+        return (state + 2 * value) | (1 if value == 1 else 0)
+
+    @classmethod
+    def _state_total(cls, state):
+        """
+        Gives the total of a hand in the given state, in the format of
+        Hand._calc_total.
+        """
+        min_total, has_ace = divmod(state, 2)
+        if has_ace:
+            # Total of one Ace and the rest counted as hard
+            return Hand._calc_total(1, min_total - 1)
+        return Hand._calc_total(0, min_total)
+
+    @property
+    def num_aces(self):
+        """
+        The number of Ace cards in the hand, counted over its codes.
+        """
+        codes = self._codes
+        size = self._size
+        return sum(codes.count(code, 0, size) for code in Hand.ace_codes)
+
+    @property
+    def hard_total(self):
+        """
+        The sum of values of all non-Ace cards in the hand, found from the
+        state, which holds the sum with every Ace counted as 1.
+        """
+        return self.state // 2 - self.num_aces
 
     @classmethod
     def _breakdown(cls, h):
@@ -131,21 +227,109 @@ class Hand():
         Returns:
             self (Hand) after adding the card and updating data.
         """
-        self.hand.append(newcard)
-        if newcard.is_ace():
-            self.num_aces += 1
-        else:
-            self.hard_total += Game.rank2value[newcard.rank]
-        self.total = Hand._calc_total(self.num_aces, self.hard_total)
-        if self.uniform_value != None:
-            if newcard.rank != self.uniform_value:
+        size = self._size
+        try:
+            self._codes[size] = newcard.code
+        except IndexError:
+            # The hand is past its capacity
+            self._codes.append(newcard.code)
+        self._size = size + 1
+        value = Hand.card2value[newcard]
+        try:
+            state = Hand.transitions[self.state][value]
+            self.total = Hand.state2total[state]
+        except IndexError:
+            # Beyond STATE_MAX_TOTAL, only reachable by hitting a bust hand
+            state = Hand._next_state(self.state, value)
+            self.total = Hand._state_total(state)
+        self.state = state
+        uniform_value = self.uniform_value
+        if uniform_value is not None:
+            if newcard.rank != uniform_value:
                 self.uniform_value = None
-        else:
-            if len(self.hand) == 1:
-                self.uniform_value = self.hand[0].rank
+        elif size == 0:
+            self.uniform_value = newcard.rank
 
         return self
 
+    def clear(self):
+        """
+        Empties this hand in place, so that it can be reused.
+
+        Returns:
+            self (Hand) after removing all cards.
+        """
+        self._size = 0
+        self.state = Hand.EMPTY_STATE
+        self.total = Hand.state2total[Hand.EMPTY_STATE]
+        self.uniform_value = None
+        return self
+
+    def explode(self, pool=None):
+        """
+        Splits this hand into one hand per card, as when splitting a pair.
+        This hand keeps its first card, and each other card is moved to a
+        hand of its own.
+
+        Params:
+            pool (HandPool or None): Pool to take the new hands from. None
+                makes new Hand objects.
+                Req: None
+
+        Returns (list of Hand):
+            hands -> hands[k] holds the k-th card of the hand, and hands[0]
+                is self. Empty if the hand has no cards.
+        """
+        size = self._size
+        if not size:
+            return []
+        cards = Card.cards
+        codes = self._codes
+        hands = [self]
+        for k in range(1, size):
+            h = Hand() if pool is None else pool.get()
+            hands.append(h.add(cards[codes[k]]))
+        first = cards[codes[0]]
+        self.clear().add(first)
+        return hands
+
+    def __len__(self):
+        """
+        Returns (int):
+            -> The number of cards in the hand.
+        """
+        return self._size
+
+    def __getitem__(self, k):
+        """
+        Gives the card at index k of the hand, as self.hand[k] without
+        building the list.
+
+        Params:
+            k (int or slice): Index of the card, negative from the end.
+                Req: -len(self) <= k < len(self) if k is an int
+
+        Returns:
+            -> (Card) the card at index k
+            -> (list of Card) the cards in k if k is a slice
+        """
+        if isinstance(k, slice):
+            return self.hand[k]
+        size = self._size
+        if k < 0:
+            k += size
+        if not 0 <= k < size:
+            raise IndexError('Hand index out of range.')
+        return Card.cards[self._codes[k]]
+
+    def __iter__(self):
+        """
+        Iterates over the cards of the hand, in the order they were added.
+        """
+        cards = Card.cards
+        for code in self._codes[:self._size]:
+            yield cards[code]
+
     def __eq__(self, other):
         """
         Two hands are equal when they are equal in num_aces, hard_total,
@@ -153,16 +337,17 @@ class Hand():
         """
         if not isinstance(other, Hand):
             return False
-        return self.num_aces == other.num_aces\
-            and self.hard_total == other.hard_total\
-            and self.total == other.total\
-            and self.uniform_value == other.uniform_value
+        # Equal states give equal totals, and hard_total follows from the
+        # state and num_aces, so only num_aces needs the cards
+        return self.state == other.state\
+            and self.uniform_value == other.uniform_value\
+            and self.num_aces == other.num_aces
 
     def __str__(self):
         """
         Short string representation of the hand.
         """
-        return f'Hand of {len(self.hand)} cards'
+        return f'Hand of {self._size} cards'
 
     def __repr__(self):
         """
@@ -179,8 +364,64 @@ class Hand():
             where the furthest left card is first in the hand.
         """
         target = 'Hand [ '
-        for c in self.hand:
+        for c in self:
             target += str(c)
             target += ' '
         target += ']'
         return target
+
+
+""" Build the hand state table """
+
+# Total of each state, in the format of Hand._calc_total
+Hand.state2total = tuple(Hand._state_total(state)
+                         for state in range(2 * Hand.STATE_MAX_TOTAL + 2))
+
+# Hand.transitions[state][value] is the state after adding a card of the
+# given value (Aces count as 1) to a hand in the given state
+Hand.transitions = tuple(
+    tuple(Hand._next_state(state, value) if value > 0 else None
+          for value in range(11))
+    for state in range(len(Hand.state2total)))
+
+
+class HandPool:
+    def __init__(self):
+        """
+        Initializes a pool of reusable hands.
+
+        Hands taken from the pool are lent out until the pool is released,
+        which is meant to happen once per round. Released hands are cleared
+        and lent out again, so a pool only ever grows to the most hands in
+        use at once, e.g. the config's max_hands.
+        """
+        self._hands = []
+        self._used = 0
+
+    def get(self):
+        """
+        Lends out an empty hand.
+
+        Returns:
+            hand (Hand) with no cards, not lent out since the last release.
+        """
+        hands = self._hands
+        if self._used == len(hands):
+            hands.append(Hand())
+        hand = hands[self._used]
+        self._used += 1
+        return hand.clear()
+
+    def release(self):
+        """
+        Takes back every hand lent out, to be reused. The hands must no
+        longer be used by the borrowers.
+        """
+        self._used = 0
+
+    def __len__(self):
+        """
+        Returns (int):
+            -> The number of hands currently lent out.
+        """
+        return self._used
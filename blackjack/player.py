@@ -2,6 +2,17 @@ from abc import ABC, abstractmethod
 
 
 class Player(ABC):
+
+    ############################ Define constants ############################
+
+    # Unchecked versions of the methods a game calls back, as {method name:
+    # name of its unchecked version}. Game trusts itself to only call them
+    # at valid times with valid arguments, and calls the unchecked versions
+    # instead, through a TrustedPlayer. Other callers use the checked ones.
+    unchecked_methods = {}
+
+    ##########################################################################
+
     @abstractmethod
     def __init__(self, name="", bankroll=0):
         """
@@ -62,6 +73,31 @@ class Player(ABC):
         """
         pass
 
+    def observe_cards(self, cards):
+        """
+        Notifies the player of several cards being assigned, in the order
+        they were dealt. The game calls this rather than observe_card, with
+        every card dealt since the player last observed, before each of
+        their decisions and at the end of the round. By default, each card
+        is passed on to observe_card.
+
+        Params:
+            cards (list of tuple): (card, player) pairs, each as for
+                observe_card. The game reuses its buffers, so the list should
+                not be kept.
+                Req: None
+        """
+        for card, player in cards:
+            self.observe_card(card, player)
+
+    def observe_shuffle(self):
+        """
+        Notifies the player that a freshly shuffled shoe is put in play, so
+        that no card of it has been seen yet. Players that do not track the
+        cards seen may ignore it.
+        """
+        pass
+
     @abstractmethod
     def has_hand(self):
         """
@@ -123,6 +159,9 @@ class Player(ABC):
         Side Effects:
             -> Subtracts the additional bet from the bankroll if the player
                 decides to split.
+            -> If the player decides to split, the current hand keeps only its
+                first card, and a new hand holding the second card is placed
+                right after it. The game deals each of them a second card.
         """
         pass
 
@@ -184,7 +223,8 @@ class Player(ABC):
     def final_payout(self, payouts):
         """
         Gives the player payouts for their current hands, and ends the round
-        that began with the previous place_bet call.
+        that began with the previous place_bet call. The game reuses the
+        payouts list in later rounds, so it should not be kept.
 
         Params:
             payouts (int list or float list): The amount to pay out to 
@@ -219,3 +259,26 @@ class Player(ABC):
                 -> B is the player's bankroll
         """
         return f'Player({self.name}, {self.bankroll})'
+
+
+class TrustedPlayer:
+    def __init__(self, player, methods):
+        """
+        Stands in for a player at a Game, and calls the unchecked versions of
+        the given methods.
+
+        Params:
+            player (Player): The player.
+                Req: None
+            methods (dict): {method name: name of its unchecked version}.
+                Req: each unchecked version is a method of player
+        """
+        self.player = player
+        for method, unchecked in methods.items():
+            setattr(self, method, getattr(player, unchecked))
+
+    def __getattr__(self, name):
+        return getattr(self.player, name)
+
+    def __repr__(self):
+        return f'TrustedPlayer({self.player!r})'
@@ -0,0 +1,419 @@
+from blackjack.card import Card
+from blackjack.dealer_odds import DealerOdds
+from blackjack.ev_solver import EVSolver
+from blackjack.game import Game
+from blackjack.hand import Hand
+from blackjack.players.threshold_player import ThresholdPlayer
+import hashlib
+import os
+
+
+class BasicStrategyPlayer(ThresholdPlayer):
+
+    ############################ Define constants ############################
+
+    # Action codes stored in the decision table
+    STAND = 0
+    HIT = 1
+    DOUBLE = 2
+    SPLIT = 3
+    SURRENDER = 4
+    codes = (STAND, HIT, DOUBLE, SPLIT, SURRENDER)
+    _action2code = {EVSolver.STAND: STAND, EVSolver.HIT: HIT,
+                    EVSolver.DOUBLE: DOUBLE, EVSolver.SPLIT: SPLIT,
+                    EVSolver.SURRENDER: SURRENDER}
+
+    # Kinds of hand, the outermost dimension of the decision table
+    HARD = 0
+    SOFT = 1
+    PAIR = 2
+    kinds = (HARD, SOFT, PAIR)
+    NUM_KINDS = 3
+
+    # Tables already loaded in this process, by rule key
+    _tables = {}
+
+    ##########################################################################
+
+    def __init__(self, name="", bankroll=float('inf'), bet=1,
+                 cache_dir=None, counter=None):
+        """
+        Initializes basic strategy player.
+
+        The player looks up every decision in a table giving the best action
+        for each hand kind (hard, soft or pair), total and dealer upcard. The
+        table is computed with EVSolver for a full shoe when the player first
+        sits down at a game with a new rule set, and is kept in memory for
+        the rest of the process, and on disk if given a cache directory.
+
+        Params:
+            name (str): The player's name.
+                Req: None
+            bankroll (int or float): The player's starting bankroll.
+                Req: bankroll >= 0
+            bet (int or float): The constant bet player will make each round.
+                If bet is a float, it will be rounded down if the player plays
+                a game with int_bet_only enabled.
+                Req: bet >= 0
+            cache_dir (str or None): Directory of the on-disk table cache.
+                None keeps tables in memory only, so every process builds
+                its own, including each worker of simulate or sweep; pass a
+                directory to share one build between them.
+                Req: None
+            counter (CardCounter or None): A counter to keep up to date, as
+                for ThresholdPlayer.
+                Req: None
+        """
+        super().__init__(name=name, bankroll=bankroll, bet=bet,
+                         counter=counter)
+
+        """ Init param check """
+        if cache_dir is not None and not isinstance(cache_dir, str):
+            raise AssertionError('Invalid initialization parameters.')
+
+        self.cache_dir = cache_dir
+
+        # Initialize Game-Dependent Information
+        self._actions = None
+        self._fallbacks = None
+        self._width = None
+        self._upcard = None
+        self._round_bet = None
+
+    @classmethod
+    def rule_key(cls, game_config):
+        """
+        Gives the rule settings of a game config that affect the table.
+
+        Params:
+            game_config (GameConfig): The config.
+                Req: None
+
+        Returns (tuple):
+            key -> equal for configs sharing a table
+        """
+        c = game_config
+        return (c.num_decks, c.double_after_split, c.max_hands > 1,
+                c.early_surrender or c.late_surrender, c.normal_pay,
+                c.blackjack_pay, c.natural_blackjack_only, c.blackjack_value,
+                c.init_hand_size, c.hit_soft_17)
+
+    @classmethod
+    def table_index(cls, kind, total, up_value, width):
+        """
+        Gives the position of a decision in the table.
+
+        Params:
+            kind (int): One of BasicStrategyPlayer.HARD, SOFT or PAIR.
+                Req: None
+            total (int): The hand total, or the value of each card for a pair
+                (Aces count as 1).
+                Req: 0 <= total < width
+            up_value (int): Value of the dealer upcard, with Aces as 1.
+                Req: 1 <= up_value <= 10
+            width (int): Number of totals per kind, blackjack_value + 1.
+                Req: None
+        """
+        return (kind * width + total) * DealerOdds.NUM_VALUES + up_value - 1
+
+    @classmethod
+    def build_table(cls, game_config):
+        """
+        Computes the decision table for a game config.
+
+        Params:
+            game_config (GameConfig): The config.
+                Req: blackjack_value == 21
+
+        Returns (tuple of bytes): (actions, fallbacks) where
+            actions -> the best action code for each index, among all actions
+                allowed for a two-card hand
+            fallbacks -> the better of STAND and HIT for each index, for when
+                the best action is no longer allowed
+        """
+        width = game_config.blackjack_value + 1
+        size = BasicStrategyPlayer.NUM_KINDS * width * DealerOdds.NUM_VALUES
+        actions = bytearray([BasicStrategyPlayer.HIT]) * size
+        fallbacks = bytearray([BasicStrategyPlayer.HIT]) * size
+        solver = EVSolver(game_config)
+
+        # A card of each value, with Aces as 1
+        value2rank = {1: Card.ACE}
+        for rank in Card.numbers:
+            value2rank[Game.rank2value[rank]] = rank
+
+        def cards(*values, pair=False):
+            ranks = [value2rank[v] for v in values]
+            # Two different ten-valued ranks are not a pair
+            if not pair and ranks[-2:] == [Card.NUM_10, Card.NUM_10]:
+                ranks[-1] = Card.KING
+            return Hand([Card(r, Card.CLUBS) for r in ranks])
+
+        # A representative hand of each kind and total. Hard 4 and soft 12
+        # can only be dealt as pairs, and hard 21 takes three cards.
+        hands = []
+        for total in range(4, width):
+            if total <= 11:
+                hand = cards(2, total - 2)
+            elif total <= 20:
+                hand = cards(10, total - 10)
+            else:
+                hand = cards(10, 9, total - 19)
+            hands.append((BasicStrategyPlayer.HARD, total, hand))
+        for total in range(12, width):
+            hands.append((BasicStrategyPlayer.SOFT, total,
+                          cards(1, total - 11)))
+        for value in range(1, DealerOdds.NUM_VALUES + 1):
+            hands.append((BasicStrategyPlayer.PAIR, value,
+                          cards(value, value, pair=True)))
+
+        for up_value in range(1, DealerOdds.NUM_VALUES + 1):
+            upcard = Card(value2rank[up_value], Card.HEARTS)
+            for kind, total, hand in hands:
+                evs = solver.solve(hand, upcard)
+                if kind != BasicStrategyPlayer.PAIR:
+                    evs[EVSolver.SPLIT] = None
+                best = max((a for a in EVSolver.actions
+                            if evs[a] is not None), key=lambda a: evs[a])
+                if evs[EVSolver.HIT] is not None and \
+                        evs[EVSolver.HIT] > evs[EVSolver.STAND]:
+                    fallback = BasicStrategyPlayer.HIT
+                else:
+                    fallback = BasicStrategyPlayer.STAND
+                i = BasicStrategyPlayer.table_index(kind, total, up_value,
+                                                    width)
+                actions[i] = BasicStrategyPlayer._action2code[best]
+                fallbacks[i] = fallback
+
+        return bytes(actions), bytes(fallbacks)
+
+    @classmethod
+    def load_table(cls, game_config, cache_dir=None):
+        """
+        Gives the decision table for a game config, from memory, from the
+        disk cache, or by building and caching it.
+
+        Params:
+            game_config (GameConfig): The config.
+                Req: None
+            cache_dir (str or None): Directory of the disk cache. None only
+                caches the table in memory.
+                Req: None
+
+        Returns (tuple of bytes): (actions, fallbacks), as in build_table.
+        """
+        key = BasicStrategyPlayer.rule_key(game_config)
+        table = BasicStrategyPlayer._tables.get(key)
+        if table is not None:
+            return table
+
+        size = BasicStrategyPlayer.NUM_KINDS * \
+            (game_config.blackjack_value + 1) * DealerOdds.NUM_VALUES
+        if cache_dir is None:
+            table = BasicStrategyPlayer.build_table(game_config)
+            BasicStrategyPlayer._tables[key] = table
+            return table
+
+        digest = hashlib.sha1(repr(key).encode()).hexdigest()[:16]
+        path = os.path.join(cache_dir, f'basic_strategy_{digest}.bin')
+        data = None
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                data = f.read()
+            if len(data) != 2 * size:
+                data = None
+        if data is None:
+            actions, fallbacks = BasicStrategyPlayer.build_table(game_config)
+            data = actions + fallbacks
+            os.makedirs(cache_dir, exist_ok=True)
+            # Write then rename, so readers never see a partial table
+            tmp_path = f'{path}.{os.getpid()}.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+
+        table = (data[:size], data[size:])
+        BasicStrategyPlayer._tables[key] = table
+        return table
+
+    def sit_down(self, game_config):
+        """
+        Notifies the player that they are playing in a game, and loads the
+        decision table for its rules.
+
+        Params:
+            game_config (GameConfig): The game_config of the game they will
+                begin playing in.
+                Req: None
+        """
+        super().sit_down(game_config)
+        self._actions, self._fallbacks = BasicStrategyPlayer.load_table(
+            game_config, self.cache_dir)
+        self._width = game_config.blackjack_value + 1
+        self._upcard = None
+        self._round_bet = None
+
+    def place_bet(self):
+        """
+        Places the player's bet for a round, as ThresholdPlayer does, and
+        forgets the previous dealer upcard.
+        """
+        bet = super().place_bet()
+        self._round_bet = bet
+        self._upcard = None
+        return bet
+
+    def observe_card(self, card, player):
+        """
+        Notifies the player of a card being assigned to some player, and
+        remembers the dealer upcard.
+
+        Params:
+            card (Card): The card to be observed.
+                Req: None
+            player (int): The seat number of the player who received the card.
+                Req: player >= 0
+        """
+        super().observe_card(card, player)
+        if player == Game.dealer_seat and self._upcard is None \
+                and not card.is_joker():
+            self._upcard = Hand.card2value[card]
+
+    def observe_cards(self, cards):
+        """
+        Notifies the player of several cards being assigned, as observe_card
+        does for each of them.
+
+        Params:
+            cards (list of tuple): (card, player) pairs, each as for
+                observe_card.
+                Req: None
+        """
+        super().observe_cards(cards)
+        if self._upcard is None:
+            for card, player in cards:
+                if player == Game.dealer_seat and not card.is_joker():
+                    self._upcard = Hand.card2value[card]
+                    break
+
+    def _decision(self, allow_pair):
+        """
+        Looks up the table index of the current hand.
+
+        Returns:
+            if the player has a hand with an entry in the tables
+                -> (hand, i) where i indexes the decision tables
+            else
+                -> raises AssertionError
+        """
+        try:
+            hand = self._hands[self._hand_index]
+        except TypeError:
+            raise AssertionError("Player cannot decide without a hand.")
+
+        up_value = self._upcard if self._upcard is not None else 10
+        mode, total = hand.total
+        width = self._width
+        if allow_pair and len(hand) == 2 and \
+                hand.uniform_value is not None:
+            kind = BasicStrategyPlayer.PAIR
+            total = Hand.card2value[hand[0]]
+        elif mode == Hand.SOFT:
+            kind = BasicStrategyPlayer.SOFT
+        else:
+            kind = BasicStrategyPlayer.HARD
+        total = min(total, width - 1)
+        i = (kind * width + total) * DealerOdds.NUM_VALUES + up_value - 1
+        if not 0 <= i < len(self._actions):
+            raise AssertionError('No table entry for this hand total and '
+                                 'dealer upcard.')
+        return hand, i
+
+    def _action(self, i):
+        """
+        Returns the action code to take at index i of the decision tables.
+        """
+        return self._actions[i]
+
+    def _can_add_bet(self):
+        """
+        Returns True iff the bankroll covers another bet of the round bet.
+        """
+        return self._round_bet is not None and \
+            self.bankroll >= self._round_bet
+
+    def decide_split(self):
+        """
+        Determines whether the player wishes to split their hand. The current
+        hand is split into two one-card hands, the second of which is
+        played next.
+
+        Returns (bool):
+            -> True if the player wishes to split their current hand.
+            -> False otherwise.
+
+        Side Effects:
+            -> Subtracts the additional bet from the bankroll if the player
+                decides to split.
+        """
+        hand, i = self._decision(True)
+        if self._action(i) != BasicStrategyPlayer.SPLIT or \
+                len(hand) != 2 or hand.uniform_value is None or \
+                len(self._hands) >= self._game_config.max_hands or \
+                not self._can_add_bet():
+            return False
+
+        self.bankroll -= self._round_bet
+        self._split()
+        return True
+
+    def decide_surrender(self):
+        """
+        Determine whether the player wishes to surrender their hand.
+
+        Returns (bool):
+            -> True if the player wishes to surrender their current hand.
+            -> False otherwise.
+        """
+        hand, i = self._decision(True)
+        return self._action(i) == BasicStrategyPlayer.SURRENDER and \
+            len(hand) == 2 and len(self._hands) == 1
+
+    def decide_double(self):
+        """
+        Determine whether the player wishes to double their hand.
+
+        Returns (bool):
+            -> True if the player wishes to double their current hand.
+            -> False otherwise.
+
+        Side Effects:
+            -> Subtracts the additional bet from the bankroll if the player
+                decides to double.
+        """
+        hand, i = self._decision(False)
+        if self._action(i) != BasicStrategyPlayer.DOUBLE or \
+                len(hand) != 2 or not self._can_add_bet() or \
+                (len(self._hands) > 1 and
+                 not self._game_config.double_after_split):
+            return False
+        self.bankroll -= self._round_bet
+        return True
+
+    def decide_hit(self):
+        """
+        Determine whether the player wishes to hit their hand. When the best
+        action is no longer allowed, the better of hitting and standing is
+        used instead.
+
+        Returns (bool):
+            -> True if the player wishes to hit their current hand.
+            -> False otherwise.
+        """
+        _, i = self._decision(False)
+        action = self._action(i)
+        if action == BasicStrategyPlayer.HIT:
+            return True
+        if action == BasicStrategyPlayer.STAND:
+            return False
+        return self._fallbacks[i] == BasicStrategyPlayer.HIT
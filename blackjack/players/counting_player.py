@@ -0,0 +1,191 @@
+from blackjack.counting import CardCounter
+from blackjack.dealer_odds import DealerOdds
+from blackjack.players.basic_strategy_player import BasicStrategyPlayer
+import math
+
+
+class CountingPlayer(BasicStrategyPlayer):
+
+    ############################ Define constants ############################
+
+    # The Illustrious 18 index plays for Hi-Lo, less insurance, as
+    # (kind, total, dealer up value): (index, action, above). The action
+    # replaces basic strategy when the true count is at least the index if
+    # above is True, or below it otherwise.
+    illustrious_18 = {
+        (BasicStrategyPlayer.HARD, 16, 10):
+            (0, BasicStrategyPlayer.STAND, True),
+        (BasicStrategyPlayer.HARD, 15, 10):
+            (4, BasicStrategyPlayer.STAND, True),
+        (BasicStrategyPlayer.PAIR, 10, 5):
+            (5, BasicStrategyPlayer.SPLIT, True),
+        (BasicStrategyPlayer.PAIR, 10, 6):
+            (4, BasicStrategyPlayer.SPLIT, True),
+        (BasicStrategyPlayer.HARD, 10, 10):
+            (4, BasicStrategyPlayer.DOUBLE, True),
+        (BasicStrategyPlayer.HARD, 12, 3):
+            (2, BasicStrategyPlayer.STAND, True),
+        (BasicStrategyPlayer.HARD, 12, 2):
+            (3, BasicStrategyPlayer.STAND, True),
+        (BasicStrategyPlayer.HARD, 11, 1):
+            (1, BasicStrategyPlayer.DOUBLE, True),
+        (BasicStrategyPlayer.HARD, 9, 2):
+            (1, BasicStrategyPlayer.DOUBLE, True),
+        (BasicStrategyPlayer.HARD, 10, 1):
+            (4, BasicStrategyPlayer.DOUBLE, True),
+        (BasicStrategyPlayer.HARD, 9, 7):
+            (3, BasicStrategyPlayer.DOUBLE, True),
+        (BasicStrategyPlayer.HARD, 16, 9):
+            (5, BasicStrategyPlayer.STAND, True),
+        (BasicStrategyPlayer.HARD, 13, 2):
+            (-1, BasicStrategyPlayer.HIT, False),
+        (BasicStrategyPlayer.HARD, 12, 4):
+            (0, BasicStrategyPlayer.HIT, False),
+        (BasicStrategyPlayer.HARD, 12, 5):
+            (-2, BasicStrategyPlayer.HIT, False),
+        (BasicStrategyPlayer.HARD, 12, 6):
+            (-1, BasicStrategyPlayer.HIT, False),
+        (BasicStrategyPlayer.HARD, 13, 3):
+            (-2, BasicStrategyPlayer.HIT, False),
+    }
+
+    # True count at or above which Hi-Lo players take insurance
+    illustrious_insurance = 3
+
+    ##########################################################################
+
+    def __init__(self, name="", bankroll=float('inf'), ramp=(1, 1, 2, 4, 8),
+                 system=CardCounter.HI_LO, deviations=None,
+                 insurance_index=None, cache_dir=None):
+        """
+        Initializes counting player.
+
+        The player keeps a count of the cards seen since the shoe was
+        shuffled, bets according to the true count, and otherwise plays
+        basic strategy, except for the given index plays.
+
+        Params:
+            name (str): The player's name.
+                Req: None
+            bankroll (int or float): The player's starting bankroll.
+                Req: bankroll >= 0
+            ramp (sequence of int or float): The bet ramp. ramp[k] is the bet
+                at a true count of k, rounded down. Lower counts bet ramp[0],
+                and higher counts bet ramp[-1]. Bets are then fitted to the
+                table limits and the bankroll as for ThresholdPlayer.
+                Req: len(ramp) > 0, and ramp[k] >= 0 for all k
+            system (str): The counting system, one of CardCounter.systems.
+                Req: None
+            deviations (dict or None): Index plays, in the format of
+                CountingPlayer.illustrious_18. None plays basic strategy only.
+                Req: None
+            insurance_index (int, float or None): Take insurance when the
+                true count is at least this. None never takes insurance.
+                Req: None
+            cache_dir (str or None): Directory of the on-disk basic strategy
+                table cache, as for BasicStrategyPlayer. Without it, each
+                simulate or sweep worker builds the table again.
+                Req: None
+        """
+
+        """ Init param check """
+        invalid_param = AssertionError('Invalid initialization parameters.')
+        try:
+            ramp = tuple(ramp)
+        except TypeError:
+            raise invalid_param
+        if not ramp:
+            raise invalid_param
+        for bet in ramp:
+            if isinstance(bet, bool) or type(bet) not in (int, float) or \
+                    bet < 0:
+                raise invalid_param
+        if system not in CardCounter.systems:
+            raise invalid_param
+        try:
+            deviations = {} if deviations is None else dict(deviations)
+            for (kind, total, up_value), (index, action, above) in \
+                    deviations.items():
+                if kind not in BasicStrategyPlayer.kinds or \
+                        not 1 <= up_value <= DealerOdds.NUM_VALUES or \
+                        action not in BasicStrategyPlayer.codes or \
+                        type(above) is not bool or \
+                        isinstance(index, bool) or \
+                        type(index) not in (int, float):
+                    raise invalid_param
+        except (TypeError, ValueError):
+            raise invalid_param
+        if insurance_index is not None and (
+                isinstance(insurance_index, bool) or
+                type(insurance_index) not in (int, float)):
+            raise invalid_param
+
+        super().__init__(name=name, bankroll=bankroll, bet=ramp[0],
+                         cache_dir=cache_dir, counter=CardCounter(system))
+
+        self.ramp = ramp
+        self.deviations = deviations
+        self.insurance_index = insurance_index
+
+        # Initialize Game-Dependent Information
+        self._deviations = {}
+
+    def sit_down(self, game_config):
+        """
+        Notifies the player that they are playing in a game, and places the
+        index plays in the game's decision table.
+
+        Params:
+            game_config (GameConfig): The game_config of the game they will
+                begin playing in.
+                Req: None
+        """
+        super().sit_down(game_config)
+        width = self._width
+        self._deviations = {
+            BasicStrategyPlayer.table_index(kind, total, up_value, width):
+                deviation
+            for (kind, total, up_value), deviation in self.deviations.items()
+            if 0 <= total < width}
+
+    def _bet_size(self):
+        """
+        Returns the ramp bet for the current true count.
+        """
+        k = math.floor(self.counter.true_count)
+        ramp = self.ramp
+        return ramp[min(max(k, 0), len(ramp) - 1)]
+
+    def _action(self, i):
+        """
+        Returns the action code to take at index i of the decision tables,
+        applying any index play for the current true count.
+        """
+        deviation = self._deviations.get(i)
+        if deviation is not None:
+            index, action, above = deviation
+            if (self.counter.true_count >= index) == above:
+                return action
+        return self._actions[i]
+
+    def decide_insurance(self):
+        """
+        Determines whether the player wishes to take insurance, which they
+        do at true counts of at least insurance_index.
+
+        Returns (bool):
+            -> True if the player wishes to take insurance.
+            -> False otherwise.
+
+        Side Effects:
+            -> Subtracts half of current hand's bet from the bankroll if the
+                player takes insurance.
+        """
+        super().decide_insurance()
+        if self.insurance_index is None or \
+                self.counter.true_count < self.insurance_index or \
+                self._round_bet is None or \
+                self.bankroll < self._round_bet / 2:
+            return False
+        self.bankroll -= self._round_bet / 2
+        return True
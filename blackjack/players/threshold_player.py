@@ -1,12 +1,31 @@
 from blackjack.player import Player
 from blackjack.card import Card
-from blackjack.hand import Hand
+from blackjack.counting import CardCounter
+from blackjack.hand import Hand, HandPool
 from blackjack.game_config import GameConfig
 
 
 class ThresholdPlayer(Player):
+
+    ############################ Define constants ############################
+
+    # As for Player.unchecked_methods
+    unchecked_methods = {
+        'observe_cards': '_observe_cards',
+        'curr_hand': '_curr_hand',
+        'decide_insurance': '_decline',
+        'decide_split': '_decline',
+        'decide_surrender': '_decline',
+        'decide_double': '_decline',
+        'decide_hit': '_decide_hit',
+        'insurance_payout': '_insurance_payout',
+        'final_payout': '_final_payout',
+    }
+
+    ##########################################################################
+
     def __init__(self, name="", bankroll=float('inf'),
-                 hard_threshold=17, soft_threshold=17, bet=1):
+                 hard_threshold=17, soft_threshold=17, bet=1, counter=None):
         """
         Initializes threshold player.
 
@@ -23,6 +42,10 @@ class ThresholdPlayer(Player):
                 If bet is a float, it will be rounded down if the player plays
                 a game with int_bet_only enabled.
                 Req: bet >= 0
+            counter (CardCounter or None): A counter to keep up to date with
+                every card the player observes. It is reset whenever the
+                player sits down or the shoe is reshuffled.
+                Req: None
         """
 
         """ Init param check """
@@ -50,6 +73,8 @@ class ThresholdPlayer(Player):
             raise invalid_param
         if isinstance(bet, bool) or type(bet) not in (int, float) or bet < 0:
             raise invalid_param
+        if counter is not None and not isinstance(counter, CardCounter):
+            raise invalid_param
 
         # Initialize Basic Player Information
         self.name = name
@@ -60,12 +85,19 @@ class ThresholdPlayer(Player):
         self.soft_threshold = soft_threshold
         self.hard_threshold = hard_threshold
         self.bet = bet
+        self.counter = counter
 
         # Initialize Game-Dependent Information
         self._game_config = None
         self._hands = None
         self._hand_index = None
 
+        # The hand list and opening hand are reused from round to round, and
+        # the hands split off from it are lent by a pool released every round
+        self._hand_list = []
+        self._first_hand = Hand()
+        self._hand_pool = HandPool()
+
     def sit_down(self, game_config):
         """
         Notifies the player that they are playing in a game.
@@ -83,6 +115,8 @@ class ThresholdPlayer(Player):
         self._game_config = game_config
         self._hands = None
         self._hand_index = None
+        if self.counter is not None:
+            self.counter.reset(game_config.num_decks)
 
     def place_bet(self):
         """
@@ -106,7 +140,7 @@ class ThresholdPlayer(Player):
             raise AssertionError('Player must sit down before placing a bet.')
 
         min_bet, max_bet = self._game_config.min_bet, self._game_config.max_bet
-        bet = max(min_bet, min(max_bet, self.bet))
+        bet = max(min_bet, min(max_bet, self._bet_size()))
         if self._game_config.int_bet_only:
             bet = min(self.bankroll, int(bet))
         else:
@@ -114,13 +148,32 @@ class ThresholdPlayer(Player):
 
         self.bankroll -= bet
         if bet > 0:
-            self._hands = [Hand()]
+            self._hand_pool.release()
+            hands = self._hand_list
+            hands.clear()
+            hands.append(self._first_hand.clear())
+            self._hands = hands
             self._hand_index = 0
         else:
             self._hands = None
             self._hand_index = None
         return bet
 
+    def _split(self):
+        """
+        Splits the current hand into one-card hands, the first kept in place
+        and the rest played right after it, with hands from the pool.
+        """
+        i = self._hand_index
+        self._hands[i + 1:i + 1] = self._hands[i].explode(self._hand_pool)[1:]
+
+    def _bet_size(self):
+        """
+        Returns the amount the player would like to bet this round, before
+        the table limits and their bankroll are applied.
+        """
+        return self.bet
+
     def observe_card(self, card, player):
         """
         Notifies the player of a card being assigned to some player. Only
@@ -142,7 +195,37 @@ class ThresholdPlayer(Player):
                 player,
                 int) or player < 0:
             raise AssertionError("Invalid params")
-        pass
+        if self.counter is not None:
+            self.counter.observe(card)
+
+    def observe_cards(self, cards):
+        """
+        Notifies the player of several cards being assigned, as observe_card
+        does for each of them.
+
+        Params:
+            cards (list of tuple): (card, player) pairs, each as for
+                observe_card.
+                Req: None
+        """
+        if not isinstance(self._game_config, GameConfig):
+            raise AssertionError("Player can't observe card if not in a game.")
+        counter = self.counter
+        for card, player in cards:
+            # Exact type checks, which also rule out bool seats
+            if type(card) is not Card or type(player) is not int or \
+                    player < 0:
+                raise AssertionError("Invalid params")
+            if counter is not None:
+                counter.observe(card)
+
+    def observe_shuffle(self):
+        """
+        Notifies the player that a freshly shuffled shoe is put in play, and
+        resets their counter if they have one.
+        """
+        if self.counter is not None:
+            self.counter.reset()
 
     def has_hand(self):
         """
@@ -326,3 +409,52 @@ class ThresholdPlayer(Player):
         # Reset Hand
         self._hands = None
         self._hand_index = None
+
+    ######################### Unchecked game methods #########################
+
+    def _observe_cards(self, cards):
+        """
+        observe_cards, without checks.
+        """
+        counter = self.counter
+        if counter is not None:
+            for card, _ in cards:
+                counter.observe(card)
+
+    def _curr_hand(self):
+        """
+        curr_hand, without checks. The player must have placed a bet.
+        """
+        hands = self._hands
+        i = self._hand_index
+        return hands[i] if i < len(hands) else None
+
+    def _decline(self):
+        """
+        decide_insurance, decide_split, decide_surrender and decide_double,
+        without checks.
+        """
+        return False
+
+    def _decide_hit(self):
+        """
+        decide_hit, without checks. The player must have a hand.
+        """
+        hand_type, total = self._hands[self._hand_index].total
+        if hand_type == Hand.HARD:
+            return total < self.hard_threshold
+        return total < self.soft_threshold
+
+    def _insurance_payout(self, payout):
+        """
+        insurance_payout, without checks.
+        """
+        self.bankroll += payout
+
+    def _final_payout(self, payouts):
+        """
+        final_payout, without checks.
+        """
+        self.bankroll += sum(payouts)
+        self._hands = None
+        self._hand_index = None
@@ -0,0 +1,212 @@
+import json
+import marshal
+import time
+
+
+class GameProfiler:
+
+    ############################ Define constants ############################
+
+    # Phases of a round timed by Game. ROUND is the whole of play_round, and
+    # the others are timed inside it, so they overlap the player methods
+    # they call back.
+    ROUND = 'round'
+    SHUFFLE = 'shuffle'     # Preparing a fresh shoe
+    DEAL = 'deal'           # Dealing a card to a hand
+    DEALER = 'dealer'       # The dealer playing out their hand
+    PAYOUT = 'payout'       # Settling the hands of one seat
+    phases = (ROUND, SHUFFLE, DEAL, DEALER, PAYOUT)
+
+    # Player methods called back by Game, timed per player class
+    player_methods = ('place_bet', 'observe_card', 'observe_cards',
+                      'observe_shuffle', 'curr_hand', 'next_hand',
+                      'decide_insurance',
+                      'decide_split', 'decide_surrender', 'decide_double',
+                      'decide_hit', 'insurance_payout', 'final_payout')
+
+    # File name of the phases in cProfile stats, as for built-ins
+    phase_file = '~'
+
+    ##########################################################################
+
+    def __init__(self, clock=time.perf_counter):
+        """
+        Records cumulative time and call counts of the phases of a Game, and
+        of every player method it calls.
+
+        Pass it to Game to turn profiling on. Without a profiler, a Game
+        only pays for a few None checks per round.
+
+        Params:
+            clock (callable): Returns the current time in seconds.
+                Req: None
+        """
+        self.clock = clock
+        # name -> [calls, seconds], where name is a phase or
+        # 'PlayerClass.method'
+        self.stats = {}
+        # name -> code location (file, line, function) for cProfile stats
+        self._locations = {}
+
+    def add(self, name, seconds):
+        """
+        Records one call of a phase or method.
+
+        Params:
+            name (str): A phase in GameProfiler.phases, or a method name.
+                Req: None
+            seconds (float): Time the call took.
+                Req: None
+        """
+        entry = self.stats.get(name)
+        if entry is None:
+            self.stats[name] = [1, seconds]
+        else:
+            entry[0] += 1
+            entry[1] += seconds
+
+    def wrap(self, name, func):
+        """
+        Returns func, timed under name on every call.
+
+        Params:
+            name (str): Name to record the calls under.
+                Req: None
+            func (callable): The function to time.
+                Req: None
+        """
+        code = getattr(func, '__code__', None)
+        if code is not None:
+            self._locations[name] = (code.co_filename, code.co_firstlineno,
+                                     name)
+        clock = self.clock
+        add = self.add
+
+        def timed(*args):
+            start = clock()
+            try:
+                return func(*args)
+            finally:
+                add(name, clock() - start)
+
+        return timed
+
+    def wrap_player(self, player, name=None):
+        """
+        Returns a stand-in for player that times each method in
+        GameProfiler.player_methods, and passes everything else through.
+
+        Params:
+            player (Player): The player to time.
+                Req: None
+            name (str or None): Name of the player's class in the timings.
+                None uses the class of player.
+                Req: None
+        """
+        return TimedPlayer(player, self, name)
+
+    def reset(self):
+        """
+        Forgets everything recorded so far.
+        """
+        self.stats.clear()
+
+    def to_dict(self):
+        """
+        Returns (dict):
+            -> {name: {'calls': int, 'seconds': float}} for every phase and
+                method recorded.
+        """
+        return {name: {'calls': calls, 'seconds': seconds}
+                for name, (calls, seconds) in self.stats.items()}
+
+    def dump_json(self, path):
+        """
+        Writes to_dict() to a JSON file.
+
+        Params:
+            path (str): Path of the file to write.
+                Req: None
+        """
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f, indent=2, sort_keys=True)
+
+    def to_pstats(self):
+        """
+        Returns the recordings in the format of cProfile stats, as loaded by
+        pstats.Stats.
+
+        Phases are reported under GameProfiler.phase_file, and player methods
+        at their definition. Every call is counted as primitive, and its
+        total time as both its own and its cumulative time.
+
+        Returns (dict):
+            -> {(file, line, function): (calls, calls, seconds, seconds, {})}
+        """
+        stats = {}
+        for name, (calls, seconds) in self.stats.items():
+            location = self._locations.get(name)
+            if location is None:
+                location = (GameProfiler.phase_file, 0, name)
+            stats[location] = (calls, calls, seconds, seconds, {})
+        return stats
+
+    def dump_stats(self, path):
+        """
+        Writes to_pstats() to a file, like cProfile.Profile.dump_stats, so
+        that it can be read with pstats or other cProfile viewers.
+
+        Params:
+            path (str): Path of the file to write.
+                Req: None
+        """
+        with open(path, 'wb') as f:
+            marshal.dump(self.to_pstats(), f)
+
+    def report(self):
+        """
+        Returns (str):
+            -> A table of every phase and method, slowest first, with its
+                calls, total time, time per call and share of the rounds.
+        """
+        round_time = self.stats.get(GameProfiler.ROUND, (0, 0))[1]
+        lines = [f'{"name":<40}{"calls":>12}{"seconds":>12}'
+                 f'{"us/call":>10}{"% round":>9}']
+        for name, (calls, seconds) in sorted(
+                self.stats.items(), key=lambda item: -item[1][1]):
+            share = 100 * seconds / round_time if round_time else 0
+            lines.append(f'{name:<40}{calls:>12}{seconds:>12.4f}'
+                         f'{1e6 * seconds / calls:>10.2f}{share:>9.1f}')
+        return '\n'.join(lines)
+
+    def __repr__(self):
+        return f'GameProfiler({len(self.stats)} entries)'
+
+
+class TimedPlayer:
+    def __init__(self, player, profiler, name=None):
+        """
+        Stands in for a player at a profiled Game, and times the methods the
+        game calls back.
+
+        Params:
+            player (Player): The player to time.
+                Req: None
+            profiler (GameProfiler): Where to record the times.
+                Req: None
+            name (str or None): As for GameProfiler.wrap_player.
+                Req: None
+        """
+        self.player = player
+        cls = type(player).__name__ if name is None else name
+        for method in GameProfiler.player_methods:
+            # Players need not implement the optional methods
+            if hasattr(player, method):
+                setattr(self, method, profiler.wrap(f'{cls}.{method}',
+                                                    getattr(player, method)))
+
+    def __getattr__(self, name):
+        return getattr(self.player, name)
+
+    def __repr__(self):
+        return f'TimedPlayer({self.player!r})'
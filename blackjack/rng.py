@@ -0,0 +1,56 @@
+import random
+
+
+def make_rng(seed=None):
+    """
+    Gives a random number generator for a seed.
+
+    Params:
+        seed (None, int or random.Random): A seed, or a generator to use as
+            is. None seeds from fresh OS entropy.
+            Req: seed is None, a random.Random, or an int >= 0
+
+    Returns (random.Random):
+        rng -> the generator
+    """
+    if isinstance(seed, random.Random):
+        return seed
+    assert seed is None or (type(seed) is int and seed >= 0)
+    return random.Random(seed)
+
+
+def child_seed(seed, index):
+    """
+    Derives the seed of an independent child stream from a base seed.
+
+    The child seed only depends on (seed, index), so a child stream can be
+    rebuilt in any process, in any order.
+
+    Params:
+        seed (int): The base seed.
+            Req: None
+        index (int): Index of the child stream.
+            Req: index >= 0
+
+    Returns (int):
+        -> a 64-bit seed
+    """
+    return random.Random(f'{seed}/{index}').getrandbits(64)
+
+
+def spawn(rng, n):
+    """
+    Splits off independent child generators from a generator.
+
+    Params:
+        rng (random.Random): The parent generator. Its state advances.
+            Req: None
+        n (int): Number of children.
+            Req: n >= 0
+
+    Returns (list of random.Random):
+        -> n generators, each seeded from the parent stream
+    """
+    assert type(n) is int and n >= 0
+    base = rng.getrandbits(64)
+    return [random.Random(child_seed(base, k)) for k in range(n)]
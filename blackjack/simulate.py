@@ -0,0 +1,254 @@
+from blackjack.deck import Deck
+from blackjack.game import Game
+from blackjack.rng import child_seed
+from concurrent.futures import ProcessPoolExecutor
+from statistics import NormalDist
+import copy
+import math
+import os
+import random
+
+
+# With a target, shards check whether they can stop every this many rounds
+check_every = 1000
+
+
+class PlayerResult:
+    def __init__(self, name="", bankroll=0, rounds=0, wagered=0, net=0,
+                 m2=0):
+        """
+        Aggregated simulation results for one player.
+
+        Besides the totals, the sum of squared deviations of the per-round
+        net results from their mean is kept up to date with Welford's
+        algorithm, so the spread of the results is known at any time without
+        keeping every round.
+
+        Params:
+            name (str): The player's name.
+                Req: None
+            bankroll (int or float): The player's bankroll before the
+                simulation.
+                Req: None
+            rounds (int): Number of rounds in which the player placed a bet.
+                Req: rounds >= 0
+            wagered (int or float): Total amount wagered.
+                Req: None
+            net (int or float): Total net winnings.
+                Req: None
+            m2 (int or float): Sum of squared deviations of the net result
+                of each round from the mean.
+                Req: m2 >= 0
+        """
+        self.name = name
+        self.bankroll = bankroll
+        self.rounds = rounds
+        self.wagered = wagered
+        self.net = net
+        self.m2 = m2
+
+    def add(self, wager, net):
+        """
+        Adds one round in which the player placed a bet.
+
+        Params:
+            wager (int or float): Amount wagered in the round.
+                Req: None
+            net (int or float): Net winnings of the round.
+                Req: None
+        """
+        mean = self.net / self.rounds if self.rounds else 0
+        self.rounds += 1
+        self.wagered += wager
+        self.net += net
+        self.m2 += (net - mean) * (net - self.net / self.rounds)
+
+    def merge(self, other):
+        """
+        Adds the rounds of another result for the same player into this one.
+
+        Params:
+            other (PlayerResult): Result of another independent run.
+                Req: None
+
+        Returns:
+            self (PlayerResult) after merging.
+        """
+        if not isinstance(other, PlayerResult):
+            raise AssertionError('Can only merge with another PlayerResult.')
+        rounds = self.rounds + other.rounds
+        if self.rounds and other.rounds:
+            # Chan et al.'s update of the squared deviations of two samples
+            delta = other.ev - self.ev
+            self.m2 += other.m2 + \
+                delta * delta * self.rounds * other.rounds / rounds
+        else:
+            self.m2 += other.m2
+        self.rounds = rounds
+        self.wagered += other.wagered
+        self.net += other.net
+        return self
+
+    @property
+    def final_bankroll(self):
+        """
+        The player's bankroll after all merged rounds.
+        """
+        return self.bankroll + self.net
+
+    @property
+    def ev(self):
+        """
+        Expected net winnings per round played, or 0 if no round was played.
+        """
+        return self.net / self.rounds if self.rounds else 0
+
+    @property
+    def variance(self):
+        """
+        Sample variance of the net result per round, or 0 with fewer than 2
+        rounds.
+        """
+        return self.m2 / (self.rounds - 1) if self.rounds > 1 else 0
+
+    @property
+    def std_error(self):
+        """
+        Standard error of ev, or 0 if no round was played.
+        """
+        return math.sqrt(self.variance / self.rounds) if self.rounds else 0
+
+    def half_width(self, confidence=0.95):
+        """
+        Half-width of the normal confidence interval around ev.
+
+        Params:
+            confidence (float): Confidence level of the interval.
+                Req: 0 < confidence < 1
+        """
+        assert 0 < confidence < 1
+        return NormalDist().inv_cdf((1 + confidence) / 2) * self.std_error
+
+    @property
+    def ev_per_wager(self):
+        """
+        Expected net winnings per unit wagered, or 0 if nothing was wagered.
+        """
+        return self.net / self.wagered if self.wagered else 0
+
+    def __repr__(self):
+        return f'PlayerResult({self.name}, rounds={self.rounds}, ' \
+            f'ev={self.ev:.5f})'
+
+
+def simulate(config, players, rounds, workers=None, shards=None, seed=None,
+             deck_class=Deck, target=None, confidence=0.95):
+    """
+    Plays many rounds of a game, split into independent shoes across a
+    process pool, and merges the results of each player.
+
+    The rounds are split into shards. Each shard plays its share of rounds
+    in a fresh Game, with its own copy of the players and its own shoe, and
+    draws all of its randomness from a generator seeded by (seed, shard
+    index). The results therefore only depend on seed and shards, never on
+    workers or scheduling.
+
+    With a target, rounds is only an upper bound: each shard stops as soon
+    as the confidence interval of the ev of every player is narrow enough
+    for the merged result to reach the target, checking every check_every
+    rounds. A shard of k aims for target * sqrt(k), since the standard
+    error of the merged result is that of one shard over sqrt(k). The
+    rounds used are reported in the rounds of each result.
+
+    Params:
+        config (GameConfig): Config of the game to play.
+            Req: None
+        players (list of Player): The players, in seat order. They are copied
+            into each shard and are not modified.
+            Req: None
+        rounds (int): Total number of rounds to play.
+            Req: rounds >= 0
+        workers (int or None): Number of worker processes. None uses one per
+            CPU. A value of 1 plays every shard in this process.
+            Req: workers is None or workers > 0
+        shards (int or None): Number of independent shards. None uses one per
+            worker.
+            Req: shards is None or shards > 0
+        seed (int or None): Base seed. None uses config.seed, or draws a
+            fresh one if that is None too.
+            Req: None
+        deck_class (type): The class of the play deck.
+            Req: None
+        target (int, float or None): Half-width of the confidence interval
+            of ev to stop at. None plays every round.
+            Req: target is None or target > 0
+        confidence (float): Confidence level of the interval.
+            Req: 0 < confidence < 1
+
+    Returns (list of PlayerResult):
+        -> One result per player, in the order of players.
+    """
+
+    """ Param check """
+    assert type(rounds) is int and rounds >= 0
+    assert workers is None or (type(workers) is int and workers > 0)
+    assert shards is None or (type(shards) is int and shards > 0)
+    assert target is None or (type(target) in (int, float) and target > 0)
+    assert 0 < confidence < 1
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if shards is None:
+        shards = workers
+    if seed is None:
+        seed = config.seed
+    if seed is None:
+        seed = random.SystemRandom().getrandbits(64)
+
+    # Half-width each shard must reach, in units of standard errors
+    shard_target = None if target is None else \
+        target * math.sqrt(shards) / NormalDist().inv_cdf((1 + confidence) / 2)
+
+    # Spread the rounds over the shards as evenly as possible
+    base, extra = divmod(rounds, shards)
+    tasks = [(config, players, base + (1 if k < extra else 0),
+              child_seed(seed, k), deck_class, shard_target)
+             for k in range(shards)]
+
+    if workers == 1:
+        shard_results = [_run_shard(*task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            shard_results = list(executor.map(_run_shard, *zip(*tasks)))
+
+    merged = [PlayerResult(p.name, p.bankroll) for p in players]
+    for shard_result in shard_results:
+        for total, result in zip(merged, shard_result):
+            total.merge(result)
+    return merged
+
+
+def _run_shard(config, players, rounds, seed, deck_class,
+               target_error=None):
+    """
+    Plays one shard of a simulation. Runs in a worker process. With a
+    target_error, stops once the standard error of every player's ev is at
+    most target_error.
+
+    Returns (list of PlayerResult):
+        -> One result per player, in the order of players.
+    """
+    players = copy.deepcopy(players)
+    results = [PlayerResult(p.name, p.bankroll) for p in players]
+
+    game = Game(config, players, deck_class=deck_class, rng=seed)
+    wagers = game.wagers
+    for n in range(1, rounds + 1):
+        nets = game.play_round()
+        for i, result in enumerate(results):
+            if wagers[i] > 0:
+                result.add(wagers[i], nets[i])
+        if target_error is not None and n % check_every == 0 and \
+                all(r.std_error <= target_error for r in results):
+            break
+    return results
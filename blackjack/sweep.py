@@ -0,0 +1,240 @@
+from blackjack.game_config import GameConfig
+from blackjack.players.threshold_player import ThresholdPlayer
+from blackjack.rng import child_seed
+from blackjack.simulate import simulate
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import hashlib
+import itertools
+import json
+import os
+import random
+
+
+# Result columns of each row, after the parameters of its cell
+result_columns = ('rounds', 'wagered', 'net', 'ev', 'std_error',
+                  'ev_per_wager')
+
+
+def grid(params):
+    """
+    Expands a grid of parameters into every combination of them.
+
+    Params:
+        params (dict): {name: list of values} of keyword arguments.
+            Req: every value is a non-empty list
+
+    Returns (list of dict):
+        -> One {name: value} per combination, varying the last name fastest.
+    """
+    if not isinstance(params, dict):
+        raise AssertionError('A grid must be a dict of lists.')
+    for name, values in params.items():
+        if not isinstance(name, str) or not isinstance(values, list) or \
+                not values:
+            raise AssertionError('A grid must be a dict of lists.')
+    names = list(params)
+    return [dict(zip(names, combination))
+            for combination in itertools.product(*params.values())]
+
+
+def cell_key(config_params, player_params, player_class, rounds,
+             target=None, confidence=0.95):
+    """
+    Returns (str):
+        -> A key identifying a cell of a sweep, as stored in its checkpoint.
+    """
+    stop = [] if target is None else [target, confidence]
+    return json.dumps([config_params, player_class.__name__, player_params,
+                       rounds] + stop, sort_keys=True)
+
+
+def sweep(config_grid, player_grid, rounds, player_class=ThresholdPlayer,
+          checkpoint=None, workers=None, seed=None, target=None,
+          confidence=0.95):
+    """
+    Simulates every combination of a grid of GameConfig parameters and a
+    grid of player parameters, in parallel.
+
+    Each cell is a config and a player, simulated alone for a number of
+    rounds, or until the confidence interval of its ev is narrower than a
+    target (see simulate). Cells are handed out one at a time to a process
+    pool, so a worker that finishes a quick cell takes the next one
+    waiting, rather than each worker getting a fixed share of the grid.
+    Each cell draws its randomness from a seed derived from (seed, its
+    parameters), so its result does not depend on the grid around it, on
+    workers, or on scheduling.
+
+    With a checkpoint file, every finished cell is appended to it as a JSON
+    line as soon as it is done. A sweep given the same checkpoint again only
+    runs the cells not found in it, so an interrupted sweep resumes where it
+    stopped.
+
+    Params:
+        config_grid (dict): {name: list of values} of GameConfig arguments.
+            Req: every value is a non-empty list
+        player_grid (dict): {name: list of values} of player_class
+            arguments.
+            Req: every value is a non-empty list, and no name is also in
+                config_grid
+        rounds (int): Number of rounds to play in each cell, or at most with
+            a target.
+            Req: rounds >= 0
+        player_class (type): The class of the player, e.g. ThresholdPlayer.
+            Req: player_class can be pickled
+        checkpoint (str or None): Path of the JSON lines file to resume from
+            and to append finished cells to. None keeps no checkpoint.
+            Req: None
+        workers (int or None): Number of worker processes. None uses one per
+            CPU. A value of 1 runs every cell in this process.
+            Req: workers is None or workers > 0
+        seed (int or None): Base seed. None draws a fresh one.
+            Req: None
+        target (int, float or None): Half-width of the confidence interval
+            of ev at which each cell stops. None plays every round.
+            Req: target is None or target > 0
+        confidence (float): Confidence level of the interval.
+            Req: 0 < confidence < 1
+
+    Returns (list of dict):
+        -> One row per cell, in grid order: the config and player
+            parameters of the cell, followed by result_columns.
+    """
+
+    """ Param check """
+    assert type(rounds) is int and rounds >= 0
+    assert workers is None or (type(workers) is int and workers > 0)
+
+    configs = grid(config_grid)
+    players = grid(player_grid)
+    if set(config_grid) & set(player_grid):
+        raise AssertionError('Config and player parameters must differ.')
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if seed is None:
+        seed = random.SystemRandom().getrandbits(64)
+
+    cells = [(config_params, player_params)
+             for config_params in configs for player_params in players]
+    keys = [cell_key(config_params, player_params, player_class, rounds,
+                     target, confidence)
+            for config_params, player_params in cells]
+
+    done = {} if checkpoint is None else load_checkpoint(checkpoint)
+    tasks = [(k, config_params, player_params, player_class, rounds,
+              _cell_seed(seed, keys[k]), target, confidence)
+             for k, (config_params, player_params) in enumerate(cells)
+             if keys[k] not in done]
+
+    out = None if checkpoint is None else _open_checkpoint(checkpoint)
+    try:
+        def finish(k, row):
+            done[keys[k]] = row
+            if out is not None:
+                out.write(json.dumps({'key': keys[k], 'row': row}) + '\n')
+                out.flush()
+
+        if workers == 1:
+            for task in tasks:
+                finish(task[0], _run_cell(*task[1:]))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = {executor.submit(_run_cell, *task[1:]): task[0]
+                           for task in tasks}
+                for future in as_completed(futures):
+                    finish(futures[future], future.result())
+    finally:
+        if out is not None:
+            out.close()
+
+    return [done[key] for key in keys]
+
+
+def load_checkpoint(path):
+    """
+    Reads the cells finished so far from a sweep checkpoint.
+
+    A trailing partial line, as left by an interrupted sweep, is ignored.
+
+    Params:
+        path (str): Path of the checkpoint. A missing file has no cells.
+            Req: None
+
+    Returns (dict):
+        -> {cell key: row} of every finished cell.
+    """
+    done = {}
+    try:
+        with open(path) as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                done[entry['key']] = entry['row']
+    except FileNotFoundError:
+        pass
+    return done
+
+
+def _open_checkpoint(path):
+    """
+    Opens a checkpoint for appending cells, after ending any partial line
+    left by an interrupted sweep, which is then ignored by load_checkpoint.
+    """
+    out = open(path, 'a')
+    if out.tell():
+        with open(path, 'rb') as f:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b'\n':
+                out.write('\n')
+    return out
+
+
+def _cell_seed(seed, key):
+    """
+    Returns the seed of a cell, from the base seed and the cell's key.
+    """
+    index = int(hashlib.sha256(key.encode()).hexdigest()[:16], 16)
+    return child_seed(seed, index)
+
+
+def _run_cell(config_params, player_params, player_class, rounds, seed,
+              target=None, confidence=0.95):
+    """
+    Simulates one cell of a sweep. Runs in a worker process.
+
+    Returns (dict):
+        -> The row of the cell.
+    """
+    config = GameConfig(**config_params)
+    player = player_class(**player_params)
+    result = simulate(config, [player], rounds, workers=1, shards=1,
+                      seed=seed, target=target, confidence=confidence)[0]
+    row = dict(config_params)
+    row.update(player_params)
+    row.update((column, getattr(result, column)) for column in result_columns)
+    return row
+
+
+def format_table(rows):
+    """
+    Formats sweep rows as a plain text table, one line per row.
+
+    Params:
+        rows (list of dict): Rows as returned by sweep.
+            Req: every row has the same keys
+
+    Returns (str):
+        -> The table, with a header line of column names.
+    """
+    if not rows:
+        return ''
+    columns = list(rows[0])
+    cells = [[f'{row[c]:.5f}' if isinstance(row[c], float) else str(row[c])
+              for c in columns] for row in rows]
+    widths = [max(len(c), *(len(line[i]) for line in cells))
+              for i, c in enumerate(columns)]
+    lines = [' '.join(c.rjust(w) for c, w in zip(columns, widths))]
+    for line in cells:
+        lines.append(' '.join(v.rjust(w) for v, w in zip(line, widths)))
+    return '\n'.join(lines)
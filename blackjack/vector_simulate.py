@@ -0,0 +1,242 @@
+from blackjack.card import Card
+from blackjack.game import Game
+from blackjack.simulate import PlayerResult
+import numpy as np
+import random
+
+
+# Value of each card code, with Aces as 1. Jokers are never dealt.
+_values = np.array([1 if c.is_ace() else Game.rank2value.get(c.rank, 0)
+                    for c in Card.cards], dtype=np.int8)
+
+# Cards in one full deck, without jokers
+_deck_size = len(Card.ranks) * len(Card.suits)
+
+
+def simulate_threshold(config, num_shoes, hard_threshold=17,
+                       soft_threshold=17, bet=1, name="", seed=None):
+    """
+    Plays a ThresholdPlayer alone at a table for num_shoes whole shoes, all
+    shoes at once in NumPy arrays.
+
+    A threshold player never insures, surrenders, splits or doubles, so a
+    round only needs the running totals of the two hands: the player hits
+    while below their threshold, and the dealer then draws as the Dealer of
+    config does (S17 or H17) if the player's hand is still live. Each round
+    deals the cards of every unfinished shoe at once, and masks out the hands
+    that are done. The rules, payouts and reshuffle_threshold of config are
+    applied as in Game, so the results follow the same distribution as
+    simulate with a single ThresholdPlayer of unlimited bankroll.
+
+    Params:
+        config (GameConfig): Config of the game to play.
+            Req: config.init_hand_size == 2
+        num_shoes (int): Number of shoes to play, each from a fresh shuffle
+            until its cut comes up.
+            Req: num_shoes >= 0
+        hard_threshold (int): As for ThresholdPlayer.
+            Req: hard_threshold >= 0
+        soft_threshold (int): As for ThresholdPlayer.
+            Req: soft_threshold >= 0
+        bet (int or float): As for ThresholdPlayer.
+            Req: bet >= 0
+        name (str): Name of the player in the result.
+            Req: None
+        seed (None, int or numpy.random.Generator): Seed of the shuffles.
+            None uses config.seed, or draws a fresh one if that is None too.
+            Req: None
+
+    Returns (PlayerResult):
+        -> The merged result of every round played.
+    """
+
+    """ Param check """
+    assert type(num_shoes) is int and num_shoes >= 0
+
+    if seed is None:
+        seed = config.seed
+    if seed is None:
+        seed = random.SystemRandom().getrandbits(64)
+    rng = seed if isinstance(seed, np.random.Generator) \
+        else np.random.default_rng(seed)
+
+    shoes = shuffled_shoes(config.num_decks, num_shoes, rng)
+    rounds, wagered, net, squares = play_shoes(config, shoes, hard_threshold,
+                                               soft_threshold, bet)
+    rounds = int(rounds.sum())
+    net = float(net.sum())
+    # Sum of squared deviations from the mean, as PlayerResult keeps it
+    m2 = max(0.0, float(squares.sum()) - net * net / rounds) if rounds else 0
+    return PlayerResult(name, rounds=rounds, wagered=float(wagered.sum()),
+                        net=net, m2=m2)
+
+
+def shuffled_shoes(num_decks, num_shoes, rng):
+    """
+    Shuffles num_shoes shoes of num_decks decks each.
+
+    Each shoe is followed by the top of another, independent shuffle, which
+    is only dealt from if the shoe runs out in the middle of a round, as
+    Game reshuffles in that case. Game leaves the cards in play out of that
+    reshuffle and this shuffle does not, which only matters for the rare
+    rounds that reach the end of a shoe.
+
+    Params:
+        num_decks (int): Number of full decks per shoe.
+            Req: num_decks > 0
+        num_shoes (int): Number of shoes.
+            Req: num_shoes >= 0
+        rng (numpy.random.Generator): Generator to shuffle with.
+            Req: None
+
+    Returns (numpy.ndarray):
+        -> shoes[s, k] is the code of the k-th card dealt from shoe s
+    """
+    assert type(num_decks) is int and num_decks > 0
+    single = np.arange(_deck_size, dtype=np.int8)
+    shoe = np.tile(single, (num_shoes, num_decks))
+    # A round deals fewer cards than a deck, as neither hand is hit past a
+    # hard total of 21
+    spare = np.tile(single, (num_shoes, num_decks))
+    return np.concatenate(
+        (rng.permuted(shoe, axis=1),
+         rng.permuted(spare, axis=1)[:, :_deck_size]), axis=1)
+
+
+def _totals(hard, ace, blackjack_value):
+    """
+    Returns the best totals of hands with the given hard totals, and whether
+    each is soft, as Hand.total does.
+    """
+    soft = ace & (hard + 10 <= blackjack_value)
+    return np.where(soft, hard + 10, hard), soft
+
+
+def play_shoes(config, shoes, hard_threshold=17, soft_threshold=17, bet=1):
+    """
+    Plays a ThresholdPlayer alone at a table through each of the given
+    shoes, until its cut comes up.
+
+    Params:
+        config (GameConfig): Config of the game to play.
+            Req: config.init_hand_size == 2
+        shoes (numpy.ndarray): shoes[s, k] is the code of the k-th card dealt
+            from shoe s, as given by shuffled_shoes.
+            Req: shoes.shape[1] >= 52 * config.num_decks + 52
+        hard_threshold (int): As for ThresholdPlayer.
+            Req: hard_threshold >= 0
+        soft_threshold (int): As for ThresholdPlayer.
+            Req: soft_threshold >= 0
+        bet (int or float): As for ThresholdPlayer.
+            Req: bet >= 0
+
+    Returns (tuple of numpy.ndarray):
+        (rounds, wagered, net, squares) -> the number of rounds played in
+            each shoe, and the total amount wagered, net result and sum of
+            squared net results of the rounds in them.
+    """
+
+    """ Param check """
+    assert config.init_hand_size == 2
+    assert not isinstance(hard_threshold, bool) and \
+        type(hard_threshold) is int and hard_threshold >= 0
+    assert not isinstance(soft_threshold, bool) and \
+        type(soft_threshold) is int and soft_threshold >= 0
+    assert not isinstance(bet, bool) and type(bet) in (int, float) and \
+        bet >= 0
+    shoe_size = _deck_size * config.num_decks
+    assert shoes.ndim == 2 and shoes.shape[1] >= shoe_size + _deck_size
+
+    # The bet is fitted to the table limits as in ThresholdPlayer.place_bet
+    bet = max(config.min_bet, min(config.max_bet, bet))
+    if config.int_bet_only:
+        bet = int(bet)
+
+    num_shoes = len(shoes)
+    rounds = np.zeros(num_shoes, dtype=np.int64)
+    wagered = np.zeros(num_shoes)
+    net = np.zeros(num_shoes)
+    squares = np.zeros(num_shoes)
+    if bet <= 0:
+        # Nobody plays
+        return rounds, wagered, net, squares
+
+    values = _values[shoes]
+    blackjack_value = config.blackjack_value
+    # The cut comes up with the first card dealt from this position on
+    cut = shoe_size - int(config.reshuffle_threshold * shoe_size)
+
+    # Shoes still playing, and the position of their next card
+    live = np.arange(num_shoes)
+    pos = np.zeros(num_shoes, dtype=np.int64)
+    while len(live):
+        p = pos[live]
+
+        # Player, dealer upcard, player, dealer hole card
+        first, up, second, hole = (values[live, p + k] for k in range(4))
+        player = first + second
+        player_ace = (first == 1) | (second == 1)
+        dealer = up + hole
+        dealer_ace = (up == 1) | (hole == 1)
+        p += 4
+
+        player_total, _ = _totals(player, player_ace, blackjack_value)
+        dealer_total, _ = _totals(dealer, dealer_ace, blackjack_value)
+        player_natural = player_total == blackjack_value
+        dealer_natural = dealer_total == blackjack_value
+
+        # The player hits while below their threshold and the blackjack value
+        hitting = ~player_natural & ~dealer_natural
+        while True:
+            total, soft = _totals(player, player_ace, blackjack_value)
+            hitting &= (total < np.where(soft, soft_threshold,
+                                         hard_threshold)) & \
+                (total < blackjack_value)
+            hit = np.flatnonzero(hitting)
+            if not len(hit):
+                break
+            c = values[live[hit], p[hit]]
+            player[hit] += c
+            player_ace[hit] |= c == 1
+            p[hit] += 1
+        player_total, _ = _totals(player, player_ace, blackjack_value)
+        player_bust = player_total > blackjack_value
+
+        # The dealer draws only if the player's hand is still live
+        drawing = ~player_natural & ~dealer_natural & ~player_bust
+        while True:
+            total, soft = _totals(dealer, dealer_ace, blackjack_value)
+            hits = total < Game.dealer_stand_total
+            if config.hit_soft_17:
+                hits |= soft & (total == Game.dealer_stand_total)
+            drawing &= hits & (total <= blackjack_value)
+            hit = np.flatnonzero(drawing)
+            if not len(hit):
+                break
+            c = values[live[hit], p[hit]]
+            dealer[hit] += c
+            dealer_ace[hit] |= c == 1
+            p[hit] += 1
+        dealer_total, _ = _totals(dealer, dealer_ace, blackjack_value)
+
+        # Net result of each hand, as settled by Game
+        result = np.select(
+            [dealer_natural & player_natural,
+             dealer_natural,
+             player_natural,
+             player_bust,
+             (dealer_total > blackjack_value) |
+             (player_total > dealer_total),
+             player_total == dealer_total],
+            [0, -bet, bet * config.blackjack_pay, -bet,
+             bet * config.normal_pay, 0],
+            -bet)
+
+        rounds[live] += 1
+        wagered[live] += bet
+        net[live] += result
+        squares[live] += result * result
+        pos[live] = p
+        # A shoe ends with the round in which its cut came up
+        live = live[p <= cut]
+    return rounds, wagered, net, squares
@@ -0,0 +1,246 @@
+import pytest
+np = pytest.importorskip('numpy')
+from blackjack.card import Card
+from blackjack.deck import Deck
+from blackjack.array_deck import ArrayDeck
+from blackjack.game import Game
+from blackjack.game_config import GameConfig
+import random
+
+
+def test_constants():
+
+    # Every distinct card has exactly one code
+    assert len(ArrayDeck.code2card) == \
+        len(Card.ranks) * len(Card.suits) + len(Card.jokers)
+    assert len(set(ArrayDeck.code2card)) == len(ArrayDeck.code2card)
+    for code, c in enumerate(ArrayDeck.code2card):
+        assert c.code == code
+
+    # Codes of ordinary cards follow the order of an ordered Deck
+    assert list(ArrayDeck.code2card[:52]) == Deck(ordered=True).deck
+
+
+def test_init_params():
+
+    # num_full_decks must be positive int
+    with pytest.raises(AssertionError):
+        ArrayDeck(num_full_decks=None)
+    with pytest.raises(AssertionError):
+        ArrayDeck(num_full_decks=True)
+    with pytest.raises(AssertionError):
+        ArrayDeck(num_full_decks='4')
+    with pytest.raises(AssertionError):
+        ArrayDeck(num_full_decks=0)
+    ArrayDeck(num_full_decks=1)
+    ArrayDeck(num_full_decks=8)
+
+    # include_joker and ordered must be boolean
+    with pytest.raises(AssertionError):
+        ArrayDeck(include_joker=0)
+    with pytest.raises(AssertionError):
+        ArrayDeck(ordered='True')
+
+    # rng must be None, a non-negative int or a random.Random
+    with pytest.raises(AssertionError):
+        ArrayDeck(rng=-1)
+    with pytest.raises(AssertionError):
+        ArrayDeck(rng='1')
+    with pytest.raises(AssertionError):
+        ArrayDeck(rng=True)
+    with pytest.raises(AssertionError):
+        ArrayDeck(rng=np.random.default_rng(3))
+    ArrayDeck(rng=None)
+    ArrayDeck(rng=3)
+    ArrayDeck(rng=random.Random(3))
+
+
+def test_len():
+    single_deck_no_joker_len = len(Card.ranks) * len(Card.suits)
+    single_deck_with_joker_len = single_deck_no_joker_len + len(Card.jokers)
+
+    assert len(ArrayDeck(num_full_decks=1)) == single_deck_no_joker_len
+    assert len(ArrayDeck(num_full_decks=1, include_joker=True)
+               ) == single_deck_with_joker_len
+    assert len(ArrayDeck(num_full_decks=6)) == 6 * single_deck_no_joker_len
+    assert len(ArrayDeck(num_full_decks=6, include_joker=True)
+               ) == 6 * single_deck_with_joker_len
+
+
+def test_order_and_seed():
+    assert ArrayDeck(ordered=True) == ArrayDeck(ordered=True)
+    assert ArrayDeck(ordered=True).deck == Deck(ordered=True).deck
+
+    # Same seed gives the same shuffle, different seeds differ
+    assert ArrayDeck(num_full_decks=8, rng=7) == \
+        ArrayDeck(num_full_decks=8, rng=7)
+    assert ArrayDeck(num_full_decks=8, rng=7) != \
+        ArrayDeck(num_full_decks=8, rng=8)
+    assert ArrayDeck(rng=random.Random(7)) == ArrayDeck(rng=7)
+    num_trials = 10
+    for _ in range(num_trials):
+        assert ArrayDeck(ordered=False) != ArrayDeck(ordered=False)
+
+    # Shuffling keeps the composition
+    d = ArrayDeck(num_full_decks=2, include_joker=True, rng=1)
+    assert sorted(map(repr, d.deck)) == \
+        sorted(map(repr, Deck(num_full_decks=2, include_joker=True).deck))
+
+
+def test_draw():
+    d = ArrayDeck(include_joker=True, rng=0)
+
+    while len(d) > 0:
+        len1 = len(d)
+        cardpeek = d.deck[-1]
+        assert d.peek() == cardpeek
+        c = d.draw()
+        assert c == cardpeek
+        assert len(d) == len1 - 1
+
+    num_trials = 10
+    for _ in range(num_trials):
+        assert d.draw() is None
+        assert d.draw_code() == -1
+
+    d = ArrayDeck(rng=0)
+    e = ArrayDeck(rng=0)
+    while len(d) > 0:
+        assert ArrayDeck.code2card[d.draw_code()] == e.draw()
+
+
+def test_insert():
+
+    d = ArrayDeck()
+    special_value = Card(Card.BIG_JOKER)
+
+    assert d.deck[10] != special_value
+    d.insert(10, special_value)
+    assert d.deck[10] == special_value
+
+    assert d.deck[0] != special_value
+    d.insert(0, special_value)
+    assert d.deck[0] == special_value
+
+    assert d.deck[-1] != special_value
+    d.insert(-1, special_value)
+    assert d.deck[-2] == special_value
+
+    assert d.deck[-1] != special_value
+    d.insert(len(d), special_value)
+    assert d.deck[-1] == special_value
+    assert d.draw() == special_value
+
+    # Insertion after drawing only affects the remaining cards
+    d = ArrayDeck(rng=2)
+    for _ in range(50):
+        d.draw()
+    d.insert(1, special_value)
+    assert len(d) == 3
+    assert d.deck[1] == special_value
+
+    # Test illegal insert params
+    with pytest.raises(AssertionError):
+        d.insert('1', special_value)
+    with pytest.raises(AssertionError):
+        d.insert(0.5, special_value)
+    with pytest.raises(AssertionError):
+        d.insert(0, 'special')
+
+
+def test_reshuffle():
+    d = ArrayDeck(num_full_decks=2, rng=3)
+    full = sorted(map(repr, d.deck))
+    for _ in range(30):
+        d.draw()
+    d.insert(5, Card(Card.LITTLE_JOKER))
+
+    d.reshuffle()
+    assert len(d) == 104
+    assert sorted(map(repr, d.deck)) == full
+    # Reshuffling draws from the deck's own generator
+    d2 = ArrayDeck(num_full_decks=2, rng=3)
+    d2.reshuffle()
+    assert d == d2
+
+    # Held cards are left out, one copy per card listed
+    ace = Card(Card.ACE, Card.SPADES)
+    held = [ace, ace, Card(Card.NUM_2, Card.HEARTS)]
+    d.reshuffle(held)
+    assert len(d) == 101
+    assert d.deck.count(ace) == 0
+    assert d.deck.count(Card(Card.NUM_2, Card.HEARTS)) == 1
+    assert sorted(map(repr, d.deck + held)) == full
+
+
+def test_cut():
+    d = ArrayDeck()
+    assert d.cut == -1
+    for _ in range(52):
+        d.draw()
+    d.draw()
+    assert not d.reshuffle_due
+
+    d = ArrayDeck()
+    d.set_cut(50)
+    assert d.cut == 50
+    d.draw()
+    assert not d.reshuffle_due
+    d.draw()
+    assert not d.reshuffle_due
+    # The first card below the cut brings it up
+    d.draw_code()
+    assert d.reshuffle_due
+    assert len(d) == 49
+    d.draw()
+    assert d.reshuffle_due
+
+    # A reshuffle keeps the cut in place
+    d.reshuffle()
+    assert not d.reshuffle_due
+    assert d.cut == 50
+
+    # At the bottom, the cut comes up when the deck runs out
+    d.set_cut(0)
+    for _ in range(51):
+        d.draw()
+    assert not d.reshuffle_due
+    d.draw()
+    assert d.reshuffle_due
+    assert d.draw() is None
+
+    d.reshuffle()
+    d.set_cut(len(d))
+    d.draw()
+    assert d.reshuffle_due
+
+    for idx in (-1, 53, 0.5, '1'):
+        with pytest.raises(AssertionError):
+            d.set_cut(idx)
+
+
+def test_str_and_repr():
+    d = ArrayDeck(rng=4)
+    assert str(d) == 'Deck of 52 cards'
+    assert repr(d) == f'Deck [ {d.deck[-1]} ... {d.deck[0]} ]'
+    while len(d) > 2:
+        d.draw()
+    assert repr(d) == f'Deck [ {d.deck[1]} {d.deck[0]} ]'
+    d.draw()
+    d.draw()
+    assert str(d) == 'Deck of 0 cards'
+    assert repr(d) == 'Deck [ ]'
+
+
+def test_game_deck():
+    g = Game(GameConfig(num_decks=8, reshuffle_threshold=0.25),
+             deck_class=ArrayDeck)
+    assert isinstance(g.deck, ArrayDeck)
+    assert g.deck.cut == 104
+    original_len = len(g.deck)
+    counter = 0
+    g.deck.draw()
+    while not g.deck.reshuffle_due:
+        counter += 1
+        g.deck.draw()
+    assert 0.74 < (counter / original_len) < 0.76
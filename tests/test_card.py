@@ -1,6 +1,9 @@
 from blackjack.card import Card
+import copy
 import itertools
+import pickle
 import pytest
+import random
 
 
 def test_constants():
@@ -160,28 +163,28 @@ def test_repr():
 
 def test_eq_and_hash():
 
-    # These are equal
+    # These are equal, and the same interned object
     c1 = Card(Card.ACE, Card.DIAMONDS)
     c2 = Card(Card.ACE, Card.DIAMONDS)
-    assert c1 is not c2
+    assert c1 is c2
     assert c1 == c2
     assert hash(c1) == hash(c2)
 
     c1 = Card(Card.NUM_5, Card.HEARTS)
     c2 = Card(Card.NUM_5, Card.HEARTS)
-    assert c1 is not c2
+    assert c1 is c2
     assert c1 == c2
     assert hash(c1) == hash(c2)
 
     c1 = Card(Card.KING, Card.CLUBS)
     c2 = Card(Card.KING, Card.CLUBS)
-    assert c1 is not c2
+    assert c1 is c2
     assert c1 == c2
     assert hash(c1) == hash(c2)
 
     c1 = Card(Card.LITTLE_JOKER)
     c2 = Card(Card.LITTLE_JOKER)
-    assert c1 is not c2
+    assert c1 is c2
     assert c1 == c2
     assert hash(c1) == hash(c2)
 
@@ -223,3 +226,60 @@ def test_random_generation():
             return
     raise AssertionError(
         f'Card() consecutively generated {num_trials} equal pairs')
+
+
+def test_random_rng():
+
+    # The same generator state gives the same cards
+    for args in ((), (Card.NUM_6,), (Card.HEARTS,)):
+        rng1, rng2 = random.Random(3), random.Random(3)
+        cards1 = [Card(*args, rng=rng1) for _ in range(20)]
+        cards2 = [Card(*args, rng=rng2) for _ in range(20)]
+        assert cards1 == cards2
+        assert len(set(cards1)) > 1
+    assert Card._random_rank(random.Random(5)) == \
+        Card._random_rank(random.Random(5))
+    assert Card._random_suit(random.Random(5)) == \
+        Card._random_suit(random.Random(5))
+
+
+def test_interned():
+
+    # There is one instance of each card, numbered by code
+    assert len(Card.cards) == len(Card.ranks) * len(Card.suits) + \
+        len(Card.jokers)
+    assert len(set(map(id, Card.cards))) == len(Card.cards)
+    for code, c in enumerate(Card.cards):
+        assert c.code == code
+        if c.is_joker():
+            assert Card(c.rank) is c
+        else:
+            assert Card(c.rank, c.suit) is c
+
+    # Random cards are interned too
+    for _ in range(20):
+        c = Card()
+        assert Card.cards[c.code] is c
+        c = Card(Card.NUM_4)
+        assert Card.cards[c.code] is c
+
+    # Cards are immutable and carry no __dict__
+    c = Card(Card.ACE, Card.SPADES)
+    with pytest.raises(AttributeError):
+        c.suit = Card.HEARTS
+    with pytest.raises(AttributeError):
+        c.extra = 1
+    with pytest.raises(AttributeError):
+        del c.rank
+    assert not hasattr(c, '__dict__')
+    assert c.suit == Card.SPADES
+
+    # Copies and pickles resolve to the interned instance
+    for c in (Card(Card.KING, Card.CLUBS), Card(Card.BIG_JOKER)):
+        assert copy.copy(c) is c
+        assert copy.deepcopy(c) is c
+        assert pickle.loads(pickle.dumps(c)) is c
+
+    # Unhashable params are rejected like other illegal params
+    with pytest.raises(AssertionError):
+        Card([Card.ACE])
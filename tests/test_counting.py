@@ -0,0 +1,122 @@
+from blackjack.card import Card
+from blackjack.counting import CardCounter
+from blackjack.deck import Deck
+from blackjack.game import Game
+from blackjack.game_config import GameConfig
+from blackjack.players.threshold_player import ThresholdPlayer
+import pytest
+
+
+def test_constants():
+    assert len(set(CardCounter.systems)) == len(CardCounter.systems)
+    for system in CardCounter.systems:
+        assert len(CardCounter.value_tags[system]) == 10
+    assert CardCounter.deck_size == 52
+
+
+def test_init_params():
+    with pytest.raises(AssertionError):
+        CardCounter('Red Seven')
+    with pytest.raises(AssertionError):
+        CardCounter(num_decks=0)
+    with pytest.raises(AssertionError):
+        CardCounter(num_decks=1.5)
+    with pytest.raises(AssertionError):
+        CardCounter(num_decks=True)
+    for system in CardCounter.systems:
+        CardCounter(system, num_decks=8)
+
+
+def test_tags():
+    hi_lo = CardCounter(CardCounter.HI_LO)
+    assert len(hi_lo.tags) == len(Card.cards)
+    assert hi_lo.tags[Card(Card.NUM_2, Card.HEARTS).code] == 1
+    assert hi_lo.tags[Card(Card.NUM_8, Card.CLUBS).code] == 0
+    assert hi_lo.tags[Card(Card.QUEEN, Card.SPADES).code] == -1
+    assert hi_lo.tags[Card(Card.ACE, Card.DIAMONDS).code] == -1
+    assert hi_lo.tags[Card(Card.BIG_JOKER).code] == 0
+
+    # Every suit of a rank has the same tag
+    for system in CardCounter.systems:
+        counter = CardCounter(system)
+        for rank in Card.ranks:
+            assert len({counter.tags[Card(rank, suit).code]
+                        for suit in Card.suits}) == 1
+
+    assert CardCounter(CardCounter.OMEGA_II).tags[
+        Card(Card.NUM_9, Card.HEARTS).code] == -1
+    assert CardCounter(CardCounter.ZEN).tags[
+        Card(Card.ACE, Card.HEARTS).code] == -1
+    assert CardCounter(CardCounter.KO).tags[
+        Card(Card.NUM_7, Card.HEARTS).code] == 1
+
+
+def test_full_shoe():
+
+    # Balanced systems end a shoe at 0, KO at 4 above its initial count
+    for system, deck_sum in ((CardCounter.HI_LO, 0), (CardCounter.KO, 4),
+                             (CardCounter.OMEGA_II, 0), (CardCounter.ZEN, 0)):
+        counter = CardCounter(system, num_decks=6)
+        assert counter.deck_sum == deck_sum
+        assert counter.initial_count == deck_sum * (1 - 6)
+        for c in Deck(num_full_decks=6, rng=1).deck:
+            counter.observe(c)
+        assert counter.cards_seen == 6 * 52
+        assert counter.cards_remaining == 0
+        assert counter.running_count == counter.initial_count + 6 * deck_sum
+
+
+def test_true_count():
+    counter = CardCounter(CardCounter.HI_LO, num_decks=2)
+    assert counter.true_count == 0
+    for _ in range(26):
+        counter.observe(Card(Card.NUM_5))
+    assert counter.running_count == 26
+    assert counter.decks_remaining == 1.5
+    assert counter.true_count == pytest.approx(26 / 1.5)
+
+    # The last card never divides by 0
+    for _ in range(2 * 52 - 26):
+        counter.observe(Card(Card.NUM_8))
+    assert counter.decks_remaining == 1 / 52
+    assert counter.true_count == 26 * 52
+
+    # Unbalanced counts have their drift taken out
+    counter = CardCounter(CardCounter.KO, num_decks=2)
+    assert counter.running_count == -4
+    assert counter.true_count == 0
+    for c in Deck(num_full_decks=1, ordered=True).deck:
+        counter.observe(c)
+    assert counter.running_count == 0
+    assert counter.true_count == pytest.approx(0)
+
+    # Resetting starts over, optionally with a new shoe size
+    counter.reset()
+    assert (counter.running_count, counter.cards_seen) == (-4, 0)
+    counter.reset(8)
+    assert counter.running_count == -28
+    assert counter.cards_remaining == 8 * 52
+    with pytest.raises(AssertionError):
+        counter.reset(0)
+
+
+def test_game():
+    counter = CardCounter(CardCounter.HI_LO)
+    p = ThresholdPlayer(counter=counter)
+    g = Game(GameConfig(num_decks=1, reshuffle_threshold=0.5, seed=2), [p])
+
+    # The counter sees every card dealt since the last shuffle
+    shoe = list(reversed(g.deck.deck))
+    seen = 0
+    while not g.reshuffle_due:
+        g.play_round()
+        seen = counter.cards_seen
+        expected = CardCounter(CardCounter.HI_LO)
+        for c in shoe[:seen]:
+            expected.observe(c)
+        assert counter.running_count == expected.running_count
+    assert seen > 0
+
+    # and starts over after a reshuffle
+    g.play_round()
+    assert counter.cards_seen < seen
@@ -0,0 +1,62 @@
+from blackjack.card import Card
+from blackjack.dealer import Dealer
+from blackjack.game import Game
+from blackjack.game_config import GameConfig
+from blackjack.hand import Hand
+
+
+def test_hit_table():
+    s17 = Dealer.hit_table(GameConfig())
+    h17 = Dealer.hit_table(GameConfig(hit_soft_17=True))
+    assert len(s17) == len(h17) == len(Hand.state2total)
+    for state, (mode, total) in enumerate(Hand.state2total):
+        assert s17[state] == (total < 17)
+        assert h17[state] == (total < 17 or (mode == Hand.SOFT and
+                                             total == 17))
+
+    # The config's rule can be overridden
+    assert Dealer.hit_table(GameConfig(), hit_soft_17=True) == h17
+    assert Dealer.hit_table(GameConfig(hit_soft_17=True),
+                            hit_soft_17=False) == s17
+
+
+def test_init():
+    d = Dealer(GameConfig(hit_soft_17=True))
+    assert d.dealer
+    assert d.hit_soft_17
+    assert d.hits == Dealer.hit_table(GameConfig(hit_soft_17=True))
+    assert len(d.hand.hand) == 0
+    assert repr(d).startswith('Dealer(H17, ')
+    assert repr(Dealer(GameConfig())).startswith('Dealer(S17, ')
+
+
+def test_play():
+    cards = []
+
+    def deal(hand, seat):
+        assert seat == Game.dealer_seat
+        hand.add(cards.pop())
+
+    # 5 A 2 is soft 18, on which both dealers stand
+    for hit_soft_17 in (False, True):
+        cards = [Card(Card.NUM_2), Card(Card.ACE), Card(Card.NUM_5)]
+        d = Dealer(GameConfig(hit_soft_17=hit_soft_17))
+        assert d.play(deal) is d.hand
+        assert d.hand.total == (Hand.SOFT, 18)
+        assert not cards
+
+    # A 6 is soft 17: S17 stands and H17 draws the 10 to hard 17
+    d = Dealer(GameConfig())
+    d.hand.add(Card(Card.ACE))
+    d.hand.add(Card(Card.NUM_6))
+    cards = [Card(Card.NUM_10)]
+    d.play(deal)
+    assert d.hand.total == (Hand.SOFT, 17)
+    assert cards
+
+    d = Dealer(GameConfig(hit_soft_17=True))
+    d.hand.add(Card(Card.ACE))
+    d.hand.add(Card(Card.NUM_6))
+    d.play(deal)
+    assert d.hand.total == (Hand.HARD, 17)
+    assert not cards
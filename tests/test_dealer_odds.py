@@ -0,0 +1,148 @@
+import pytest
+from blackjack.card import Card
+from blackjack.dealer_odds import DealerOdds
+from blackjack.game_config import GameConfig
+from blackjack.hand import Hand
+
+
+def play_out(odds, hand, composition, first=False):
+    """
+    Plays out every draw order of a dealer hand by brute force, and returns
+    the probability of each outcome.
+    """
+    blackjack_value = odds.config.blackjack_value
+    total = hand.total[1]
+    if first and total == blackjack_value and len(hand) == 2:
+        return {DealerOdds.BLACKJACK: 1}
+    if total > blackjack_value:
+        return {DealerOdds.BUST: 1}
+    if len(hand) >= 2 and not odds._hits[hand.state]:
+        return {total: 1}
+    result = {}
+    num_cards = sum(composition)
+    for value in range(1, DealerOdds.NUM_VALUES + 1):
+        count = composition[value - 1]
+        if count:
+            card = Card(Card.ACE if value == 1 else Card.numbers[value - 2],
+                        Card.SPADES)
+            sub = play_out(odds, Hand(hand.hand + [card]),
+                           DealerOdds.remove(composition, value),
+                           first and len(hand) == 1)
+            for outcome, p in sub.items():
+                result[outcome] = result.get(outcome, 0) + \
+                    p * count / num_cards
+    return result
+
+
+def test_init_params():
+    with pytest.raises(AssertionError):
+        DealerOdds(GameConfig(), hit_soft_17=1)
+    DealerOdds(GameConfig(), hit_soft_17=True)
+
+    # The rule defaults to the config's
+    assert not DealerOdds(GameConfig()).hit_soft_17
+    assert DealerOdds(GameConfig(hit_soft_17=True)).hit_soft_17
+    assert not DealerOdds(GameConfig(hit_soft_17=True),
+                          hit_soft_17=False).hit_soft_17
+
+
+def test_shoe_and_remove():
+    assert DealerOdds.shoe(1) == (4, 4, 4, 4, 4, 4, 4, 4, 4, 16)
+    assert DealerOdds.shoe(8) == (32, 32, 32, 32, 32, 32, 32, 32, 32, 128)
+    assert sum(DealerOdds.shoe(6)) == 6 * 52
+    assert DealerOdds.remove(DealerOdds.shoe(1), 1) == \
+        (3, 4, 4, 4, 4, 4, 4, 4, 4, 16)
+    assert DealerOdds.remove(DealerOdds.shoe(1), 10) == \
+        (4, 4, 4, 4, 4, 4, 4, 4, 4, 15)
+    with pytest.raises(AssertionError):
+        DealerOdds.remove((0,) * 10, 5)
+
+
+def test_distribution():
+    odds = DealerOdds(GameConfig(num_decks=8))
+    for rank in Card.ranks:
+        dist = odds.distribution(Card(rank, Card.HEARTS))
+        assert set(dist) == {17, 18, 19, 20, 21, DealerOdds.BUST,
+                             DealerOdds.BLACKJACK}
+        assert sum(dist.values()) == pytest.approx(1)
+        assert all(p >= 0 for p in dist.values())
+
+        # Only Aces and ten-valued upcards can make a natural
+        if rank == Card.ACE:
+            assert dist[DealerOdds.BLACKJACK] == pytest.approx(128 / 415)
+        elif rank in (Card.NUM_10, Card.JACK, Card.QUEEN, Card.KING):
+            assert dist[DealerOdds.BLACKJACK] == pytest.approx(32 / 415)
+        else:
+            assert dist[DealerOdds.BLACKJACK] == 0
+
+    # Close to the published infinite-deck S17 figures for a 6 upcard
+    dist = odds.distribution(Card(Card.NUM_6, Card.CLUBS))
+    assert dist[17] == pytest.approx(0.1654, abs=0.002)
+    assert dist[21] == pytest.approx(0.0972, abs=0.002)
+    assert dist[DealerOdds.BUST] == pytest.approx(0.4208, abs=0.003)
+
+    # Peeking removes naturals and renormalizes the rest
+    ace = Card(Card.ACE, Card.SPADES)
+    plain = odds.distribution(ace)
+    peeked = odds.distribution(ace, peek=True)
+    assert peeked[DealerOdds.BLACKJACK] == 0
+    assert sum(peeked.values()) == pytest.approx(1)
+    for outcome in (17, 18, 19, 20, 21, DealerOdds.BUST):
+        assert peeked[outcome] == pytest.approx(
+            plain[outcome] / (1 - plain[DealerOdds.BLACKJACK]))
+
+
+def test_hit_soft_17():
+    s17 = DealerOdds(GameConfig(num_decks=6))
+    h17 = DealerOdds(GameConfig(num_decks=6, hit_soft_17=True))
+    for rank in (Card.ACE, Card.NUM_2, Card.NUM_6):
+        c = Card(rank, Card.DIAMONDS)
+        assert h17.distribution(c)[17] < s17.distribution(c)[17]
+        assert h17.distribution(c)[DealerOdds.BUST] > \
+            s17.distribution(c)[DealerOdds.BUST]
+    # A ten-valued upcard can never make a soft 17
+    c = Card(Card.KING, Card.DIAMONDS)
+    assert h17.distribution(c) == s17.distribution(c)
+
+
+def test_composition():
+    odds = DealerOdds(GameConfig())
+    five = Card(Card.NUM_5, Card.CLUBS)
+
+    # A shoe of only tens: 5 + 10 + 10 busts
+    only_tens = (0,) * 9 + (20,)
+    assert odds.distribution(five, only_tens)[DealerOdds.BUST] == 1
+
+    # A shoe of only twos: 5 + 2 * 6 = 17
+    only_twos = (0, 20) + (0,) * 8
+    assert odds.distribution(five, only_twos)[17] == 1
+
+    # Removing tens from the shoe lowers the dealer's bust rate
+    shoe = DealerOdds.remove(DealerOdds.shoe(1), 5)
+    fewer_tens = shoe[:9] + (4,)
+    assert odds.distribution(five, fewer_tens)[DealerOdds.BUST] < \
+        odds.distribution(five, shoe)[DealerOdds.BUST]
+
+    # The same as playing out every draw order of the dealer
+    h17 = DealerOdds(GameConfig(hit_soft_17=True))
+    shoe = DealerOdds.shoe(1)
+    for o in (odds, h17):
+        for rank in (Card.ACE, Card.NUM_6, Card.KING):
+            c = Card(rank, Card.HEARTS)
+            value = Hand.card2value[c]
+            rest = DealerOdds.remove(shoe, value)
+            hand = Hand([c])
+            expected = play_out(o, hand, rest, first=True)
+            dist = o.distribution(c, rest)
+            for outcome, p in expected.items():
+                assert dist[outcome] == pytest.approx(p, abs=1e-12)
+
+    # Running out of cards is an error
+    with pytest.raises(AssertionError):
+        odds.distribution(Card(Card.NUM_2, Card.HEARTS),
+                          (0, 1) + (0,) * 8)
+
+    # Results are the same after clearing the cache
+    before = odds.distribution(five)
+    odds.clear_cache()
+    assert odds.distribution(five) == before
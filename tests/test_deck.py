@@ -1,6 +1,7 @@
 import pytest
 from blackjack.card import Card
 from blackjack.deck import Deck
+import random
 
 
 def test_init_params():
@@ -84,15 +85,24 @@ def test_order():
     for _ in range(num_trials):
         assert Deck(ordered=False) != Deck(ordered=False)
 
+    # Seeded decks shuffle the same way
+    assert Deck(num_full_decks=8, rng=7) == Deck(num_full_decks=8, rng=7)
+    assert Deck(num_full_decks=8, rng=7) != Deck(num_full_decks=8, rng=8)
+    assert Deck(rng=random.Random(7)) == Deck(rng=7)
+    with pytest.raises(AssertionError):
+        Deck(rng=-1)
+    with pytest.raises(AssertionError):
+        Deck(rng='7')
+
 
 def test_eq():
     d1 = Deck(ordered=True)
     d2 = Deck(ordered=True)
     assert d1 == d2
     if d1.deck[-1].suit == Card.CLUBS:
-        d1.deck[-1].suit = Card.HEARTS
+        d1.deck[-1] = Card(d1.deck[-1].rank, Card.HEARTS)
     else:
-        d1.deck[-1].suit = Card.CLUBS
+        d1.deck[-1] = Card(d1.deck[-1].rank, Card.CLUBS)
     assert d1 != d2
     assert d1 != None
     assert d2 != 3
@@ -100,27 +110,28 @@ def test_eq():
     assert d2 != Card(Card.NUM_3, Card.SPADES)
 
 
-def test_different_objects():
+def test_different_lists():
+
+    # Decks share the interned cards but not the list holding them
+    d1 = Deck(ordered=True)
+    d2 = Deck(ordered=True)
+    assert d1.deck is not d2.deck
+    assert all(c1 is c2 for c1, c2 in zip(d1.deck, d2.deck))
 
-    # Cards should be different objects
-    d = Deck(include_joker=False)
+    # Replacing a card in one deck leaves the other deck alone
     tallysuit = {suit: 0 for suit in Card.suits}
     expectation = {suit: len(Card.ranks) for suit in Card.suits}
 
-    if d.deck[-1].suit == Card.SPADES:
-        d.deck[-1].suit = Card.DIAMONDS
-        expectation[Card.SPADES] -= 1
-        expectation[Card.DIAMONDS] += 1
+    if d1.deck[-1].suit == Card.SPADES:
+        d1.deck[-1] = Card(d1.deck[-1].rank, Card.DIAMONDS)
     else:
-        thissuit = d.deck[-1].suit
-        d.deck[-1].suit = Card.SPADES
-        expectation[thissuit] -= 1
-        expectation[Card.SPADES] += 1
+        d1.deck[-1] = Card(d1.deck[-1].rank, Card.SPADES)
 
-    for c in d.deck:
+    for c in d2.deck:
         tallysuit[c.suit] += 1
     for suit in Card.suits:
         assert tallysuit[suit] == expectation[suit]
+    assert d1 != d2
 
 
 def test_draw():
@@ -167,6 +178,77 @@ def test_insert():
         d.insert(0, 'special')
 
 
+def test_reshuffle():
+    d = Deck(num_full_decks=2, rng=3)
+    full = sorted(map(repr, d.deck))
+    for _ in range(30):
+        d.draw()
+    d.insert(5, Card(Card.LITTLE_JOKER))
+
+    d.reshuffle()
+    assert len(d) == 104
+    assert sorted(map(repr, d.deck)) == full
+    # Reshuffling draws from the deck's own generator
+    d2 = Deck(num_full_decks=2, rng=3)
+    d2.reshuffle()
+    assert d == d2
+
+    # Held cards are left out, one copy per card listed
+    ace = Card(Card.ACE, Card.SPADES)
+    held = [ace, ace, Card(Card.NUM_2, Card.HEARTS)]
+    d.reshuffle(held)
+    assert len(d) == 101
+    assert d.deck.count(ace) == 0
+    assert d.deck.count(Card(Card.NUM_2, Card.HEARTS)) == 1
+    assert sorted(map(repr, d.deck + held)) == full
+
+
+def test_cut():
+    d = Deck()
+    assert d.cut == -1
+    for _ in range(52):
+        d.draw()
+    d.draw()
+    assert not d.reshuffle_due
+
+    d = Deck()
+    d.set_cut(50)
+    assert d.cut == 50
+    d.draw()
+    assert not d.reshuffle_due
+    d.draw()
+    assert not d.reshuffle_due
+    # The first card below the cut brings it up
+    d.draw()
+    assert d.reshuffle_due
+    assert len(d) == 49
+    d.draw()
+    assert d.reshuffle_due
+
+    # A reshuffle keeps the cut in place
+    d.reshuffle()
+    assert not d.reshuffle_due
+    assert d.cut == 50
+
+    # At the bottom, the cut comes up when the deck runs out
+    d.set_cut(0)
+    for _ in range(51):
+        d.draw()
+    assert not d.reshuffle_due
+    d.draw()
+    assert d.reshuffle_due
+    assert d.draw() is None
+
+    d.reshuffle()
+    d.set_cut(len(d))
+    d.draw()
+    assert d.reshuffle_due
+
+    for idx in (-1, 53, 0.5, '1'):
+        with pytest.raises(AssertionError):
+            d.set_cut(idx)
+
+
 def test_str_and_repr():
     d = Deck()
     bottom = str(d.deck[0])
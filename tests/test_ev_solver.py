@@ -0,0 +1,148 @@
+import pytest
+from blackjack.card import Card
+from blackjack.dealer_odds import DealerOdds
+from blackjack.ev_solver import EVSolver
+from blackjack.game_config import GameConfig
+from blackjack.hand import Hand
+
+
+def hand(*ranks):
+    return Hand([Card(r, Card.CLUBS) for r in ranks])
+
+
+def up(rank):
+    return Card(rank, Card.HEARTS)
+
+
+def test_init_params():
+    with pytest.raises(AssertionError):
+        EVSolver(GameConfig(), exact=None)
+    with pytest.raises(AssertionError):
+        EVSolver(GameConfig(), hit_soft_17=0)
+    EVSolver(GameConfig(), hit_soft_17=True, exact=True)
+
+
+def test_hit_soft_17():
+    # An H17 config gives an H17 solver without passing the rule
+    s17 = EVSolver(GameConfig())
+    h17 = EVSolver(GameConfig(hit_soft_17=True))
+    assert h17.odds.hit_soft_17
+    six = up(Card.NUM_6)
+    assert h17.odds.distribution(six) != s17.odds.distribution(six)
+    assert h17.odds.distribution(six)[17] < s17.odds.distribution(six)[17]
+    assert h17.solve(hand(Card.NUM_10, Card.NUM_7), six) != \
+        s17.solve(hand(Card.NUM_10, Card.NUM_7), six)
+
+
+def test_allowed_actions():
+    solver = EVSolver(GameConfig(late_surrender=True))
+
+    # Pairs can split, two-card hands can double and surrender
+    evs = solver.solve(hand(Card.NUM_8, Card.NUM_8), up(Card.NUM_10))
+    assert all(evs[a] is not None for a in EVSolver.actions)
+    assert evs[EVSolver.SURRENDER] == -0.5
+
+    # Three-card hands can only hit or stand
+    evs = solver.solve(hand(Card.NUM_2, Card.NUM_3, Card.NUM_4),
+                       up(Card.NUM_10))
+    assert evs[EVSolver.DOUBLE] is None
+    assert evs[EVSolver.SPLIT] is None
+    assert evs[EVSolver.SURRENDER] is None
+
+    # Split hands follow double_after_split and cannot surrender
+    evs = solver.solve(hand(Card.NUM_5, Card.NUM_6), up(Card.NUM_6),
+                       after_split=True)
+    assert evs[EVSolver.DOUBLE] is not None
+    assert evs[EVSolver.SURRENDER] is None
+    no_das = EVSolver(GameConfig(double_after_split=False))
+    evs = no_das.solve(hand(Card.NUM_5, Card.NUM_6), up(Card.NUM_6),
+                       after_split=True)
+    assert evs[EVSolver.DOUBLE] is None
+
+    # No surrender or split when the rules forbid them
+    strict = EVSolver(GameConfig(late_surrender=False, max_hands=1))
+    evs = strict.solve(hand(Card.NUM_8, Card.NUM_8), up(Card.NUM_10))
+    assert evs[EVSolver.SURRENDER] is None
+    assert evs[EVSolver.SPLIT] is None
+
+    # Naturals are paid right away, and bust hands cannot be solved
+    evs = solver.solve(hand(Card.ACE, Card.KING), up(Card.NUM_9))
+    assert evs[EVSolver.STAND] == 3 / 2
+    assert evs[EVSolver.HIT] is None
+    with pytest.raises(AssertionError):
+        solver.solve(hand(Card.KING, Card.QUEEN, Card.NUM_5), up(Card.NUM_9))
+
+
+def test_basic_strategy():
+    solver = EVSolver(GameConfig(num_decks=8, late_surrender=False))
+    cases = [
+        ((Card.NUM_10, Card.NUM_6), Card.NUM_10, EVSolver.HIT),
+        ((Card.NUM_10, Card.NUM_6), Card.NUM_6, EVSolver.STAND),
+        ((Card.NUM_10, Card.NUM_2), Card.NUM_4, EVSolver.STAND),
+        ((Card.NUM_10, Card.NUM_2), Card.NUM_2, EVSolver.HIT),
+        ((Card.NUM_5, Card.NUM_6), Card.NUM_6, EVSolver.DOUBLE),
+        ((Card.NUM_5, Card.NUM_4), Card.NUM_10, EVSolver.HIT),
+        ((Card.ACE, Card.NUM_7), Card.NUM_9, EVSolver.HIT),
+        ((Card.ACE, Card.NUM_7), Card.NUM_3, EVSolver.DOUBLE),
+        ((Card.ACE, Card.NUM_7), Card.NUM_7, EVSolver.STAND),
+        ((Card.NUM_8, Card.NUM_8), Card.NUM_10, EVSolver.SPLIT),
+        ((Card.ACE, Card.ACE), Card.NUM_6, EVSolver.SPLIT),
+        ((Card.NUM_10, Card.NUM_10), Card.NUM_6, EVSolver.STAND),
+        ((Card.NUM_9, Card.NUM_9), Card.NUM_7, EVSolver.STAND),
+        ((Card.NUM_9, Card.NUM_9), Card.NUM_6, EVSolver.SPLIT),
+    ]
+    for ranks, upcard, action in cases:
+        assert solver.best_action(hand(*ranks), up(upcard)) == action
+
+    # Surrendering 16 against a 10 beats hitting
+    solver = EVSolver(GameConfig(num_decks=8, late_surrender=True))
+    assert solver.best_action(hand(Card.NUM_10, Card.NUM_6),
+                              up(Card.NUM_10)) == EVSolver.SURRENDER
+
+
+def test_values():
+    solver = EVSolver(GameConfig(num_decks=8))
+    odds = DealerOdds(GameConfig(num_decks=8))
+
+    # Standing on a total below 17 wins only if the dealer busts
+    h = hand(Card.NUM_10, Card.NUM_5)
+    six = up(Card.NUM_6)
+    composition = DealerOdds.shoe(8)
+    for c in h.hand + [six]:
+        composition = DealerOdds.remove(composition, Hand.card2value[c])
+    bust = odds.distribution(six, composition, peek=True)[DealerOdds.BUST]
+    evs = solver.solve(h, six)
+    assert evs[EVSolver.STAND] == pytest.approx(2 * bust - 1)
+    assert evs == solver.solve(h, six, composition)
+
+    # Hitting a hard 4 can never bust, so it is at least as good as standing
+    evs = solver.solve(hand(Card.NUM_2, Card.NUM_2), up(Card.NUM_7))
+    assert evs[EVSolver.HIT] >= evs[EVSolver.STAND]
+
+    # The exact solver agrees closely with the fast one
+    exact = EVSolver(GameConfig(num_decks=8), exact=True)
+    for ranks, upcard in [((Card.NUM_10, Card.NUM_6), Card.NUM_10),
+                          ((Card.ACE, Card.NUM_6), Card.NUM_4)]:
+        fast_evs = solver.solve(hand(*ranks), up(upcard))
+        exact_evs = exact.solve(hand(*ranks), up(upcard))
+        for a in EVSolver.actions:
+            if fast_evs[a] is None:
+                assert exact_evs[a] is None
+            else:
+                assert exact_evs[a] == pytest.approx(fast_evs[a], abs=0.01)
+
+    # Exact values are kept across queries, until the cache is cleared
+    h = hand(Card.NUM_2, Card.NUM_3)
+    evs = exact.solve(h, up(Card.NUM_6))
+    assert exact._best[6] and exact._stand_tables[6]
+    assert exact.solve(h, up(Card.NUM_6)) == evs
+    exact.clear_cache()
+    assert not exact._best and not exact._stand_tables
+    assert exact.solve(h, up(Card.NUM_6)) == evs
+
+    # Composition matters: a shoe of only tens makes hitting 12 hopeless
+    only_tens = (0,) * 9 + (50,)
+    evs = solver.solve(hand(Card.NUM_10, Card.NUM_2), up(Card.NUM_10),
+                       only_tens)
+    assert evs[EVSolver.HIT] == -1
+    solver.clear_cache()
@@ -1,44 +1,479 @@
 from blackjack.game import Game
+from blackjack.array_deck import ArrayDeck
 from blackjack.card import Card
+from blackjack.counting import CardCounter
+from blackjack.deck import Deck
 from blackjack.game_config import GameConfig
+from blackjack.hand import Hand
+from blackjack.player import TrustedPlayer
+from blackjack.players.basic_strategy_player import BasicStrategyPlayer
+from blackjack.players.threshold_player import ThresholdPlayer
+import pytest
+import random
 
 
 def test_constants():
-    # Cut card should only appear once in the play deck
+    # The cut is placed in the play deck, and has not come up yet
     g = Game(GameConfig())
-    assert g.deck.deck.count(Game.cut_card) == 1
+    assert 0 <= g.deck.cut <= len(g.deck)
+    assert not g.reshuffle_due
 
     # rank2value should send each of 2-K to int or float
     for r in (Card.numbers + Card.faces):
         assert type(Game.rank2value[r]) in (int, float)
 
 
+def draws_to_cut(deck):
+    """
+    Draws from deck until the cut comes up, and returns the number of cards
+    drawn before it.
+    """
+    counter = 0
+    deck.draw()
+    while not deck.reshuffle_due:
+        counter += 1
+        deck.draw()
+    return counter
+
+
 def test_reshuffle_threshold():
 
     g = Game(GameConfig(num_decks=8, reshuffle_threshold=0.33))
     original_len = len(g.deck)
-    counter = 0
-    while g.deck.draw() != Game.cut_card:
-        counter += 1
+    counter = draws_to_cut(g.deck)
     assert 0.66 < (counter / original_len) < 0.68
 
     g = Game(GameConfig(num_decks=8, reshuffle_threshold=0.25))
     original_len = len(g.deck)
-    counter = 0
-    while g.deck.draw() != Game.cut_card:
-        counter += 1
+    counter = draws_to_cut(g.deck)
     assert 0.74 < (counter / original_len) < 0.76
 
     g = Game(GameConfig(num_decks=8, reshuffle_threshold=0))
     original_len = len(g.deck)
-    counter = 0
-    while g.deck.draw() != Game.cut_card:
-        counter += 1
+    counter = draws_to_cut(g.deck)
     assert counter == original_len - 1
 
     g = Game(GameConfig(num_decks=8, reshuffle_threshold=1))
-    original_len = len(g.deck)
-    counter = 0
-    while g.deck.draw() != Game.cut_card:
-        counter += 1
+    counter = draws_to_cut(g.deck)
     assert counter == 0
+
+
+def test_play_round():
+    players = [ThresholdPlayer(name=str(i), bankroll=1000, bet=2)
+               for i in range(3)]
+    g = Game(GameConfig(num_decks=2), players)
+    for p in players:
+        assert p._game_config is g.config
+
+    num_rounds = 300
+    for _ in range(num_rounds):
+        before = [p.bankroll for p in players]
+        results = g.play_round()
+        assert len(results) == len(players)
+        for p, b, r, w in zip(players, before, results, g.wagers):
+            assert w == 2
+            assert r in (-2, 0, 2, 3)
+            assert p.bankroll == b + r
+            assert not p.has_hand()
+
+
+def test_play_round_observe():
+
+    class Recorder(ThresholdPlayer):
+        def observe_card(self, card, player):
+            super().observe_card(card, player)
+            self.seen.append((card, player))
+
+    p = Recorder(hard_threshold=0, soft_threshold=0)
+    p.seen = []
+    g = Game(GameConfig(), [p])
+    g.play_round()
+
+    # Player cards and the dealer upcard are shown as dealt; the hole card
+    # and any dealer hits are shown after the player is done. Nobody else
+    # hits.
+    seats = [seat for _, seat in p.seen]
+    assert seats[:4] == [1, Game.dealer_seat, 1, Game.dealer_seat]
+    assert set(seats[4:]) <= {Game.dealer_seat}
+
+
+def test_max_seats():
+    with pytest.raises(AssertionError):
+        Game(GameConfig(), [ThresholdPlayer()
+                            for _ in range(Game.max_seats + 1)])
+    g = Game(GameConfig(), [ThresholdPlayer()
+                            for _ in range(Game.max_seats)])
+    assert len(g.play_round()) == Game.max_seats
+
+
+def test_play_round_observe_batches():
+
+    class Batcher(ThresholdPlayer):
+        def observe_cards(self, cards):
+            super().observe_cards(cards)
+            self.batches.append(list(cards))
+
+        def decide_hit(self):
+            # Every card of the hand has been observed before deciding
+            seen = [c for batch in self.batches for c, seat in batch
+                    if seat == self.seat]
+            assert seen[-len(self.curr_hand().hand):] == \
+                self.curr_hand().hand
+            return super().decide_hit()
+
+    class Recorder(ThresholdPlayer):
+        def observe_card(self, card, player):
+            super().observe_card(card, player)
+            self.seen.append((card, player))
+
+    players = [Batcher(hard_threshold=15) for _ in range(Game.max_seats - 1)]
+    for seat, p in enumerate(players, 1):
+        p.seat = seat
+        p.batches = []
+    recorder = Recorder()
+    recorder.seen = []
+    players.append(recorder)
+    g = Game(GameConfig(num_decks=1, seed=5), players)
+    num_rounds = 50
+    dealt = 0
+    for _ in range(num_rounds):
+        g.play_round()
+        dealt += sum(len(h.hand) for hands in g._hands for h in hands) + \
+            len(g.dealer_hand.hand)
+
+    # Players implementing only observe_card see every card one by one,
+    # in the same order as the batches
+    for p in players[:-1]:
+        assert [c for batch in p.batches for c in batch] == recorder.seen
+        assert len(p.batches) < dealt / 2
+    assert len(recorder.seen) >= dealt
+
+
+def test_play_round_broke_player():
+    p = ThresholdPlayer(bankroll=0, bet=5)
+    g = Game(GameConfig(), [p])
+    assert g.play_round() == [0]
+    assert g.wagers == [0]
+    assert p.bankroll == 0
+
+
+def test_play_round_reshuffle():
+    g = Game(GameConfig(num_decks=1, reshuffle_threshold=0.5),
+             [ThresholdPlayer()])
+    deck = g.deck
+    cards = deck.deck
+    while not g.reshuffle_due:
+        g.play_round()
+    assert g.deck is deck
+    assert len(deck) < deck.cut
+    g.play_round()
+
+    # The same deck is reshuffled in place, with the cut in the same place
+    assert g.deck is deck
+    assert deck.deck is cards
+    assert deck.cut == 26
+    assert not g.reshuffle_due
+    dealt = sum(len(h.hand) for h in g._hands[0]) + len(g.dealer_hand.hand)
+    assert len(deck) == 52 - dealt
+
+
+def test_play_round_reshuffle_mid_round():
+    for deck_class in (Deck, ArrayDeck):
+        players = [ThresholdPlayer(counter=CardCounter())
+                   for _ in range(Game.max_seats)]
+        g = Game(GameConfig(num_decks=1, seed=2), players,
+                 deck_class=deck_class)
+        # Only 5 cards are left, so the shoe runs out during the deal
+        while len(g.deck) > 5:
+            g.deck.draw()
+        g.deck.set_cut(0)
+        g.play_round()
+
+        # The new shoe holds every card but those in play, and no card is
+        # dealt twice
+        in_play = [c for hands in g._hands for h in hands for c in h] + \
+            list(g.dealer_hand)
+        assert len(in_play) > 5
+        assert len(set(in_play)) == len(in_play)
+        assert sorted(map(repr, g.deck.deck + in_play)) == \
+            sorted(map(repr, Deck(ordered=True).deck))
+
+        # Counters restart with the new shoe, and count the cards in play
+        # as seen from it
+        for p in players:
+            assert p.counter.cards_seen == len(in_play)
+            assert p.counter.running_count == \
+                sum(p.counter.tags[c.code] for c in in_play)
+
+
+class ScriptedPlayer(ThresholdPlayer):
+    """
+    Threshold player that always takes each of the given actions when
+    offered.
+    """
+
+    def __init__(self, actions=(), **kwargs):
+        super().__init__(bankroll=1000, bet=2, **kwargs)
+        self.actions = set(actions)
+
+    def decide_insurance(self):
+        super().decide_insurance()
+        if 'insurance' not in self.actions:
+            return False
+        self.bankroll -= self.bet / 2
+        return True
+
+    def decide_split(self):
+        super().decide_split()
+        if 'split' not in self.actions:
+            return False
+        self.bankroll -= self.bet
+        self._split()
+        return True
+
+    def decide_surrender(self):
+        super().decide_surrender()
+        return 'surrender' in self.actions
+
+    def decide_double(self):
+        super().decide_double()
+        if 'double' not in self.actions:
+            return False
+        self.bankroll -= self.bet
+        return True
+
+
+def stack_deck(g, *ranks):
+    """
+    Makes the deck of g deal the given ranks in order, followed by Twos,
+    with the cut at the bottom so that the round does not reshuffle them.
+    """
+    g.deck.deck = [Card(Card.NUM_2)] * 20 + \
+        [Card(r) for r in reversed(ranks)]
+    g.deck.set_cut(0)
+
+
+def test_trusted_players(tmp_path):
+    # The game calls the unchecked methods of a player
+    p = ThresholdPlayer()
+    seat = Game(GameConfig(), [p])._seats[0]
+    assert isinstance(seat, TrustedPlayer)
+    assert seat.player is p
+    assert seat.decide_hit == p._decide_hit
+    assert seat.decide_double == p._decline
+    assert seat.place_bet == p.place_bet
+
+    # Checked methods overridden by a subclass are still called
+    s = ScriptedPlayer(['split'])
+    seat = Game(GameConfig(), [s])._seats[0]
+    assert seat.decide_split == s.decide_split
+    assert seat.decide_hit == s._decide_hit
+    b = BasicStrategyPlayer(cache_dir=str(tmp_path))
+    seat = Game(GameConfig(num_decks=2), [b])._seats[0]
+    assert seat.decide_hit == b.decide_hit
+    assert seat.observe_cards == b.observe_cards
+    assert seat.final_payout == b._final_payout
+
+    # Both interfaces play the same game
+    def play(trusted):
+        players = [ThresholdPlayer(bankroll=1000, hard_threshold=t)
+                   for t in (12, 15, 17)]
+        g = Game(GameConfig(seed=1), players)
+        if not trusted:
+            g._seats = g.players
+            g._observers = [Game._card_observer(p, p) for p in players]
+        for _ in range(100):
+            g.play_round()
+        return [p.bankroll for p in players]
+    assert play(True) == play(False)
+
+
+def test_play_round_split():
+    p = ScriptedPlayer(['split'])
+    g = Game(GameConfig(max_hands=2), [p])
+
+    # Player 8 8 against dealer 10 7. The first split hand draws another 8,
+    # which can no longer be split, and hits a 2 to 18. The second draws a
+    # 10 to 18.
+    stack_deck(g, Card.NUM_8, Card.NUM_10, Card.NUM_8, Card.NUM_7,
+               Card.NUM_8, Card.NUM_2, Card.NUM_10)
+    assert g.play_round() == [4]
+    assert g.wagers == [4]
+    assert p.bankroll == 1004
+    assert [len(hand.hand) for hand in g._hands[0]] == [3, 2]
+    assert g.dealer_hand.total == (Hand.HARD, 17)
+
+    # Dealing continues from the Twos left in the deck
+    assert len(g.deck) == 20
+
+    # The split hands are reused in the next round
+    split_hands = g._hands[0][:]
+    stack_deck(g, Card.NUM_8, Card.NUM_10, Card.NUM_8, Card.NUM_7,
+               Card.NUM_10, Card.NUM_10)
+    assert g.play_round() == [4]
+    assert all(a is b for a, b in zip(g._hands[0], split_hands))
+
+
+def test_play_round_split_natural():
+    p = ScriptedPlayer(['split'])
+
+    # A split Ace drawing a ten is only paid as a blackjack if allowed
+    for natural_only, result in ((True, 4), (False, 6)):
+        g = Game(GameConfig(max_hands=2, natural_blackjack_only=natural_only),
+                 [p])
+        stack_deck(g, Card.ACE, Card.NUM_10, Card.ACE, Card.NUM_8,
+                   Card.KING, Card.QUEEN)
+        assert g.play_round() == [result]
+
+
+def test_play_round_double():
+    p = ScriptedPlayer(['double'])
+    g = Game(GameConfig(), [p])
+    stack_deck(g, Card.NUM_5, Card.NUM_10, Card.NUM_6, Card.NUM_7,
+               Card.NUM_10)
+    assert g.play_round() == [4]
+    assert g.wagers == [4]
+    assert p.bankroll == 1004
+
+    # Doubling after a split needs double_after_split
+    for das, result in ((True, 8), (False, -4)):
+        p = ScriptedPlayer(['split', 'double'], hard_threshold=0)
+        g = Game(GameConfig(double_after_split=das), [p])
+        stack_deck(g, Card.NUM_5, Card.NUM_10, Card.NUM_5, Card.NUM_7,
+                   Card.NUM_6, Card.NUM_10, Card.NUM_6, Card.NUM_10)
+        assert g.play_round() == [result]
+
+
+def test_play_round_insurance():
+    p = ScriptedPlayer(['insurance'])
+    g = Game(GameConfig(), [p])
+
+    # Insurance pays 2 to 1 on a dealer natural, covering the lost hand
+    stack_deck(g, Card.NUM_10, Card.ACE, Card.NUM_9, Card.KING)
+    assert g.play_round() == [0]
+    assert g.wagers == [3]
+    assert p.bankroll == 1000
+
+    # Otherwise the side bet is lost and the hand plays on
+    stack_deck(g, Card.NUM_10, Card.ACE, Card.NUM_9, Card.NUM_7)
+    assert g.play_round() == [1]
+
+    # Without insurance in the config, or without an Ace up, it is not offered
+    g = Game(GameConfig(insurance=False), [p])
+    stack_deck(g, Card.NUM_10, Card.ACE, Card.NUM_9, Card.KING)
+    assert g.play_round() == [-2]
+    g = Game(GameConfig(), [p])
+    stack_deck(g, Card.NUM_10, Card.KING, Card.NUM_9, Card.ACE)
+    assert g.play_round() == [-2]
+
+
+def test_play_round_surrender():
+    p = ScriptedPlayer(['surrender'], hard_threshold=0)
+
+    # Late surrender gives back half the bet, but only if the dealer has no
+    # natural
+    g = Game(GameConfig(late_surrender=True), [p])
+    stack_deck(g, Card.NUM_10, Card.NUM_10, Card.NUM_6, Card.NUM_7)
+    assert g.play_round() == [-1]
+    stack_deck(g, Card.NUM_10, Card.NUM_10, Card.NUM_6, Card.ACE)
+    assert g.play_round() == [-2]
+
+    # Early surrender is offered before the dealer checks
+    g = Game(GameConfig(early_surrender=True, late_surrender=False), [p])
+    stack_deck(g, Card.NUM_10, Card.NUM_10, Card.NUM_6, Card.ACE)
+    assert g.play_round() == [-1]
+
+    # Without either, the player must play
+    g = Game(GameConfig(early_surrender=False, late_surrender=False), [p])
+    stack_deck(g, Card.NUM_10, Card.NUM_10, Card.NUM_6, Card.NUM_7)
+    assert g.play_round() == [-2]
+
+
+def test_play_round_natural():
+    p = ScriptedPlayer(['split', 'double', 'surrender'])
+    g = Game(GameConfig(), [p])
+
+    # A natural is paid right away, and the dealer does not draw
+    stack_deck(g, Card.ACE, Card.NUM_10, Card.KING, Card.NUM_4)
+    assert g.play_round() == [3]
+    assert g.dealer_hand.total == (Hand.HARD, 14)
+
+    # Against a dealer natural it pushes
+    stack_deck(g, Card.ACE, Card.NUM_10, Card.KING, Card.ACE)
+    assert g.play_round() == [0]
+
+
+def test_play_round_hit_soft_17():
+    # Player 10 8 against dealer A 6. An S17 dealer stands on soft 17, an
+    # H17 dealer hits a 2 to soft 19.
+    for hit_soft_17, result, total in ((False, [1], (Hand.SOFT, 17)),
+                                       (True, [-1], (Hand.SOFT, 19))):
+        g = Game(GameConfig(hit_soft_17=hit_soft_17), [ThresholdPlayer()])
+        stack_deck(g, Card.NUM_10, Card.ACE, Card.NUM_8, Card.NUM_6)
+        assert g.play_round() == result
+        assert g.dealer_hand.total == total
+
+
+def test_play_round_reuse():
+    players = [ThresholdPlayer(bankroll=1000), ThresholdPlayer(bankroll=1000)]
+    g = Game(GameConfig(), players)
+    dealer_hand = g.dealer_hand
+    results = g.play_round()
+    hands = players[0]._hand_list
+    first_hand = players[0]._first_hand
+    for _ in range(50):
+        assert g.play_round() is results
+        assert g.dealer_hand is dealer_hand
+        assert g._hands[0] == [first_hand]
+        assert players[0]._hand_list is hands
+
+
+def test_play_round_seed():
+
+    def play(config, rng=None):
+        players = [ThresholdPlayer(bankroll=1000) for _ in range(3)]
+        g = Game(config, players, rng=rng)
+        history = [list(g.play_round()) for _ in range(200)]
+        return history, [p.bankroll for p in players]
+
+    # A seeded game replays exactly, from the config or from an rng
+    assert play(GameConfig(seed=11)) == play(GameConfig(seed=11))
+    assert play(GameConfig(seed=11)) != play(GameConfig(seed=12))
+    assert play(GameConfig(), rng=11) == play(GameConfig(seed=11))
+    assert play(GameConfig(), rng=random.Random(11)) == \
+        play(GameConfig(seed=11))
+    assert play(GameConfig(seed=3), rng=11) == play(GameConfig(seed=11))
+
+
+def test_run():
+    p = ThresholdPlayer(bankroll=1000)
+    g = Game(GameConfig(max_turns=30), [p])
+    assert g.run() == 30
+    assert g.run(5) == 5
+    assert g.run(0) == 0
+
+    # Stops once nobody bets
+    p = ThresholdPlayer(bankroll=3, bet=1, hard_threshold=0, soft_threshold=0)
+    g = Game(GameConfig(), [p])
+    assert g.run(10000) < 10000
+    assert p.bankroll == 0
+
+    with pytest.raises(AssertionError):
+        g.run(-1)
+    with pytest.raises(AssertionError):
+        g.run(1.5)
+
+
+def test_play_round_basic_strategy(tmp_path):
+    from blackjack.players.basic_strategy_player import BasicStrategyPlayer
+
+    # Splits, doubles and surrenders all settle against the bankroll
+    players = [BasicStrategyPlayer(bankroll=10000, cache_dir=str(tmp_path))
+               for _ in range(3)]
+    g = Game(GameConfig(num_decks=2), players)
+    for _ in range(2000):
+        before = [p.bankroll for p in players]
+        results = g.play_round()
+        for p, b, r in zip(players, before, results):
+            assert p.bankroll == pytest.approx(b + r)
+            assert not p.has_hand()
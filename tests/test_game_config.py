@@ -325,3 +325,24 @@ def test_init_params():
     GameConfig(init_hand_size=1)
     GameConfig(init_hand_size=2)
     GameConfig(init_hand_size=10)
+
+    # seed must be None or non-negative int
+    with pytest.raises(AssertionError):
+        GameConfig(seed=-1)
+    with pytest.raises(AssertionError):
+        GameConfig(seed=1.0)
+    with pytest.raises(AssertionError):
+        GameConfig(seed=True)
+    with pytest.raises(AssertionError):
+        GameConfig(seed='1')
+    GameConfig(seed=None)
+    GameConfig(seed=0)
+    GameConfig(seed=2**64)
+
+    # hit_soft_17 must be bool
+    with pytest.raises(AssertionError):
+        GameConfig(hit_soft_17=None)
+    with pytest.raises(AssertionError):
+        GameConfig(hit_soft_17=1)
+    GameConfig(hit_soft_17=False)
+    GameConfig(hit_soft_17=True)
@@ -0,0 +1,115 @@
+from blackjack.card import Card
+from blackjack.game import Game
+from blackjack.game_config import GameConfig
+from blackjack.game_log import GameLog
+from blackjack.players.threshold_player import ThresholdPlayer
+import gzip
+import pytest
+
+
+def read_records(path, compress=False):
+    """
+    Returns the header and the list of record tuples of a log file.
+    """
+    with (gzip.open(path, 'rb') if compress else open(path, 'rb')) as f:
+        data = f.read()
+    header = GameLog.header.unpack_from(data)
+    body = data[GameLog.header.size:]
+    assert len(body) % GameLog.record.size == 0
+    return header, list(GameLog.record.iter_unpack(body))
+
+
+def test_constants():
+    assert GameLog.record.size == 16
+    assert GameLog.header.size == GameLog.record.size
+    assert len(set(GameLog.events)) == len(GameLog.events)
+    assert len(set(GameLog.decisions)) == len(GameLog.decisions)
+    assert max(GameLog.events + GameLog.decisions) < 256
+
+
+def test_init_params(tmp_path):
+    path = str(tmp_path / 'game.log')
+    with pytest.raises(AssertionError):
+        GameLog(path, batch_size=0)
+    with pytest.raises(AssertionError):
+        GameLog(path, batch_size=1.5)
+    with pytest.raises(AssertionError):
+        GameLog(path, compress=1)
+    GameLog(path).close()
+
+
+@pytest.mark.parametrize('compress', [False, True])
+def test_write(tmp_path, compress):
+    path = str(tmp_path / 'game.log')
+    records = [(k, k % 8, k % 7, k % 4, k % 54, k / 2) for k in range(1000)]
+
+    with GameLog(path, batch_size=64, compress=compress) as log:
+        for r in records:
+            log.write(*r)
+            # At most one batch is ever held in memory
+            assert log._offset < 64 * GameLog.record.size
+        assert log.num_records == len(records)
+        assert not log.closed
+    assert log.closed
+
+    header, read = read_records(path, compress)
+    assert header == (GameLog.MAGIC, GameLog.VERSION, GameLog.record.size)
+    assert read == records
+
+    # Closing twice is harmless
+    log.close()
+
+
+def test_flush(tmp_path):
+    path = str(tmp_path / 'game.log')
+    log = GameLog(path, batch_size=10)
+    for k in range(15):
+        log.write(k, GameLog.BET, 1, amount=k)
+
+    # Only full batches are written until flushed
+    assert len(read_records(path)[1]) == 10
+    log.flush()
+    assert len(read_records(path)[1]) == 15
+    log.close()
+
+
+def test_game_log(tmp_path):
+    path = str(tmp_path / 'game.log')
+    players = [ThresholdPlayer(bankroll=1000) for _ in range(3)]
+    num_rounds = 200
+    with GameLog(path) as log:
+        g = Game(GameConfig(num_decks=1, seed=4), players, log=log)
+        g.run(num_rounds)
+        assert g.round_num == num_rounds
+    _, records = read_records(path)
+
+    assert records[0][:2] == (0, GameLog.SHUFFLE)
+    assert records[0][5] == 52
+    rounds = [r[0] for r in records]
+    assert rounds == sorted(rounds)
+    assert rounds[-1] == num_rounds - 1
+
+    # Bets and payouts account for every bankroll
+    for seat, p in enumerate(players, 1):
+        bet = sum(r[5] for r in records
+                  if r[1] == GameLog.BET and r[2] == seat)
+        paid = sum(r[5] for r in records
+                   if r[1] in (GameLog.PAYOUT, GameLog.INSURANCE)
+                   and r[2] == seat)
+        assert p.bankroll == 1000 - bet + paid
+
+    # Each round has one upcard and one hole card, and the dealer's cards
+    # make up their final hand
+    for n in range(num_rounds):
+        events = [r for r in records if r[0] == n]
+        assert [r[1] for r in events].count(GameLog.UPCARD) == 1
+        assert [r[1] for r in events].count(GameLog.HOLE) == 1
+        assert [r[1] for r in events].count(GameLog.PAYOUT) >= 3
+    dealer_codes = [r[4] for r in records if r[0] == num_rounds - 1 and
+                    r[2] == Game.dealer_seat and r[1] != GameLog.SHUFFLE]
+    assert [Card.cards[code] for code in dealer_codes] == g.dealer_hand.hand
+
+    # Every card dealt comes from the shoe
+    for r in records:
+        if r[1] in (GameLog.DEAL, GameLog.UPCARD, GameLog.HOLE):
+            assert not Card.cards[r[4]].is_joker()
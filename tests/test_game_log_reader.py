@@ -0,0 +1,168 @@
+import pytest
+np = pytest.importorskip('numpy')
+from blackjack.card import Card
+from blackjack.game import Game
+from blackjack.game_config import GameConfig
+from blackjack.game_log import GameLog
+from blackjack.game_log_reader import GameLogReader
+from blackjack.players.threshold_player import ThresholdPlayer
+import os
+
+
+def write_game(path, num_rounds=300, num_players=2, seed=6):
+    players = [ThresholdPlayer(bankroll=1000) for _ in range(num_players)]
+    with GameLog(path) as log:
+        Game(GameConfig(num_decks=2, seed=seed), players, log=log).run(
+            num_rounds)
+    return players
+
+
+def test_dtype():
+    assert GameLogReader.dtype.itemsize == GameLog.record.size
+    values = (7, GameLog.DEAL, 3, 1, 44, 2.5)
+    record = np.frombuffer(GameLog.record.pack(*values),
+                           dtype=GameLogReader.dtype)[0]
+    assert tuple(record.tolist()) == values
+
+
+def test_init(tmp_path):
+    path = str(tmp_path / 'game.log')
+
+    # Compressed or foreign files are refused
+    with GameLog(path, compress=True) as log:
+        log.write(0, GameLog.BET, 1, amount=1)
+    with pytest.raises(AssertionError):
+        GameLogReader(path)
+    with open(path, 'wb') as f:
+        f.write(b'not a log at all')
+    with pytest.raises(AssertionError):
+        GameLogReader(path)
+    with open(path, 'wb') as f:
+        f.write(b'')
+    with pytest.raises(AssertionError):
+        GameLogReader(path)
+
+    # An empty log has no records or rounds
+    GameLog(path).close()
+    with GameLogReader(path) as reader:
+        assert len(reader) == 0
+        assert reader.num_rounds == 0
+        assert len(reader.upcards()) == 0
+        assert len(reader.bets()) == 0
+
+
+def test_records(tmp_path):
+    path = str(tmp_path / 'game.log')
+    players = write_game(path)
+
+    with open(path, 'rb') as f:
+        data = f.read()[GameLog.header.size:]
+    expected = list(GameLog.record.iter_unpack(data))
+
+    with GameLogReader(path) as reader:
+        assert len(reader) == len(expected)
+        assert reader.num_rounds == 300
+        assert [tuple(r) for r in reader.records.tolist()] == expected
+
+        # Fields are views into the mapped file
+        rounds = reader.field('round')
+        assert rounds.base is not None
+        assert not rounds.flags.owndata
+        assert list(rounds) == [r[0] for r in expected]
+        with pytest.raises(AssertionError):
+            reader.field('bogus')
+
+        # Each round is a contiguous slice
+        for n in (0, 1, 150, 299):
+            records = reader.round(n)
+            assert not records.flags.owndata
+            assert list(records.tolist()) == \
+                [r for r in expected if r[0] == n]
+        with pytest.raises(AssertionError):
+            reader.round(300)
+        with pytest.raises(AssertionError):
+            reader.round(-1)
+
+        # Events are gathered through the index, in order
+        for event in GameLog.events:
+            positions = reader.positions(event)
+            assert not positions.flags.owndata
+            assert list(positions) == \
+                [i for i, r in enumerate(expected) if r[1] == event]
+            assert list(reader.events(event).tolist()) == \
+                [r for r in expected if r[1] == event]
+            assert list(reader.events(event, 1).tolist()) == \
+                [r for r in expected if r[1] == event and r[2] == 1]
+        with pytest.raises(AssertionError):
+            reader.positions(len(GameLog.events))
+
+        # Bets and payouts account for every bankroll
+        for seat, p in enumerate(players, 1):
+            paid = reader.payouts(seat)['amount'].sum() + \
+                reader.events(GameLog.INSURANCE, seat)['amount'].sum()
+            assert p.bankroll == 1000 - reader.bets(seat)['amount'].sum() + \
+                paid
+        assert len(reader.bets()) == 600
+
+
+def test_upcards(tmp_path):
+    path = str(tmp_path / 'game.log')
+    write_game(path)
+
+    with open(path, 'rb') as f:
+        data = f.read()[GameLog.header.size:]
+    expected = [r[4] for r in GameLog.record.iter_unpack(data)
+                if r[1] == GameLog.UPCARD]
+
+    with GameLogReader(path) as reader:
+        upcards = reader.upcards()
+        assert list(upcards) == expected
+
+        aces = reader.rounds_with_upcard(Card.ACE)
+        assert len(aces) > 0
+        assert list(aces) == [n for n, code in enumerate(expected)
+                              if Card.cards[code].rank == Card.ACE]
+        for n in aces:
+            upcard = reader.round(n)
+            upcard = upcard[upcard['event'] == GameLog.UPCARD][0]
+            assert Card.cards[upcard['value']].is_ace()
+        with pytest.raises(AssertionError):
+            reader.rounds_with_upcard(Card.HEARTS)
+
+
+def test_index(tmp_path):
+    path = str(tmp_path / 'game.log')
+    write_game(path)
+    index_path = path + GameLogReader.index_suffix
+
+    assert not os.path.exists(index_path)
+    with GameLogReader(path) as reader:
+        offsets = reader.offsets.copy()
+    assert os.path.exists(index_path)
+
+    # The persisted index is reused as is
+    with GameLogReader(path) as reader:
+        assert list(reader.offsets) == list(offsets)
+        bets = reader.bets().tolist()
+
+    # An index without the event positions is rebuilt
+    with np.load(index_path) as index:
+        old = {name: index[name] for name in
+               ('num_records', 'mtime', 'offsets', 'upcard_positions')}
+    with open(index_path, 'wb') as f:
+        np.savez(f, **old)
+    with GameLogReader(path) as reader:
+        assert reader.bets().tolist() == bets
+    with np.load(index_path) as index:
+        assert 'event_positions' in index
+
+    # A stale index is rebuilt
+    write_game(path, num_rounds=100, seed=7)
+    with GameLogReader(path) as reader:
+        assert reader.num_rounds == 100
+
+    # The index can be kept elsewhere
+    other = str(tmp_path / 'other.npz')
+    with GameLogReader(path, index_path=other) as reader:
+        assert reader.num_rounds == 100
+    assert os.path.exists(other)
@@ -1,6 +1,7 @@
-from blackjack.hand import Hand
+from blackjack.hand import Hand, HandPool
 from blackjack.card import Card
 from tests.variables import *
+import pickle
 import pytest
 
 
@@ -126,3 +127,141 @@ def test_str_and_repr():
         assert len(r) == 3 * len(handlist) + 8
         for i, s in enumerate(handlist):
             assert r[3*i+7:3*i+10] == str(s) + " "
+
+
+def test_state_table():
+
+    # The table agrees with _calc_total for every tabulated state
+    for num_aces in range(4):
+        for hard_total in range(Hand.STATE_MAX_TOTAL - num_aces + 1):
+            state = Hand.state_of(num_aces, hard_total)
+            assert Hand.state2total[state] == \
+                Hand._calc_total(num_aces, hard_total)
+
+    # Transitions add the value of the card, counting Aces as 1
+    for state in range(len(Hand.state2total)):
+        for value in range(1, 11):
+            assert Hand.transitions[state][value] // 2 == state // 2 + value
+            assert Hand.transitions[state][value] % 2 == \
+                max(state % 2, value == 1)
+
+    # Every card maps to its value
+    assert Hand.card2value[Card(Card.ACE, Card.CLUBS)] == 1
+    assert Hand.card2value[Card(Card.NUM_7, Card.HEARTS)] == 7
+    assert Hand.card2value[Card(Card.QUEEN, Card.SPADES)] == 10
+    assert len(Hand.card2value) == len(Card.ranks) * len(Card.suits)
+
+
+def test_state():
+    assert Hand().state == Hand.EMPTY_STATE
+    for handlist in handlists:
+        hand = Hand(handlist)
+        assert hand.state == Hand.state_of(*Hand._breakdown(handlist))
+        assert hand.total == Hand._calc_total(*Hand._breakdown(handlist))
+        assert (hand.num_aces, hand.hard_total) == Hand._breakdown(handlist)
+
+        # Building the hand card by card gives the same state, also past
+        # the end of the table
+        built = Hand()
+        for c in handlist:
+            built.add(c)
+        assert built.state == hand.state
+        assert built.total == hand.total
+    big = Hand(JQK5A).add(Card(Card.KING)).add(Card(Card.ACE))
+    assert big.total == (Hand.HARD, 47)
+
+
+def test_clear():
+    for handlist in handlists:
+        hand = Hand(handlist)
+        assert hand.clear() is hand
+        assert hand == Hand()
+        assert hand.state == Hand.EMPTY_STATE
+        for c in handlist:
+            hand.add(c)
+        assert hand == Hand(handlist)
+
+
+def test_explode():
+    for handlist in handlists:
+        hand = Hand(handlist)
+        hands = hand.explode()
+        assert len(hands) == len(handlist)
+        if hands:
+            assert hands[0] is hand
+        for h, c in zip(hands, handlist):
+            assert h == Hand([c])
+            assert h.hand == [c]
+
+    # New hands are taken from the pool
+    pool = HandPool()
+    pair = Hand([Card(Card.NUM_8), Card(Card.NUM_8)])
+    first, second = pair.explode(pool)
+    assert first is pair
+    assert second is pool._hands[0]
+    assert second.state == first.state
+    assert len(pool) == 1
+
+
+def test_hand_pool():
+    pool = HandPool()
+    assert len(pool) == 0
+    first = pool.get().add(Card(Card.ACE))
+    second = pool.get()
+    assert first is not second
+    assert len(pool) == 2
+
+    # Released hands are lent out again, emptied
+    pool.release()
+    assert len(pool) == 0
+    assert pool.get() is first
+    assert first == Hand()
+    assert pool.get() is second
+    third = pool.get()
+    assert third is not first and third is not second
+
+
+def test_storage():
+    for handlist in handlists:
+        hand = Hand(handlist)
+        assert not hasattr(hand, '__dict__')
+
+        # The cards are given as a new list each time
+        cards = hand.hand
+        assert cards == handlist
+        assert cards is not hand.hand
+        cards.append(Card(Card.NUM_2))
+        assert hand.hand == handlist
+        handlist_copy = list(handlist)
+        handlist.append(Card(Card.NUM_3))
+        assert hand.hand == handlist_copy
+        handlist.pop()
+
+        assert len(hand) == len(handlist)
+        assert list(hand) == handlist
+        assert hand.codes == bytes(c.code for c in handlist)
+        for k in range(-len(handlist), len(handlist)):
+            assert hand[k] is handlist[k]
+        assert hand[1:] == handlist[1:]
+        for k in (len(handlist), -len(handlist) - 1):
+            with pytest.raises(IndexError):
+                hand[k]
+
+        assert pickle.loads(pickle.dumps(hand)).hand == handlist
+
+
+def test_capacity():
+    # A hand grows past its capacity
+    aces = [Card(Card.ACE)] * (Hand.CAPACITY + 9)
+    built = Hand()
+    for c in aces:
+        built.add(c)
+    for hand in (built, Hand(aces)):
+        assert hand.hand == aces
+        assert hand.total == (Hand.HARD, len(aces))
+        assert hand.uniform_value == Card.ACE
+
+    built.clear()
+    assert len(built) == 0
+    five = Card(Card.NUM_5)
+    assert built.add(five).hand == [five]
@@ -0,0 +1,207 @@
+import os
+import pytest
+from blackjack.card import Card
+from blackjack.game import Game
+from blackjack.game_config import GameConfig
+from blackjack.hand import Hand
+from blackjack.players.basic_strategy_player import BasicStrategyPlayer
+
+B = BasicStrategyPlayer
+
+
+@pytest.fixture
+def player(tmp_path):
+    p = B(bankroll=100, bet=10, cache_dir=str(tmp_path))
+    p.sit_down(GameConfig())
+    return p
+
+
+def deal(p, upcard, *ranks):
+    p.place_bet()
+    for r in ranks:
+        p.curr_hand().add(Card(r, Card.SPADES))
+    p.observe_card(Card(upcard, Card.HEARTS), Game.dealer_seat)
+    # Later dealer cards do not replace the upcard
+    p.observe_card(Card(Card.NUM_5, Card.HEARTS), Game.dealer_seat)
+
+
+def test_init_params():
+    with pytest.raises(AssertionError):
+        B(cache_dir=3)
+    with pytest.raises(AssertionError):
+        B(bet=-1)
+    p = B(name='b', bankroll=5, bet=2)
+    assert p.cache_dir is None
+    assert p.dealer == False
+    assert p._actions is None
+
+
+def test_table_cache(tmp_path, monkeypatch):
+    config = GameConfig(num_decks=2)
+    key = B.rule_key(config)
+
+    # The table is solved at most once per session; the checks below run on
+    # an empty memory cache and count the builds instead of repeating them
+    table = B.load_table(config)
+    builds = []
+
+    def build_table(cls, game_config):
+        builds.append(game_config)
+        return table
+    monkeypatch.setattr(B, 'build_table', classmethod(build_table))
+    monkeypatch.setattr(B, '_tables', {})
+
+    # The table is built and written to disk on first use
+    p = B(cache_dir=str(tmp_path))
+    p.sit_down(config)
+    assert builds == [config]
+    files = os.listdir(tmp_path)
+    assert len(files) == 1
+    width = config.blackjack_value + 1
+    assert len(p._actions) == len(p._fallbacks) == \
+        B.NUM_KINDS * width * 10
+    assert set(p._actions) <= {B.STAND, B.HIT, B.DOUBLE, B.SPLIT,
+                               B.SURRENDER}
+    assert set(p._fallbacks) <= {B.STAND, B.HIT}
+
+    # Later loads come from memory, or from disk in a fresh process
+    assert B.load_table(config, str(tmp_path)) is B._tables[key]
+    B._tables.pop(key)
+    assert B.load_table(config, str(tmp_path)) == (p._actions, p._fallbacks)
+    assert builds == [config]
+
+    # A damaged file is rebuilt
+    B._tables.pop(key)
+    path = os.path.join(tmp_path, files[0])
+    with open(path, 'wb') as f:
+        f.write(b'\x00')
+    assert B.load_table(config, str(tmp_path)) == (p._actions, p._fallbacks)
+    assert os.path.getsize(path) == 2 * len(p._actions)
+    assert builds == [config] * 2
+
+    # Without a cache directory, the table is only kept in memory
+    B._tables.pop(key)
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv('HOME', str(tmp_path / 'home'))
+    q = B()
+    q.sit_down(config)
+    assert (q._actions, q._fallbacks) == (p._actions, p._fallbacks)
+    assert B._tables[key] == (q._actions, q._fallbacks)
+    assert os.listdir(tmp_path) == files
+    assert builds == [config] * 3
+
+    # Configs with the same relevant rules share a table
+    assert B.rule_key(GameConfig(num_decks=2, min_bet=5)) == key
+    assert B.rule_key(GameConfig(num_decks=6)) != key
+
+
+def test_table_entries(tmp_path):
+    actions, fallbacks = B.load_table(GameConfig(), str(tmp_path))
+
+    def action(kind, total, up):
+        return actions[B.table_index(kind, total, up, 22)]
+
+    assert action(B.HARD, 11, 6) == B.DOUBLE
+    assert action(B.HARD, 16, 10) == B.SURRENDER
+    assert action(B.HARD, 12, 4) == B.STAND
+    assert action(B.HARD, 12, 2) == B.HIT
+    assert action(B.HARD, 20, 1) == B.STAND
+    assert action(B.SOFT, 18, 9) == B.HIT
+    assert action(B.SOFT, 18, 7) == B.STAND
+    assert action(B.PAIR, 8, 10) == B.SPLIT
+    assert action(B.PAIR, 1, 6) == B.SPLIT
+    assert action(B.PAIR, 10, 6) == B.STAND
+    assert action(B.PAIR, 5, 6) == B.DOUBLE
+    assert fallbacks[B.table_index(B.HARD, 16, 10, 22)] == B.HIT
+    assert fallbacks[B.table_index(B.SOFT, 18, 4, 22)] == B.STAND
+
+
+def test_decisions(player):
+    p = player
+
+    # Invalid calls
+    fresh = B()
+    for f in (fresh.decide_hit, fresh.decide_double, fresh.decide_split,
+              fresh.decide_surrender):
+        with pytest.raises(AssertionError):
+            f()
+
+    # A hand missing from the tables is an error
+    deal(p, Card.KING, Card.NUM_10, Card.NUM_6)
+    actions = p._actions
+    p._actions = actions[:10]
+    with pytest.raises(AssertionError):
+        p.decide_hit()
+    p._actions = actions
+    p.final_payout([5])
+
+    # Surrender 16 against a 10
+    deal(p, Card.KING, Card.NUM_10, Card.NUM_6)
+    assert p._upcard == 10
+    assert p.decide_surrender() == True
+    p.final_payout([5])
+
+    # The upcard is the first dealer card of a batch, too
+    p.place_bet()
+    p.observe_cards([(Card(Card.NUM_9, Card.HEARTS), 1),
+                     (Card(Card.NUM_4, Card.HEARTS), Game.dealer_seat),
+                     (Card(Card.ACE, Card.HEARTS), Game.dealer_seat)])
+    assert p._upcard == 4
+    p.observe_cards([(Card(Card.NUM_7, Card.HEARTS), Game.dealer_seat)])
+    assert p._upcard == 4
+    p.final_payout([0])
+
+    # Double 11 against a 6, paying the extra bet
+    deal(p, Card.NUM_6, Card.NUM_5, Card.NUM_6)
+    assert p.decide_surrender() == False
+    assert p.decide_split() == False
+    bankroll = p.bankroll
+    assert p.decide_double() == True
+    assert p.bankroll == bankroll - 10
+    p.final_payout([0])
+
+    # A three-card 11 can no longer double, so it hits
+    deal(p, Card.NUM_6, Card.NUM_5, Card.NUM_4, Card.NUM_2)
+    assert p.decide_double() == False
+    assert p.decide_hit() == True
+    p.final_payout([0])
+
+    # Stand on 12 against a 4
+    deal(p, Card.NUM_4, Card.NUM_10, Card.NUM_2)
+    assert p.decide_hit() == False
+    p.final_payout([0])
+
+    # Split 8s against a 6 into two one-card hands
+    deal(p, Card.NUM_6, Card.NUM_8, Card.NUM_8)
+    bankroll = p.bankroll
+    assert p.decide_split() == True
+    assert p.bankroll == bankroll - 10
+    assert len(p._hands) == 2
+    assert p.curr_hand() == Hand([Card(Card.NUM_8, Card.SPADES)])
+    p.curr_hand().add(Card(Card.NUM_3, Card.CLUBS))
+    assert p.decide_double() == True
+    p.next_hand()
+    assert p.curr_hand() == Hand([Card(Card.NUM_8, Card.SPADES)])
+    p.final_payout([0, 0])
+
+    # No more splits than max_hands allows, and no bets beyond the bankroll
+    p.sit_down(GameConfig(max_hands=1))
+    deal(p, Card.NUM_6, Card.NUM_8, Card.NUM_8)
+    assert p.decide_split() == False
+    assert p.decide_hit() == False
+    p.final_payout([0])
+
+    poor = B(bankroll=10, bet=10, cache_dir=p.cache_dir)
+    poor.sit_down(GameConfig())
+    deal(poor, Card.NUM_6, Card.NUM_5, Card.NUM_6)
+    assert poor.decide_double() == False
+    assert poor.decide_hit() == True
+    assert poor.decide_insurance() == False
+
+
+def test_game(player):
+    g = Game(GameConfig(), [player])
+    for _ in range(200):
+        before = player.bankroll
+        g.play_round()
+        assert player.bankroll == before + g.results[0]
@@ -0,0 +1,176 @@
+import pytest
+from blackjack.card import Card
+from blackjack.counting import CardCounter
+from blackjack.game import Game
+from blackjack.game_config import GameConfig
+from blackjack.players.basic_strategy_player import BasicStrategyPlayer
+from blackjack.players.counting_player import CountingPlayer
+
+B = BasicStrategyPlayer
+
+
+@pytest.fixture
+def player(tmp_path):
+    p = CountingPlayer(bankroll=1000, ramp=(10, 10, 20, 40),
+                       deviations=CountingPlayer.illustrious_18,
+                       insurance_index=CountingPlayer.illustrious_insurance,
+                       cache_dir=str(tmp_path))
+    p.sit_down(GameConfig())
+    return p
+
+
+def set_count(p, true_count):
+    """
+    Makes the true count of the player's fresh shoe true_count.
+    """
+    p.counter.reset()
+    p.counter.running_count = true_count * p.counter.num_decks
+
+
+def deal(p, upcard, *ranks):
+    p.place_bet()
+    for r in ranks:
+        p.curr_hand().add(Card(r, Card.SPADES))
+    p.observe_card(Card(upcard, Card.HEARTS), Game.dealer_seat)
+
+
+def test_init_params():
+    with pytest.raises(AssertionError):
+        CountingPlayer(ramp=())
+    with pytest.raises(AssertionError):
+        CountingPlayer(ramp=3)
+    with pytest.raises(AssertionError):
+        CountingPlayer(ramp=(1, -1))
+    with pytest.raises(AssertionError):
+        CountingPlayer(ramp=(1, True))
+    with pytest.raises(AssertionError):
+        CountingPlayer(system='Red Seven')
+    with pytest.raises(AssertionError):
+        CountingPlayer(insurance_index='3')
+    with pytest.raises(AssertionError):
+        CountingPlayer(deviations={(B.HARD, 16, 10): (0, 'Stand', True)})
+    with pytest.raises(AssertionError):
+        CountingPlayer(deviations={(B.HARD, 16, 11): (0, B.STAND, True)})
+    with pytest.raises(AssertionError):
+        CountingPlayer(deviations={(5, 16, 10): (0, B.STAND, True)})
+    with pytest.raises(AssertionError):
+        CountingPlayer(deviations={(B.HARD, 16, 10): ('0', B.STAND, True)})
+    with pytest.raises(AssertionError):
+        CountingPlayer(deviations={(B.HARD, 16, 10): (0, B.STAND)})
+    with pytest.raises(AssertionError):
+        CountingPlayer(deviations=[1, 2])
+
+    p = CountingPlayer(ramp=[1, 2], system=CardCounter.ZEN)
+    assert p.ramp == (1, 2)
+    assert p.counter.system == CardCounter.ZEN
+    assert p.deviations == {}
+    assert p.insurance_index is None
+
+
+def test_bet_ramp(player):
+    p = player
+    for true_count, bet in ((-5, 10), (0, 10), (1, 10), (1.9, 10), (2, 20),
+                            (3, 40), (30, 40)):
+        set_count(p, true_count)
+        before = p.bankroll
+        assert p.place_bet() == bet
+        assert p.bankroll == before - bet
+        p.final_payout([bet])
+
+    # Bets still respect the table limits, int_bet_only and the bankroll
+    p.sit_down(GameConfig(max_bet=25))
+    set_count(p, 3)
+    assert p.place_bet() == 25
+    p.final_payout([0])
+
+    p = CountingPlayer(bankroll=30, ramp=(1.5, 2.5, 100),
+                       cache_dir=p.cache_dir)
+    p.sit_down(GameConfig())
+    set_count(p, 0)
+    assert p.place_bet() == 1
+    p.final_payout([1])
+    set_count(p, 2)
+    assert p.place_bet() == 30
+    p.final_payout([30])
+    p.sit_down(GameConfig(int_bet_only=False))
+    set_count(p, 1)
+    assert p.place_bet() == 2.5
+
+
+def test_deviations(player):
+    p = player
+
+    # 16 against a 10: basic strategy surrenders, but stands from 0 up
+    deal(p, Card.KING, Card.NUM_10, Card.NUM_6)
+    set_count(p, -1)
+    assert p.decide_surrender() == True
+    assert p.decide_hit() == True
+    set_count(p, 0)
+    assert p.decide_surrender() == False
+    assert p.decide_hit() == False
+    p.final_payout([0])
+
+    # 12 against a 4: basic strategy stands, but hits below 0
+    deal(p, Card.NUM_4, Card.NUM_10, Card.NUM_2)
+    set_count(p, 0)
+    assert p.decide_hit() == False
+    set_count(p, -0.5)
+    assert p.decide_hit() == True
+    p.final_payout([0])
+
+    # Split tens against a 6 from 4 up
+    deal(p, Card.NUM_6, Card.NUM_10, Card.NUM_10)
+    set_count(p, 3)
+    assert p.decide_split() == False
+    set_count(p, 4)
+    assert p.decide_split() == True
+    p.final_payout([0, 0])
+
+    # 10 against a 10 doubles from 4 up, and only hits with three cards
+    deal(p, Card.KING, Card.NUM_6, Card.NUM_4)
+    set_count(p, 3)
+    assert p.decide_double() == False
+    set_count(p, 4)
+    assert p.decide_double() == True
+    p.final_payout([0])
+    deal(p, Card.KING, Card.NUM_2, Card.NUM_4, Card.NUM_4)
+    assert p.decide_double() == False
+    assert p.decide_hit() == True
+    p.final_payout([0])
+
+    # Without deviations, basic strategy is played at any count
+    plain = CountingPlayer(cache_dir=p.cache_dir)
+    plain.sit_down(GameConfig())
+    deal(plain, Card.KING, Card.NUM_10, Card.NUM_6)
+    set_count(plain, 10)
+    assert plain.decide_surrender() == True
+
+
+def test_insurance(player):
+    p = player
+    deal(p, Card.ACE, Card.NUM_10, Card.NUM_7)
+    set_count(p, 2)
+    assert p.decide_insurance() == False
+    set_count(p, 3)
+    before = p.bankroll
+    assert p.decide_insurance() == True
+    assert p.bankroll == before - 5
+    p.final_payout([0])
+
+    # Never without an insurance index
+    plain = CountingPlayer(cache_dir=p.cache_dir)
+    plain.sit_down(GameConfig())
+    deal(plain, Card.ACE, Card.NUM_10, Card.NUM_7)
+    set_count(plain, 10)
+    assert plain.decide_insurance() == False
+
+
+def test_game(player):
+    g = Game(GameConfig(num_decks=2, seed=9), [player])
+    bets = set()
+    for _ in range(1000):
+        before = player.bankroll
+        g.play_round()
+        bets.add(player._round_bet)
+        assert player.bankroll == pytest.approx(before + g.results[0])
+    assert bets == {10, 20, 40}
@@ -1,5 +1,6 @@
 import pytest
 from blackjack.card import Card
+from blackjack.counting import CardCounter
 from blackjack.deck import Deck
 from blackjack.game_config import GameConfig
 from blackjack.hand import Hand
@@ -203,6 +204,54 @@ def test_observe_card():
     t.observe_card(c, 0)
 
 
+def test_observe_cards():
+    t = ThresholdPlayer()
+    c = Card()
+    with pytest.raises(AssertionError):
+        t.observe_cards([(c, 1)])
+
+    t.sit_down(GameConfig())
+    for cards in ([(None, 1)], [(c, -1)], [(c, 1), (c, True)]):
+        with pytest.raises(AssertionError):
+            t.observe_cards(cards)
+    t.observe_cards([])
+    t.observe_cards([(c, 1), (c, 0)])
+
+
+def test_counter():
+
+    # counter must be a CardCounter
+    def invalid_counter(counter):
+        with pytest.raises(AssertionError):
+            ThresholdPlayer(counter=counter)
+    parametrize_test([True, 'Hi-Lo', CardCounter], invalid_counter)
+
+    counter = CardCounter(CardCounter.HI_LO)
+    t = ThresholdPlayer(counter=counter)
+    assert t.counter is counter
+
+    # Sitting down sizes the counter to the shoe
+    t.sit_down(GameConfig(num_decks=6))
+    assert counter.num_decks == 6
+    assert counter.cards_remaining == 6 * 52
+
+    # Every observed card is counted, until the shoe is reshuffled
+    t.observe_card(Card(Card.NUM_5), 1)
+    t.observe_card(Card(Card.KING), 0)
+    t.observe_card(Card(Card.NUM_2), 2)
+    assert counter.running_count == 1
+    assert counter.cards_seen == 3
+    t.observe_cards([(Card(Card.ACE), 0), (Card(Card.NUM_6), 1)])
+    assert counter.running_count == 1
+    assert counter.cards_seen == 5
+    t.observe_shuffle()
+    assert counter.running_count == 0
+    assert counter.cards_seen == 0
+
+    # Without a counter, shuffles are ignored
+    ThresholdPlayer().observe_shuffle()
+
+
 def test_has_hand():
 
     # Test Normal Game Loop
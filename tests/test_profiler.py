@@ -0,0 +1,120 @@
+from blackjack.game import Game
+from blackjack.game_config import GameConfig
+from blackjack.players.threshold_player import ThresholdPlayer
+from blackjack.profiler import GameProfiler, TimedPlayer
+import json
+import pstats
+import pytest
+
+
+class Clock:
+    """
+    Advances by one second every time it is read.
+    """
+
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        self.now += 1
+        return self.now
+
+
+def play(profiler, num_rounds=200, seed=3):
+    players = [ThresholdPlayer(bankroll=1000) for _ in range(2)]
+    g = Game(GameConfig(num_decks=1, seed=seed), players, profiler=profiler)
+    results = [list(g.play_round()) for _ in range(num_rounds)]
+    return g, players, results
+
+
+def test_add():
+    prof = GameProfiler()
+    prof.add(GameProfiler.DEAL, 0.5)
+    prof.add(GameProfiler.DEAL, 0.25)
+    prof.add('ThresholdPlayer.decide_hit', 1)
+    assert prof.to_dict() == {
+        GameProfiler.DEAL: {'calls': 2, 'seconds': 0.75},
+        'ThresholdPlayer.decide_hit': {'calls': 1, 'seconds': 1},
+    }
+    prof.reset()
+    assert prof.to_dict() == {}
+
+
+def test_wrap():
+    prof = GameProfiler(clock=Clock())
+    timed = prof.wrap('abs', abs)
+    assert timed(-3) == 3
+    assert prof.stats == {'abs': [1, 1]}
+
+    def fail():
+        raise ValueError()
+
+    # Calls are recorded even when they raise
+    timed = prof.wrap('fail', fail)
+    with pytest.raises(ValueError):
+        timed()
+    assert prof.stats['fail'] == [1, 1]
+
+    p = ThresholdPlayer(name='p')
+    timed = prof.wrap_player(p)
+    assert isinstance(timed, TimedPlayer)
+    assert timed.player is p
+    assert timed.name == 'p'
+    assert timed.has_hand() == False
+    assert 'ThresholdPlayer.has_hand' not in prof.stats
+    assert timed.curr_hand() is None
+    assert prof.stats['ThresholdPlayer.curr_hand'] == [1, 1]
+
+
+def test_game():
+    prof = GameProfiler()
+    g, players, results = play(prof)
+    assert g.players == players
+
+    # Profiling does not change the game
+    _, plain_players, plain_results = play(None)
+    assert results == plain_results
+    assert [p.bankroll for p in players] == \
+        [p.bankroll for p in plain_players]
+
+    stats = prof.to_dict()
+    for phase in GameProfiler.phases:
+        assert stats[phase]['calls'] > 0
+    assert stats[GameProfiler.ROUND]['calls'] == 200
+    # Each player bets every round, and is paid for every bet
+    assert stats['ThresholdPlayer.place_bet']['calls'] == 400
+    assert stats[GameProfiler.PAYOUT]['calls'] == 400
+    assert stats['ThresholdPlayer.final_payout']['calls'] == 400
+    assert stats['ThresholdPlayer.observe_shuffle']['calls'] == \
+        2 * stats[GameProfiler.SHUFFLE]['calls']
+    # Cards are observed in batches, at least one per player and round
+    assert 'ThresholdPlayer.observe_card' not in stats
+    assert stats['ThresholdPlayer.observe_cards']['calls'] >= 400
+    for name, entry in stats.items():
+        assert 0 <= entry['seconds'] <= stats[GameProfiler.ROUND]['seconds']
+
+
+def test_export(tmp_path):
+    prof = GameProfiler()
+    play(prof, num_rounds=20)
+
+    path = str(tmp_path / 'profile.json')
+    prof.dump_json(path)
+    with open(path) as f:
+        assert json.load(f) == prof.to_dict()
+
+    path = str(tmp_path / 'profile.prof')
+    prof.dump_stats(path)
+    stats = pstats.Stats(path).stats
+    assert len(stats) == len(prof.stats)
+    deal = stats[(GameProfiler.phase_file, 0, GameProfiler.DEAL)]
+    assert deal[1] == prof.stats[GameProfiler.DEAL][0]
+    assert deal[3] == pytest.approx(prof.stats[GameProfiler.DEAL][1])
+    # Player methods are reported at their definition
+    hit = [key for key in stats if key[2] == 'ThresholdPlayer.decide_hit']
+    assert len(hit) == 1
+    assert hit[0][0].endswith('threshold_player.py')
+
+    report = prof.report().splitlines()
+    assert len(report) == len(prof.stats) + 1
+    assert report[1].startswith(GameProfiler.ROUND)
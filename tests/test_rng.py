@@ -0,0 +1,38 @@
+from blackjack.rng import make_rng, child_seed, spawn
+import pytest
+import random
+
+
+def test_make_rng():
+    rng = random.Random(1)
+    assert make_rng(rng) is rng
+    assert make_rng(4).random() == random.Random(4).random()
+    assert isinstance(make_rng(), random.Random)
+    assert make_rng().random() != make_rng().random()
+
+    with pytest.raises(AssertionError):
+        make_rng(-1)
+    with pytest.raises(AssertionError):
+        make_rng(1.5)
+    with pytest.raises(AssertionError):
+        make_rng('1')
+
+
+def test_child_seed():
+    assert child_seed(5, 0) == child_seed(5, 0)
+    seeds = {child_seed(5, k) for k in range(100)}
+    assert len(seeds) == 100
+    assert child_seed(5, 0) != child_seed(6, 0)
+
+
+def test_spawn():
+    children = spawn(random.Random(9), 4)
+    assert len(children) == 4
+    draws = [c.random() for c in children]
+    assert len(set(draws)) == 4
+
+    # Spawning only depends on the parent's state, and advances it
+    assert draws == [c.random() for c in spawn(random.Random(9), 4)]
+    parent = random.Random(9)
+    assert spawn(parent, 1)[0].random() != spawn(parent, 1)[0].random()
+    assert spawn(parent, 0) == []
@@ -0,0 +1,121 @@
+import pytest
+from blackjack import simulate as simulate_module
+from blackjack.game_config import GameConfig
+from blackjack.players.threshold_player import ThresholdPlayer
+from blackjack.simulate import PlayerResult, simulate
+import random
+import statistics
+
+
+def test_player_result():
+    r = PlayerResult('a', bankroll=10)
+    assert r.ev == 0
+    assert r.ev_per_wager == 0
+    r.merge(PlayerResult('a', rounds=2, wagered=4, net=-2))
+    r.merge(PlayerResult('a', rounds=2, wagered=4, net=1))
+    assert r.rounds == 4
+    assert r.wagered == 8
+    assert r.net == -1
+    assert r.final_bankroll == 9
+    assert r.ev == -0.25
+    assert r.ev_per_wager == -0.125
+    with pytest.raises(AssertionError):
+        r.merge(3)
+
+
+def test_player_result_variance():
+    rng = random.Random(0)
+    nets = [rng.choice((-2, -1, 0, 1, 1.5, 2)) for _ in range(500)]
+    r = PlayerResult()
+    assert r.variance == 0
+    assert r.std_error == 0
+    r.add(1, nets[0])
+    assert r.variance == 0
+
+    for net in nets[1:]:
+        r.add(1, net)
+    assert r.rounds == 500
+    assert r.ev == pytest.approx(statistics.mean(nets))
+    assert r.variance == pytest.approx(statistics.variance(nets))
+    assert r.std_error == pytest.approx(
+        statistics.stdev(nets) / 500 ** 0.5)
+    assert r.half_width() == pytest.approx(1.959964 * r.std_error)
+    assert r.half_width(0.5) < r.half_width(0.99)
+    with pytest.raises(AssertionError):
+        r.half_width(1)
+
+    # Merged samples have the variance of all their rounds
+    parts = [PlayerResult(), PlayerResult(), PlayerResult()]
+    for k, net in enumerate(nets[:300]):
+        parts[0 if k < 10 else 1].add(1, net)
+    merged = PlayerResult()
+    for part in parts:
+        merged.merge(part)
+    assert merged.rounds == 300
+    assert merged.variance == pytest.approx(statistics.variance(nets[:300]))
+
+
+def test_simulate_params():
+    config = GameConfig()
+    players = [ThresholdPlayer()]
+    with pytest.raises(AssertionError):
+        simulate(config, players, -1)
+    with pytest.raises(AssertionError):
+        simulate(config, players, 10, workers=0)
+    with pytest.raises(AssertionError):
+        simulate(config, players, 10, shards=0)
+    with pytest.raises(AssertionError):
+        simulate(config, players, 10, target=0)
+    with pytest.raises(AssertionError):
+        simulate(config, players, 10, target=0.1, confidence=1)
+
+
+def test_simulate():
+    config = GameConfig(num_decks=2)
+    players = [ThresholdPlayer(name='low', bankroll=100, hard_threshold=12),
+               ThresholdPlayer(name='high', bankroll=100, hard_threshold=17)]
+
+    results = simulate(config, players, 1001, workers=1, shards=3, seed=5)
+    assert [r.name for r in results] == ['low', 'high']
+    for r in results:
+        assert r.rounds == 1001
+        assert r.wagered == 1001
+        assert r.final_bankroll == 100 + r.net
+        assert -1 < r.ev < 1
+
+    # The players passed in are left alone
+    assert players[0].bankroll == 100
+    assert players[0]._hands is None
+
+    # Results only depend on the seed and the sharding
+    again = simulate(config, players, 1001, workers=1, shards=3, seed=5)
+    assert [r.net for r in again] == [r.net for r in results]
+    pooled = simulate(config, players, 1001, workers=2, shards=3, seed=5)
+    assert [r.net for r in pooled] == [r.net for r in results]
+
+
+def test_simulate_target(monkeypatch):
+    monkeypatch.setattr(simulate_module, 'check_every', 100)
+    config = GameConfig(num_decks=2)
+    players = [ThresholdPlayer(name='a', hard_threshold=12),
+               ThresholdPlayer(name='b', hard_threshold=17)]
+
+    # Stops once every player's interval is narrow enough
+    results = simulate(config, players, 100000, workers=1, shards=2, seed=3,
+                       target=0.1)
+    assert results[0].rounds == results[1].rounds
+    assert results[0].rounds % 200 == 0
+    assert results[0].rounds < 2000
+    assert all(r.half_width() <= 0.1 * 1.05 for r in results)
+    assert any(r.half_width() > 0.08 for r in results)
+
+    # A narrower interval takes more rounds
+    tight = simulate(config, players, 100000, workers=1, shards=2, seed=3,
+                     target=0.05)
+    assert tight[0].rounds > 3 * results[0].rounds
+    assert all(r.half_width(0.95) <= 0.05 * 1.05 for r in tight)
+
+    # or stops at rounds
+    capped = simulate(config, players, 300, workers=1, shards=2, seed=3,
+                      target=0.001)
+    assert capped[0].rounds == 300
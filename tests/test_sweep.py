@@ -0,0 +1,103 @@
+import pytest
+from blackjack import sweep as sweep_module
+from blackjack.sweep import format_table, grid, load_checkpoint, sweep
+import json
+
+config_grid = {'num_decks': [1, 2], 'blackjack_pay': [1.5, 1.2]}
+player_grid = {'hard_threshold': [12, 17]}
+
+
+def test_grid():
+    assert grid({}) == [{}]
+    assert grid({'a': [1, 2], 'b': [3]}) == [{'a': 1, 'b': 3},
+                                             {'a': 2, 'b': 3}]
+    assert grid({'a': [1, 2], 'b': [3, 4]})[1] == {'a': 1, 'b': 4}
+    with pytest.raises(AssertionError):
+        grid([1, 2])
+    with pytest.raises(AssertionError):
+        grid({'a': []})
+    with pytest.raises(AssertionError):
+        grid({'a': (1, 2)})
+
+
+def test_sweep():
+    with pytest.raises(AssertionError):
+        sweep(config_grid, player_grid, -1)
+    with pytest.raises(AssertionError):
+        sweep(config_grid, player_grid, 10, workers=0)
+    with pytest.raises(AssertionError):
+        sweep({'min_bet': [0]}, {'min_bet': [1]}, 10)
+
+    rows = sweep(config_grid, player_grid, 200, workers=1, seed=1)
+    assert len(rows) == 8
+    assert [(r['num_decks'], r['blackjack_pay'], r['hard_threshold'])
+            for r in rows[:3]] == [(1, 1.5, 12), (1, 1.5, 17), (1, 1.2, 12)]
+    for r in rows:
+        assert r['rounds'] == 200
+        assert r['wagered'] == 200
+        assert r['ev'] == r['net'] / 200
+
+    # Cells do not depend on the workers, nor on the grid around them
+    assert sweep(config_grid, player_grid, 200, workers=2, seed=1) == rows
+    assert sweep({'num_decks': [2], 'blackjack_pay': [1.2]},
+                 {'hard_threshold': [17]}, 200, workers=1, seed=1) == \
+        [rows[-1]]
+
+    assert sweep({}, {}, 50, workers=1, seed=1)[0]['rounds'] == 50
+
+    # With a target, each cell stops once its interval is narrow enough
+    rows = sweep({'num_decks': [1]}, {'hard_threshold': [12, 21]}, 100000,
+                 workers=1, seed=1, target=0.1)
+    for r in rows:
+        assert r['rounds'] < 100000
+        assert 1.96 * r['std_error'] <= 0.1
+
+
+def test_checkpoint(tmp_path, monkeypatch):
+    path = str(tmp_path / 'sweep.jsonl')
+    assert load_checkpoint(path) == {}
+
+    rows = sweep(config_grid, player_grid, 100, checkpoint=path, workers=1,
+                 seed=2)
+    with open(path) as f:
+        lines = f.readlines()
+    assert len(lines) == 8
+    assert [json.loads(line)['row'] for line in lines] == rows
+
+    # Interrupt the sweep after 3 cells, mid-way through writing the 4th
+    with open(path, 'w') as f:
+        f.writelines(lines[:3])
+        f.write(lines[3][:20])
+    assert len(load_checkpoint(path)) == 3
+
+    calls = []
+    run_cell = sweep_module._run_cell
+
+    def counted(*args):
+        calls.append(args)
+        return run_cell(*args)
+
+    monkeypatch.setattr(sweep_module, '_run_cell', counted)
+    assert sweep(config_grid, player_grid, 100, checkpoint=path, workers=1,
+                 seed=2) == rows
+    assert len(calls) == 5
+    assert len(load_checkpoint(path)) == 8
+
+    # Nothing is left to run, and other round counts are other cells
+    calls.clear()
+    sweep(config_grid, player_grid, 100, checkpoint=path, workers=1)
+    assert calls == []
+    sweep(config_grid, {'hard_threshold': [12]}, 50, checkpoint=path,
+          workers=1)
+    assert len(calls) == 4
+
+
+def test_format_table():
+    assert format_table([]) == ''
+    rows = [{'name': 'a', 'rounds': 10, 'ev': -0.5},
+            {'name': 'bbbbbb', 'rounds': 1000, 'ev': 0.25}]
+    lines = format_table(rows).splitlines()
+    assert len(lines) == 3
+    assert lines[0].split() == ['name', 'rounds', 'ev']
+    assert lines[2].split() == ['bbbbbb', '1000', '0.25000']
+    assert len(set(map(len, lines))) == 1
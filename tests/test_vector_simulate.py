@@ -0,0 +1,104 @@
+import pytest
+np = pytest.importorskip('numpy')
+from blackjack.card import Card
+from blackjack.game import Game
+from blackjack.game_config import GameConfig
+from blackjack.players.threshold_player import ThresholdPlayer
+from blackjack.simulate import simulate
+from blackjack.vector_simulate import play_shoes, shuffled_shoes, \
+    simulate_threshold
+
+
+def play_game(config, shoe, **kwargs):
+    """
+    Plays one shoe, dealt in the order of shoe, in Game until its cut comes
+    up, and returns the number of rounds, amount wagered, net result and
+    sum of squared net results.
+    """
+    p = ThresholdPlayer(**kwargs)
+    g = Game(config, [p])
+    shoe_size = len(g.deck)
+    # Deal the spare cards after the shoe, with the cut in the same place
+    g.deck.deck = [Card.cards[code] for code in reversed(shoe.tolist())]
+    g.deck.set_cut(len(g.deck) - shoe_size + g.deck.cut)
+    rounds = wagered = net = squares = 0
+    while not g.reshuffle_due:
+        result = g.play_round()[0]
+        net += result
+        squares += result * result
+        wagered += g.wagers[0]
+        rounds += 1
+    return rounds, wagered, net, squares
+
+
+def test_shuffled_shoes():
+    rng = np.random.default_rng(0)
+    shoes = shuffled_shoes(2, 5, rng)
+    assert shoes.shape == (5, 3 * 52)
+    for shoe in shoes:
+        assert sorted(shoe[:104].tolist()) == sorted(list(range(52)) * 2)
+        assert len(set(shoe[104:].tolist())) > 13
+    assert len(shuffled_shoes(1, 0, rng)) == 0
+    with pytest.raises(AssertionError):
+        shuffled_shoes(0, 5, rng)
+
+
+def test_params():
+    config = GameConfig(num_decks=1)
+    shoes = shuffled_shoes(1, 2, np.random.default_rng(0))
+    with pytest.raises(AssertionError):
+        simulate_threshold(config, -1)
+    with pytest.raises(AssertionError):
+        play_shoes(config, shoes, hard_threshold=-1)
+    with pytest.raises(AssertionError):
+        play_shoes(config, shoes, soft_threshold=True)
+    with pytest.raises(AssertionError):
+        play_shoes(config, shoes, bet='1')
+    with pytest.raises(AssertionError):
+        play_shoes(config, shoes[:, :60])
+    with pytest.raises(AssertionError):
+        play_shoes(GameConfig(num_decks=1, init_hand_size=3), shoes)
+
+    # Without a bet, nobody plays
+    rounds, wagered, net, squares = play_shoes(config, shoes, bet=0)
+    assert rounds.tolist() == [0, 0]
+    assert squares.tolist() == [0, 0]
+
+
+@pytest.mark.parametrize('thresholds', [(17, 17), (12, 18), (0, 0),
+                                        (21, 21)])
+@pytest.mark.parametrize('reshuffle_threshold', [0.25, 0.5, 1])
+@pytest.mark.parametrize('hit_soft_17', [False, True])
+def test_same_as_game(thresholds, reshuffle_threshold, hit_soft_17):
+    hard, soft = thresholds
+    config = GameConfig(num_decks=1, reshuffle_threshold=reshuffle_threshold,
+                        blackjack_pay=6 / 5, hit_soft_17=hit_soft_17)
+    shoes = shuffled_shoes(1, 40, np.random.default_rng(hard * 100 + soft))
+    rounds, wagered, net, squares = play_shoes(config, shoes, hard, soft,
+                                               bet=2)
+    for s, shoe in enumerate(shoes):
+        expected = play_game(config, shoe, hard_threshold=hard,
+                             soft_threshold=soft, bet=2)
+        assert (rounds[s], wagered[s]) == expected[:2]
+        assert net[s] == pytest.approx(expected[2])
+        assert squares[s] == pytest.approx(expected[3])
+
+
+def test_simulate_threshold():
+    config = GameConfig(num_decks=2, seed=3)
+    result = simulate_threshold(config, 2000, hard_threshold=15, name='p')
+    assert result.name == 'p'
+    assert result.rounds > 2000
+    assert result.wagered == result.rounds
+    # Seeded from the config
+    assert simulate_threshold(config, 2000, hard_threshold=15).net == \
+        result.net
+
+    # Same statistics as the object engine
+    engine = simulate(config, [ThresholdPlayer(hard_threshold=15)],
+                      result.rounds, workers=1, seed=4)[0]
+    error = 4 * 1.2 / np.sqrt(result.rounds)
+    assert result.ev == pytest.approx(engine.ev, abs=error)
+    assert result.std_error > 0
+    assert result.variance == pytest.approx(engine.variance, rel=0.1)
+    assert result.half_width() == pytest.approx(engine.half_width(), rel=0.1)